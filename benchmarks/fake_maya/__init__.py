@@ -0,0 +1,40 @@
+# In-memory stand-in for maya.cmds and maya.api that records every call
+import sys
+import types
+
+from .scene import scene, recorder
+
+
+def install():
+    # Register the fake modules under their real Maya names
+    from . import cmds, open_maya, open_maya_anim
+
+    maya = types.ModuleType('maya')
+    maya.__path__ = []
+    api = types.ModuleType('maya.api')
+    api.__path__ = []
+    utils = types.ModuleType('maya.utils')
+    utils.executeDeferred = lambda function, *args: function(*args)
+    utils.executeInMainThreadWithResult = lambda function, *args: function(*args)
+    utils.processIdleEvents = lambda: None
+    standalone = types.ModuleType('maya.standalone')
+    standalone.initialize = lambda name='python': None
+    standalone.uninitialize = lambda: None
+
+    maya.cmds = cmds
+    maya.api = api
+    maya.utils = utils
+    maya.standalone = standalone
+    api.OpenMaya = open_maya
+    api.OpenMayaAnim = open_maya_anim
+
+    sys.modules.update({
+        'maya': maya,
+        'maya.cmds': cmds,
+        'maya.api': api,
+        'maya.api.OpenMaya': open_maya,
+        'maya.api.OpenMayaAnim': open_maya_anim,
+        'maya.utils': utils,
+        'maya.standalone': standalone,
+    })
+    return scene, recorder
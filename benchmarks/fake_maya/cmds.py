@@ -0,0 +1,747 @@
+import functools
+import math
+import sys
+import types
+
+from .scene import scene, recorder, compose, decompose_rotation, ANGLE_ATTRIBUTES
+
+
+# Scene commands
+
+def _names(nodes, long=False, uuid=False):
+    if uuid:
+        return [node.uuid for node in nodes]
+    return [node.full_path() if long else node.name for node in nodes]
+
+
+def _targets(args):
+    if args:
+        items = []
+        for arg in args:
+            items.extend(arg if isinstance(arg, (list, tuple)) else [arg])
+        return [scene.get(item) for item in items]
+    return list(scene.selection)
+
+
+def ls(*args, **kwargs):
+    selection = kwargs.get('selection', kwargs.get('sl', False))
+    node_type = kwargs.get('type')
+    if isinstance(node_type, str):
+        node_type = [node_type]
+    if kwargs.get('transforms', kwargs.get('tr', False)):
+        node_type = ['transform']
+    if kwargs.get('cameras', False):
+        node_type = ['camera']
+    long = kwargs.get('long', kwargs.get('l', False))
+    uuid = kwargs.get('uuid', False)
+    if selection:
+        nodes = [node for node in scene.selection if node.alive]
+        if kwargs.get('dag', False):
+            nodes = _with_descendants(nodes)
+        if node_type:
+            nodes = [node for node in nodes if node.type in node_type]
+        return _names(nodes, long, uuid)
+    patterns = []
+    for arg in args:
+        patterns.extend(arg if isinstance(arg, (list, tuple)) else [arg])
+    if not patterns:
+        return _names(scene.ls(node_type=node_type), long, uuid)
+    dag = kwargs.get('dag', False)
+    result = []
+    for pattern in patterns:
+        pattern = pattern.rsplit('|', 1)[-1]
+        result.extend(scene.ls(pattern, None if dag else node_type))
+    if dag:
+        result = _with_descendants(result)
+        if node_type:
+            result = [node for node in result if node.type in node_type]
+    return _names(result, long, uuid)
+
+
+def _with_descendants(nodes):
+    result = []
+    stack = list(reversed(nodes))
+    while stack:
+        node = stack.pop()
+        if node not in result:
+            result.append(node)
+        stack.extend(reversed(node.children))
+    return result
+
+
+def objExists(name):
+    if '.' in str(name):
+        node_name, attr = name.split('.', 1)
+        node = scene.find(node_name)
+        return node is not None and attr in node.attrs
+    return scene.find(name) is not None
+
+
+def nodeType(name):
+    return scene.get(name).type
+
+
+def createNode(node_type, name=None, parent=None, skipSelect=False, **kwargs):
+    parent_node = scene.get(parent) if parent else None
+    node = scene.create_node(node_type, name or f'{node_type}1', parent=parent_node)
+    return node.name
+
+
+def delete(*args, **kwargs):
+    for node in _targets(args):
+        if node.alive:
+            scene.delete_node(node)
+
+
+def rename(old, new):
+    if isinstance(old, (list, tuple)):
+        old = old[0]
+    return scene.rename(scene.get(old), new)
+
+
+def select(*args, **kwargs):
+    if kwargs.get('clear', kwargs.get('cl', False)):
+        scene.selection = []
+        scene.emit_event('SelectionChanged')
+        return
+    nodes = _targets(args)
+    if kwargs.get('add', False):
+        scene.selection.extend(nodes)
+    else:
+        scene.selection = nodes
+    scene.emit_event('SelectionChanged')
+
+
+def listRelatives(*args, **kwargs):
+    nodes = _targets(args)
+    full_path = kwargs.get('fullPath', kwargs.get('f', False))
+    node_type = kwargs.get('type')
+    if isinstance(node_type, str):
+        node_type = [node_type]
+    result = []
+    for node in nodes:
+        if kwargs.get('parent', kwargs.get('p', False)):
+            related = [node.parent] if node.parent is not None else []
+        elif kwargs.get('allDescendents', kwargs.get('ad', False)):
+            related = []
+            stack = list(reversed(node.children))
+            while stack:
+                child = stack.pop()
+                related.append(child)
+                stack.extend(reversed(child.children))
+            related.reverse()
+        else:
+            related = list(node.children)
+            if kwargs.get('shapes', kwargs.get('s', False)):
+                related = [child for child in related if child.type != 'transform']
+        if node_type:
+            related = [child for child in related if child.type in node_type]
+        result.extend(related)
+    return _names(result, full_path) or None
+
+
+def parent(*args, **kwargs):
+    items = []
+    for arg in args:
+        items.extend(arg if isinstance(arg, (list, tuple)) else [arg])
+    if kwargs.get('world', kwargs.get('w', False)):
+        children, new_parent = items, None
+    else:
+        children, new_parent = items[:-1], scene.get(items[-1])
+    result = []
+    for child in children:
+        node = scene.get(child)
+        world = scene.world_matrix(node)
+        scene.reparent(node, new_parent)
+        scene.set_world_matrix(node, world)
+        result.append(node.name)
+    return result
+
+
+def group(*args, **kwargs):
+    node = scene.create_node('transform', kwargs.get('name', kwargs.get('n', 'group1')))
+    if kwargs.get('empty', kwargs.get('em', False)):
+        return node.name
+    for child in _targets(args):
+        if child.parent is not None:
+            scene.reparent(node, child.parent)
+        scene.reparent(child, node)
+    return node.name
+
+
+def duplicate(*args, **kwargs):
+    names = []
+    for index, source in enumerate(_targets(args)):
+        new_names = kwargs.get('name', kwargs.get('n'))
+        copy = _copy_tree(source, source.parent, new_names if index == 0 else None)
+        names.append(copy.name)
+    return names
+
+
+def _copy_tree(source, new_parent, name=None):
+    copy = scene.create_node(source.type, name or source.name, parent=new_parent)
+    copy.attrs.update(source.attrs)
+    for child in source.children:
+        _copy_tree(child, copy)
+    return copy
+
+
+def _shape_transform(node_type, name):
+    transform = scene.create_node('transform', name)
+    shape = scene.create_node(node_type, f'{transform.name}Shape', parent=transform)
+    return transform, shape
+
+
+def camera(*args, **kwargs):
+    if args:
+        node = scene.get(args[0])
+        shape = node if node.type == 'camera' else node.children[0]
+        if kwargs.get('query', kwargs.get('q', False)):
+            for flag in ('focalLength', 'fl', 'horizontalFilmAperture', 'hfa', 'verticalFilmAperture', 'vfa'):
+                if kwargs.get(flag):
+                    full = {'fl': 'focalLength', 'hfa': 'horizontalFilmAperture', 'vfa': 'verticalFilmAperture'}.get(flag, flag)
+                    return shape.attrs[full]
+        return None
+    transform, shape = _shape_transform('camera', 'camera1')
+    return [transform.name, shape.name]
+
+
+def spaceLocator(*args, **kwargs):
+    transform, _ = _shape_transform('locator', kwargs.get('name', kwargs.get('n', 'locator1')))
+    return [transform.name]
+
+
+def curve(*args, **kwargs):
+    transform, shape = _shape_transform('nurbsCurve', kwargs.get('name', kwargs.get('n', 'curve1')))
+    shape.attrs['points'] = list(kwargs.get('p', kwargs.get('point', [])))
+    return transform.name
+
+
+def textCurves(*args, **kwargs):
+    text = kwargs.get('t', kwargs.get('text', ''))
+    root = scene.create_node('transform', f'Text_{text}_1')
+    for index, character in enumerate(text):
+        if character == ' ':
+            continue
+        char_group = scene.create_node('transform', f'Char_{character}_1', parent=root)
+        char_group.attrs['translateX'] = index * 0.7
+        char_curve = scene.create_node('transform', 'curve1', parent=char_group)
+        char_shape = scene.create_node('nurbsCurve', 'curveShape1', parent=char_curve)
+        # A box per character stands in for the font outline
+        char_shape.attrs['cached'] = types.SimpleNamespace(
+            points=[(0, 0, 0), (0.5, 0, 0), (0.5, 0.7, 0), (0, 0.7, 0), (0, 0, 0)],
+            knots=[0, 1, 2, 3, 4], degree=1, form=1)
+    return [root.name]
+
+
+def aimConstraint(*args, **kwargs):
+    items = []
+    for arg in args:
+        items.extend(arg if isinstance(arg, (list, tuple)) else [arg])
+    target, constrained = scene.get(items[0]), scene.get(items[-1])
+    node = scene.create_node('aimConstraint', f'{constrained.name}_aimConstraint1', parent=constrained)
+    scene.connect(target, 'translate', node, 'target')
+    scene.connect(node, 'constraintRotate', constrained, 'rotate')
+    return [node.name]
+
+
+def makeIdentity(*args, **kwargs):
+    for node in _targets(args):
+        if node.type != 'transform':
+            continue
+        for attr in ('translateX', 'translateY', 'translateZ', 'rotateX', 'rotateY', 'rotateZ'):
+            node.attrs[attr] = 0.0
+        for attr in ('scaleX', 'scaleY', 'scaleZ'):
+            node.attrs[attr] = 1.0
+
+
+def _set_vector(node, prefix, values, relative=False):
+    for axis, value in zip('XYZ', values):
+        attr = f'{prefix}{axis}'
+        node.attrs[attr] = node.attrs.get(attr, 0.0) + value if relative else float(value)
+        scene.attribute_changed(node, attr)
+
+
+def move(x, y, z, *args, **kwargs):
+    for node in _targets(args):
+        _set_vector(node, 'translate', (x, y, z), kwargs.get('relative', kwargs.get('r', False)))
+
+
+def rotate(x, y, z, *args, **kwargs):
+    for node in _targets(args):
+        _set_vector(node, 'rotate', (x, y, z), kwargs.get('relative', kwargs.get('r', False)))
+
+
+def scale(x, y, z, *args, **kwargs):
+    for node in _targets(args):
+        _set_vector(node, 'scale', (x, y, z))
+
+
+def xform(*args, **kwargs):
+    nodes = _targets(args)
+    query = kwargs.get('query', kwargs.get('q', False))
+    world = kwargs.get('worldSpace', kwargs.get('ws', False))
+    translation = kwargs.get('translation', kwargs.get('t'))
+    rotation = kwargs.get('rotation', kwargs.get('ro'))
+    matrix = kwargs.get('matrix', kwargs.get('m'))
+    node = nodes[0]
+    if query:
+        if translation:
+            if world:
+                return list(scene.world_matrix(node)[3][0:3])
+            return [scene.value(node, f'translate{axis}') for axis in 'XYZ']
+        if rotation:
+            if world:
+                return decompose_rotation(scene.world_matrix(node))
+            return [scene.value(node, f'rotate{axis}') for axis in 'XYZ']
+        if matrix:
+            rows = scene.world_matrix(node) if world else scene.local_matrix(node)
+            return [value for row in rows for value in row]
+        if kwargs.get('boundingBox', kwargs.get('bb', False)):
+            position = scene.world_matrix(node)[3][0:3]
+            return [position[0] - 0.5, position[1] - 0.5, position[2] - 0.5,
+                    position[0] + 0.5, position[1] + 0.5, position[2] + 0.5]
+        return None
+    for node in nodes:
+        if matrix is not None:
+            rows = [list(matrix[row * 4:row * 4 + 4]) for row in range(4)]
+            if world:
+                scene.set_world_matrix(node, rows)
+            continue
+        if translation is not None:
+            if world and node.parent is not None:
+                current = scene.world_matrix(node)
+                current[3][0:3] = list(translation)
+                scene.set_world_matrix(node, current)
+            else:
+                _set_vector(node, 'translate', translation)
+        if rotation is not None:
+            if world and node.parent is not None:
+                current = scene.world_matrix(node)
+                position = current[3][0:3]
+                new = compose(position, rotation, (1, 1, 1))
+                scene.set_world_matrix(node, new)
+            else:
+                _set_vector(node, 'rotate', rotation)
+        pivot = kwargs.get('piv', kwargs.get('pivots'))
+        if pivot is not None:
+            node.attrs['rotatePivot'] = tuple(pivot)
+
+
+def _split(plug):
+    node_name, attr = plug.split('.', 1)
+    return scene.get(node_name), attr
+
+
+ALIASES = {'wm': 'worldMatrix', 'v': 'visibility', 'tx': 'translateX', 'ty': 'translateY', 'tz': 'translateZ',
+           'rx': 'rotateX', 'ry': 'rotateY', 'rz': 'rotateZ', 'sx': 'scaleX', 'sy': 'scaleY', 'sz': 'scaleZ',
+           'fl': 'focalLength'}
+
+
+def getAttr(plug, **kwargs):
+    node, attr = _split(plug)
+    attr = ALIASES.get(attr, attr)
+    frame = kwargs.get('time', kwargs.get('t'))
+    if attr.startswith('worldMatrix'):
+        rows = scene.world_matrix(node, frame)
+        return [value for row in rows for value in row]
+    if attr in ('translate', 'rotate', 'scale'):
+        return [tuple(scene.value(node, f'{attr}{axis}', frame) for axis in 'XYZ')]
+    if attr == 'overrideColorRGB':
+        return [tuple(node.attrs.get(f'overrideColor{channel}', 0.0) for channel in 'RGB')]
+    if kwargs.get('keyable', False) or kwargs.get('lock', False):
+        return False
+    return scene.value(node, attr, frame)
+
+
+def setAttr(plug, *values, **kwargs):
+    node, attr = _split(plug)
+    attr = ALIASES.get(attr, attr)
+    if kwargs.get('lock') is not None and not values:
+        return
+    if attr in ('translate', 'rotate', 'scale') and len(values) == 3:
+        _set_vector(node, attr, values)
+        return
+    if attr == 'overrideColorRGB' and len(values) == 3:
+        for channel, value in zip('RGB', values):
+            node.attrs[f'overrideColor{channel}'] = value
+        return
+    if '[' in attr and node.curve is not None:
+        # keyTimeValue[0:n] style bulk writes on anim curves
+        pairs = list(zip(values[0::2], values[1::2]))
+        for key_time, value in pairs:
+            node.curve.set_key(key_time, math.radians(value) if node.type == 'animCurveTA' else value)
+        return
+    node.attrs[attr] = values[0] if len(values) == 1 else tuple(values)
+    scene.attribute_changed(node, attr)
+
+
+def connectAttr(source, destination, **kwargs):
+    src_node, src_attr = _split(source)
+    dst_node, dst_attr = _split(destination)
+    scene.connect(src_node, src_attr, dst_node, ALIASES.get(dst_attr, dst_attr))
+
+
+def disconnectAttr(source, destination, **kwargs):
+    dst_node, dst_attr = _split(destination)
+    scene.connections.pop((dst_node, ALIASES.get(dst_attr, dst_attr)), None)
+
+
+def listConnections(plug, **kwargs):
+    node, attr = _split(plug) if '.' in plug else (scene.get(plug), None)
+    result = []
+    for (dst_node, dst_attr), (src_node, src_attr) in scene.connections.items():
+        if dst_node is node and (attr is None or dst_attr == attr) and kwargs.get('source', True):
+            result.append(src_node.name)
+        elif src_node is node and (attr is None or src_attr == attr) and kwargs.get('destination', True):
+            result.append(dst_node.name)
+    return result or None
+
+
+def addAttr(*args, **kwargs):
+    node = _targets(args)[0]
+    name = kwargs.get('longName', kwargs.get('ln'))
+    node.attrs[name] = kwargs.get('defaultValue', kwargs.get('dv', 0.0))
+
+
+def attributeQuery(attr, node=None, exists=False, **kwargs):
+    target = scene.find(node)
+    return target is not None and attr in target.attrs
+
+
+def listCameras(*args, **kwargs):
+    return [node.parent.name for node in scene.ls(node_type=['camera']) if node.parent is not None]
+
+
+# Animation
+
+def currentTime(*args, **kwargs):
+    if kwargs.get('query', kwargs.get('q', False)):
+        return scene.current_time
+    scene.current_time = float(args[0])
+    return scene.current_time
+
+
+def playbackOptions(**kwargs):
+    if kwargs.get('query', kwargs.get('q', False)):
+        if kwargs.get('min', kwargs.get('minTime', False)):
+            return scene.playback_range[0]
+        if kwargs.get('max', kwargs.get('maxTime', False)):
+            return scene.playback_range[1]
+        return None
+    for index, flags in enumerate((('min', 'minTime'), ('max', 'maxTime'))):
+        for flag in flags:
+            if flag in kwargs:
+                scene.playback_range[index] = float(kwargs[flag])
+
+
+def _curve_for(node, attr, create=True):
+    source = scene.source_of(node, attr)
+    if source is not None and source[0].curve is not None:
+        return source[0]
+    if not create:
+        return None
+    curve_type = 'animCurveTA' if attr in ANGLE_ATTRIBUTES else ('animCurveTL' if attr.startswith('translate') else 'animCurveTU')
+    curve_node = scene.create_node(curve_type, f'{node.name}_{attr}')
+    scene.connect(curve_node, 'output', node, attr)
+    return curve_node
+
+
+def setKeyframe(*args, **kwargs):
+    items = []
+    for arg in args:
+        items.extend(arg if isinstance(arg, (list, tuple)) else [arg])
+    plugs = []
+    for item in items or [node.name for node in scene.selection]:
+        if '.' in item:
+            plugs.append(_split(item))
+        else:
+            attributes = kwargs.get('attribute', kwargs.get('at'))
+            if isinstance(attributes, str):
+                attributes = [attributes]
+            for attr in attributes or ('translateX', 'translateY', 'translateZ', 'rotateX', 'rotateY', 'rotateZ'):
+                plugs.append((scene.get(item), attr))
+    frame = kwargs.get('time', kwargs.get('t', scene.current_time))
+    if isinstance(frame, (list, tuple)):
+        frame = frame[0]
+    for node, attr in plugs:
+        attr = ALIASES.get(attr, attr)
+        value = kwargs.get('value', kwargs.get('v'))
+        if value is None:
+            value = scene.value(node, attr, frame)
+        curve_node = _curve_for(node, attr)
+        curve_node.curve.set_key(float(frame), math.radians(value) if attr in ANGLE_ATTRIBUTES else value)
+        scene.attribute_changed(curve_node, 'keyTimeValue')
+    return len(plugs)
+
+
+# keyTangent names of the MFnAnimCurve tangent types
+TANGENT_NAMES = {0: 'auto', 1: 'fixed', 2: 'linear', 3: 'flat', 4: 'spline', 5: 'step', 6: 'slow', 7: 'fast',
+                 8: 'clamped', 9: 'plateau', 10: 'stepnext', 18: 'auto'}
+
+
+def keyTangent(*args, **kwargs):
+    if not kwargs.get('query', kwargs.get('q', False)):
+        return None
+    result = []
+    for curve_node in _key_curves(args, kwargs):
+        if kwargs.get('inTangentType', kwargs.get('itt', False)):
+            result.extend(TANGENT_NAMES.get(tangent, 'auto') for tangent in curve_node.curve.in_tangents)
+        if kwargs.get('outTangentType', kwargs.get('ott', False)):
+            result.extend(TANGENT_NAMES.get(tangent, 'auto') for tangent in curve_node.curve.out_tangents)
+    return result or None
+
+
+def _key_curves(args, kwargs):
+    items = []
+    for arg in args:
+        items.extend(arg if isinstance(arg, (list, tuple)) else [arg])
+    curves = []
+    for item in items:
+        if '.' in item:
+            node, attr = _split(item)
+            curve_node = _curve_for(node, ALIASES.get(attr, attr), create=False)
+        else:
+            node = scene.get(item)
+            curve_node = node if node.curve is not None else None
+            if curve_node is None:
+                attributes = kwargs.get('attribute', kwargs.get('at'))
+                if isinstance(attributes, str):
+                    attributes = [attributes]
+                for attr in attributes or []:
+                    found = _curve_for(node, attr, create=False)
+                    if found is not None:
+                        curves.append(found)
+                continue
+        if curve_node is not None:
+            curves.append(curve_node)
+    return curves
+
+
+def keyframe(*args, **kwargs):
+    curves = _key_curves(args, kwargs)
+    query = kwargs.get('query', kwargs.get('q', False))
+    if query:
+        if kwargs.get('keyframeCount', kwargs.get('kc', False)):
+            return sum(len(node.curve.keys) for node in curves)
+        if kwargs.get('name', kwargs.get('n', False)):
+            return [node.name for node in curves] or None
+        result = []
+        for curve_node in curves:
+            for key_time, value in curve_node.curve.keys:
+                if kwargs.get('timeChange', kwargs.get('tc', False)):
+                    result.append(key_time)
+                if kwargs.get('valueChange', kwargs.get('vc', False)):
+                    result.append(math.degrees(value) if curve_node.type == 'animCurveTA' else value)
+        return result or None
+    return len(curves)
+
+
+def cutKey(*args, **kwargs):
+    items = []
+    for arg in args:
+        items.extend(arg if isinstance(arg, (list, tuple)) else [arg])
+    attributes = kwargs.get('attribute', kwargs.get('at'))
+    if isinstance(attributes, str):
+        attributes = [attributes]
+    time_range = kwargs.get('time', kwargs.get('t'))
+    if time_range is not None and not isinstance(time_range, (list, tuple)):
+        time_range = (time_range, time_range)
+
+    curves = []
+    for item in items:
+        if '.' in item:
+            curves.append(_curve_for(*_split(item), create=False))
+        else:
+            node = scene.get(item)
+            curves.extend(_curve_for(node, attr, create=False) for attr in attributes or [])
+
+    removed = 0
+    for curve_node in curves:
+        if curve_node is None:
+            continue
+        curve = curve_node.curve
+        for index in reversed(range(len(curve.keys))):
+            if time_range is None or time_range[0] <= curve.times[index] <= time_range[1]:
+                curve.remove(index)
+                removed += 1
+        scene.attribute_changed(curve_node, 'keyTimeValue')
+    return removed
+
+
+def autoKeyframe(*args, **kwargs):
+    if kwargs.get('query', kwargs.get('q', False)):
+        return scene.option_vars.get('autoKeyframe', False)
+    if 'state' in kwargs:
+        scene.option_vars['autoKeyframe'] = kwargs['state']
+
+
+def undoInfo(*args, **kwargs):
+    if kwargs.get('openChunk', False):
+        scene.undo_chunks += 1
+        scene.open_undo_chunks += 1
+    if kwargs.get('closeChunk', False):
+        scene.open_undo_chunks -= 1
+    if kwargs.get('query', kwargs.get('q', False)):
+        return True
+
+
+def undo(*args, **kwargs):
+    return None
+
+
+def refresh(*args, **kwargs):
+    if kwargs.get('query', False):
+        return scene.refresh_suspended
+    if 'suspend' in kwargs:
+        scene.refresh_suspended = kwargs['suspend']
+
+
+def optionVar(**kwargs):
+    for flag in ('q', 'query'):
+        if flag in kwargs:
+            return scene.option_vars.get(kwargs[flag], 0)
+    for flag in ('intValue', 'iv', 'stringValue', 'sv', 'floatValue', 'fv'):
+        if flag in kwargs:
+            key, value = kwargs[flag]
+            scene.option_vars[key] = value
+    if 'exists' in kwargs:
+        return kwargs['exists'] in scene.option_vars
+
+
+def warning(message):
+    return None
+
+
+def error(message):
+    raise RuntimeError(message)
+
+
+def about(**kwargs):
+    if kwargs.get('batch', False):
+        return True
+    return '2024'
+
+
+def file(*args, **kwargs):
+    if kwargs.get('new', False):
+        scene.reset(new_file=True)
+        scene.emit_scene(3)
+        return None
+    if kwargs.get('open', kwargs.get('o', False)):
+        scene.reset(new_file=True)
+        scene.option_vars['sceneName'] = args[0]
+        scene.emit_scene(5)
+        return args[0]
+    if kwargs.get('rename'):
+        scene.option_vars['sceneName'] = kwargs['rename']
+        return kwargs['rename']
+    if kwargs.get('save', kwargs.get('s', False)):
+        return scene.option_vars.get('sceneName', 'untitled')
+    if kwargs.get('query', kwargs.get('q', False)):
+        return scene.option_vars.get('sceneName', '')
+    return None
+
+
+def evalDeferred(function, **kwargs):
+    function() if callable(function) else None
+
+
+def scriptJob(**kwargs):
+    return scene.add_callback(f"job:{kwargs.get('event', [''])[0]}", lambda *args: None)
+
+
+def loadPlugin(*args, **kwargs):
+    import importlib.util
+    from . import open_maya
+    for path in args:
+        if path in scene.plugins:
+            continue
+        spec = importlib.util.spec_from_file_location(f'fake_plugin_{len(scene.plugins)}', path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        module.initializePlugin(open_maya.MObject())
+        scene.plugins.add(path)
+    return list(args)
+
+
+def pluginInfo(*args, **kwargs):
+    return bool(args) and args[0] in scene.plugins
+
+
+def bakeResults(*args, **kwargs):
+    return 0
+
+
+# UI commands
+
+def _control(kind):
+    def control(*args, **kwargs):
+        name = args[0] if args else None
+        if kwargs.get('exists', kwargs.get('ex', False)):
+            return name in scene.ui
+        query = kwargs.pop('query', kwargs.pop('q', False))
+        edit = kwargs.pop('edit', kwargs.pop('e', False))
+        if query:
+            state = scene.ui.get(name, {})
+            for flag in kwargs:
+                return state.get(flag)
+            return None
+        if edit:
+            scene.ui.setdefault(name, {}).update(kwargs)
+            command = kwargs.get('command')
+            if command is not None:
+                scene.ui[name]['command'] = command
+            return None
+        if name is None or name in scene.ui:
+            name = f'{kind}{len(scene.ui) + 1}'
+        scene.ui[name] = dict(kwargs, kind=kind)
+        return name
+    control.__name__ = kind
+    return control
+
+
+for _kind in ('window', 'columnLayout', 'rowLayout', 'text', 'button', 'iconTextButton', 'textField',
+              'floatField', 'intField', 'checkBox', 'scrollLayout', 'formLayout', 'frameLayout',
+              'progressBar', 'floatSliderGrp', 'intFieldGrp', 'textScrollList', 'separator',
+              'optionMenu', 'menuItem', 'rowColumnLayout'):
+    globals()[_kind] = _control(_kind)
+
+
+def deleteUI(*names, **kwargs):
+    for name in names:
+        scene.ui.pop(name, None)
+
+
+def setParent(*args, **kwargs):
+    return None
+
+
+def showWindow(*args, **kwargs):
+    return None
+
+
+def colorEditor(*args, **kwargs):
+    return [1.0, 0.0, 0.0]
+
+
+def progressWindow(*args, **kwargs):
+    if kwargs.get('query', kwargs.get('q', False)):
+        return False
+    return None
+
+
+# Count every command
+
+def _record(name, function):
+    @functools.wraps(function)
+    def recorded(*args, **kwargs):
+        recorder.record(name)
+        return function(*args, **kwargs)
+    return recorded
+
+
+_module = sys.modules[__name__]
+for _name, _function in list(vars(_module).items()):
+    if callable(_function) and not _name.startswith('_') and getattr(_function, '__module__', None) == __name__:
+        setattr(_module, _name, _record(_name, _function))
@@ -0,0 +1,1076 @@
+import math
+from types import SimpleNamespace
+
+from .scene import scene, recorder, Node, identity, mat_mult, invert, ANGLE_ATTRIBUTES
+
+
+class MFn(object):
+    kInvalid = 0
+    kDependencyNode = 4
+    kDagNode = 107
+    kTransform = 110
+    kCamera = 250
+    kLocator = 281
+    kNurbsCurve = 267
+    kMesh = 296
+    kAnimCurve = 7
+    kAimConstraint = 111
+    kConstraint = 917
+
+
+TYPE_FNS = {
+    'transform': (MFn.kTransform, MFn.kDagNode),
+    'camera': (MFn.kCamera, MFn.kDagNode),
+    'locator': (MFn.kLocator, MFn.kDagNode),
+    'nurbsCurve': (MFn.kNurbsCurve, MFn.kDagNode),
+    'mesh': (MFn.kMesh, MFn.kDagNode),
+    'aimConstraint': (MFn.kAimConstraint, MFn.kConstraint, MFn.kTransform, MFn.kDagNode),
+}
+
+
+class MObject(object):
+    kNullObj = None
+
+    def __init__(self, node=None):
+        if isinstance(node, MObject):
+            node = node.node
+        self.node = node
+
+    def isNull(self):
+        return self.node is None or not self.node.alive
+
+    def hasFn(self, fn):
+        if self.node is None:
+            return False
+        if fn == MFn.kDependencyNode:
+            return True
+        if fn == MFn.kAnimCurve:
+            return self.node.curve is not None
+        return fn in TYPE_FNS.get(self.node.type, ())
+
+    def apiTypeStr(self):
+        return self.node.type if self.node is not None else 'kInvalid'
+
+    def __eq__(self, other):
+        return isinstance(other, MObject) and other.node is self.node
+
+    def __hash__(self):
+        return id(self.node)
+
+
+MObject.kNullObj = MObject()
+
+
+class MUuid(object):
+
+    def __init__(self, value=''):
+        self.value = value
+
+    def asString(self):
+        return self.value
+
+    def __eq__(self, other):
+        return isinstance(other, MUuid) and other.value == self.value
+
+    def __hash__(self):
+        return hash(self.value)
+
+
+class MObjectHandle(object):
+
+    def __init__(self, obj):
+        self.obj = MObject(obj)
+
+    def isValid(self):
+        return not self.obj.isNull()
+
+    def isAlive(self):
+        return not self.obj.isNull()
+
+    def object(self):
+        return self.obj
+
+    def hashCode(self):
+        return id(self.obj.node)
+
+
+class MAngle(object):
+    kInvalid = 0
+    kRadians = 1
+    kDegrees = 2
+    kAngMinutes = 3
+    kAngSeconds = 4
+    kInternal = kRadians
+
+    def __init__(self, value=0.0, unit=kRadians):
+        self.radians = math.radians(value) if unit == MAngle.kDegrees else float(value)
+
+    @staticmethod
+    def uiUnit():
+        return MAngle.kDegrees
+
+    def asRadians(self):
+        return self.radians
+
+    def asDegrees(self):
+        return math.degrees(self.radians)
+
+    def asUnits(self, unit):
+        return self.asDegrees() if unit == MAngle.kDegrees else self.radians
+
+
+class MDistance(object):
+    kInvalid = 0
+    kInches = 1
+    kFeet = 2
+    kYards = 3
+    kMiles = 4
+    kMillimeters = 5
+    kCentimeters = 6
+    kKilometers = 7
+    kMeters = 8
+    kInternal = kCentimeters
+
+    def __init__(self, value=0.0, unit=kCentimeters):
+        self.value = float(value)
+
+    @staticmethod
+    def uiUnit():
+        return MDistance.kCentimeters
+
+    def asCentimeters(self):
+        return self.value
+
+
+class MTime(object):
+    kInvalid = 0
+    kSeconds = 3
+    kGames = 5
+    kFilm = 6
+    kPALFrame = 7
+    kNTSCFrame = 8
+    k24FPS = 6
+    k25FPS = 7
+    k30FPS = 8
+
+    # Units per second
+    RATES = {kSeconds: 1.0, kGames: 15.0, kFilm: 24.0, kPALFrame: 25.0, kNTSCFrame: 30.0}
+    ui_unit = kFilm
+
+    def __init__(self, value=0.0, unit=kFilm):
+        self.value = float(value)
+        self.unit = unit
+
+    @staticmethod
+    def uiUnit():
+        return MTime.ui_unit
+
+    @staticmethod
+    def setUIUnit(unit):
+        MTime.ui_unit = unit
+
+    def asUnits(self, unit):
+        if unit == self.unit:
+            return self.value
+        return self.value / self.RATES[self.unit] * self.RATES[unit]
+
+
+class MTimeArray(list):
+    pass
+
+
+class MDoubleArray(list):
+    pass
+
+
+class MIntArray(list):
+    pass
+
+
+class MVector(object):
+
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        if isinstance(x, (list, tuple, MVector, MPoint)):
+            x, y, z = x[0], x[1], x[2]
+        self.x, self.y, self.z = float(x), float(y), float(z)
+
+    def __getitem__(self, index):
+        return (self.x, self.y, self.z)[index]
+
+    def __len__(self):
+        return 3
+
+    def __mul__(self, other):
+        if isinstance(other, MMatrix):
+            rows = other.rows
+            return MVector(*[self.x * rows[0][col] + self.y * rows[1][col] + self.z * rows[2][col] for col in range(3)])
+        if isinstance(other, MVector):
+            return self.x * other.x + self.y * other.y + self.z * other.z
+        return MVector(self.x * other, self.y * other, self.z * other)
+
+    def __add__(self, other):
+        return MVector(self.x + other[0], self.y + other[1], self.z + other[2])
+
+    def __sub__(self, other):
+        return MVector(self.x - other[0], self.y - other[1], self.z - other[2])
+
+    def length(self):
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    def normal(self):
+        length = self.length() or 1.0
+        return MVector(self.x / length, self.y / length, self.z / length)
+
+
+class MPoint(MVector):
+
+    def __mul__(self, other):
+        if isinstance(other, MMatrix):
+            rows = other.rows
+            return MPoint(*[self.x * rows[0][col] + self.y * rows[1][col] + self.z * rows[2][col] + rows[3][col] for col in range(3)])
+        return MVector.__mul__(self, other)
+
+
+class MMatrix(object):
+
+    def __init__(self, values=None):
+        if values is None:
+            self.rows = identity()
+        elif isinstance(values, MMatrix):
+            self.rows = [list(row) for row in values.rows]
+        elif len(values) == 4 and isinstance(values[0], (list, tuple)):
+            self.rows = [list(map(float, row)) for row in values]
+        else:
+            values = list(values)
+            self.rows = [values[row * 4:row * 4 + 4] for row in range(4)]
+
+    def __mul__(self, other):
+        return MMatrix(mat_mult(self.rows, other.rows))
+
+    def __getitem__(self, index):
+        return self.rows[index // 4][index % 4]
+
+    def __iter__(self):
+        for row in self.rows:
+            for value in row:
+                yield value
+
+    def __len__(self):
+        return 16
+
+    def inverse(self):
+        return MMatrix(invert(self.rows))
+
+    def getElement(self, row, col):
+        return self.rows[row][col]
+
+
+class MTransformationMatrix(object):
+
+    def __init__(self, matrix=None):
+        self.matrix = MMatrix(matrix)
+
+    def translation(self, space=None):
+        return MVector(*self.matrix.rows[3][0:3])
+
+    def asMatrix(self):
+        return MMatrix(self.matrix)
+
+
+class MSpace(object):
+    kInvalid = 0
+    kTransform = 1
+    kPreTransform = 2
+    kPostTransform = 3
+    kWorld = 4
+    kObject = kPreTransform
+
+
+class MDGContext(object):
+    current = None
+
+    def __init__(self, time=None):
+        self.time = time
+
+    def makeCurrent(self):
+        previous = MDGContext.current or MDGContext.kNormal
+        MDGContext.current = self
+        return previous
+
+    def isNormal(self):
+        return self.time is None
+
+    def getTime(self):
+        return self.time
+
+
+MDGContext.kNormal = MDGContext()
+
+
+def context_frame():
+    context = MDGContext.current
+    if context is None or context.time is None:
+        return None
+    return context.time.value
+
+
+class MPlug(object):
+
+    def __init__(self, node=None, attr=None):
+        if isinstance(node, MObject):
+            node = node.node
+        self.node_ref = node
+        self.attr = attr
+
+    def isNull(self):
+        return self.node_ref is None
+
+    def node(self):
+        return MObject(self.node_ref)
+
+    def name(self):
+        return f'{self.node_ref.name}.{self.attr}'
+
+    def partialName(self, *args, **kwargs):
+        return self.attr
+
+    def connectedTo(self, asDst, asSrc):
+        recorder.record_api('MPlug.connectedTo')
+        result = []
+        if asDst:
+            source = scene.source_of(self.node_ref, self.attr)
+            if source is not None:
+                result.append(MPlug(source[0], source[1]))
+        if asSrc:
+            for (dst_node, dst_attr), (src_node, src_attr) in scene.connections.items():
+                if src_node is self.node_ref and src_attr == self.attr:
+                    result.append(MPlug(dst_node, dst_attr))
+        return result
+
+    def source(self):
+        source = scene.source_of(self.node_ref, self.attr)
+        return MPlug(source[0], source[1]) if source else MPlug()
+
+    @property
+    def isDestination(self):
+        return scene.source_of(self.node_ref, self.attr) is not None
+
+    @property
+    def isConnected(self):
+        return bool(self.connectedTo(True, True))
+
+    def _value(self):
+        recorder.record_api('MPlug.get')
+        return scene.value(self.node_ref, self.attr, context_frame())
+
+    def asDouble(self):
+        value = self._value()
+        return math.radians(value) if self.attr in ANGLE_ATTRIBUTES else float(value)
+
+    def asFloat(self):
+        return self.asDouble()
+
+    def asInt(self):
+        return int(self._value())
+
+    def asBool(self):
+        return bool(self._value())
+
+    def asMAngle(self):
+        return MAngle(self._value(), MAngle.kDegrees)
+
+    def asMObject(self):
+        recorder.record_api('MPlug.asMObject')
+        if self.attr in ('worldMatrix', 'wm', 'worldMatrix[0]'):
+            return MFnMatrixData.wrap(scene.world_matrix(self.node_ref, context_frame()))
+        raise TypeError('plug has no data object')
+
+    def setDouble(self, value):
+        recorder.record_api('MPlug.set')
+        if self.attr in ANGLE_ATTRIBUTES:
+            value = math.degrees(value)
+        self.node_ref.attrs[self.attr] = value
+        scene.attribute_changed(self.node_ref, self.attr)
+
+    def setFloat(self, value):
+        self.setDouble(value)
+
+    def setBool(self, value):
+        recorder.record_api('MPlug.set')
+        self.node_ref.attrs[self.attr] = bool(value)
+        scene.attribute_changed(self.node_ref, self.attr)
+
+    def setInt(self, value):
+        recorder.record_api('MPlug.set')
+        self.node_ref.attrs[self.attr] = int(value)
+        scene.attribute_changed(self.node_ref, self.attr)
+
+    def setMAngle(self, angle):
+        self.setDouble(angle.asRadians())
+
+    def elementByLogicalIndex(self, index):
+        return MPlug(self.node_ref, self.attr)
+
+    def child(self, index):
+        return MPlug(self.node_ref, self.attr + 'XYZ'[index])
+
+
+class MFnMatrixData(object):
+
+    def __init__(self, obj=None):
+        self.obj = obj
+
+    @staticmethod
+    def wrap(rows):
+        data = MObject()
+        data.matrix = MMatrix(rows)
+        return data
+
+    def matrix(self):
+        return self.obj.matrix
+
+
+class MDagPath(object):
+
+    def __init__(self, node=None):
+        if isinstance(node, (MObject, MDagPath)):
+            node = node.node if isinstance(node, MObject) else node.node_ref
+        self.node_ref = node
+
+    def node(self):
+        return MObject(self.node_ref)
+
+    def transform(self):
+        node = self.node_ref
+        return MObject(node if node.type == 'transform' else node.parent)
+
+    def fullPathName(self):
+        return self.node_ref.full_path()
+
+    def partialPathName(self):
+        return self.node_ref.name
+
+    def isValid(self):
+        return self.node_ref is not None and self.node_ref.alive
+
+    def inclusiveMatrix(self):
+        recorder.record_api('MDagPath.inclusiveMatrix')
+        return MMatrix(scene.world_matrix(self.node_ref, context_frame()))
+
+    def exclusiveMatrix(self):
+        parent = self.node_ref.parent
+        return MMatrix(scene.world_matrix(parent, context_frame())) if parent else MMatrix()
+
+    def hasFn(self, fn):
+        return MObject(self.node_ref).hasFn(fn)
+
+    def apiType(self):
+        return MObject(self.node_ref).apiTypeStr()
+
+    def childCount(self):
+        return len(self.node_ref.children)
+
+    def child(self, index):
+        return MObject(self.node_ref.children[index])
+
+    def extendToShape(self):
+        for child in self.node_ref.children:
+            if child.type != 'transform':
+                return MDagPath(child)
+        raise RuntimeError('No shape')
+
+    def numberOfShapesDirectlyBelow(self):
+        return len([child for child in self.node_ref.children if child.type != 'transform'])
+
+    @staticmethod
+    def getAPathTo(obj):
+        return MDagPath(obj)
+
+    def length(self):
+        count = 0
+        node = self.node_ref
+        while node is not None:
+            count += 1
+            node = node.parent
+        return count
+
+    def pop(self, count=1):
+        for _ in range(count):
+            self.node_ref = self.node_ref.parent
+        return self
+
+    def __eq__(self, other):
+        return isinstance(other, MDagPath) and other.node_ref is self.node_ref
+
+    def __hash__(self):
+        return id(self.node_ref)
+
+
+class MSelectionList(object):
+
+    def __init__(self, other=None):
+        self.items = list(other.items) if other is not None else []
+
+    def add(self, item):
+        if isinstance(item, MDagPath):
+            self.items.append(item.node_ref)
+            return self
+        if isinstance(item, MObject):
+            self.items.append(item.node)
+            return self
+        node = scene.find(item)
+        if node is None:
+            raise RuntimeError(f'(kInvalidParameter): Object does not exist: {item}')
+        self.items.append(node)
+        self.plug_attr = item.split('.', 1)[1] if '.' in str(item) else None
+        return self
+
+    def length(self):
+        return len(self.items)
+
+    def isEmpty(self):
+        return not self.items
+
+    def getDependNode(self, index):
+        return MObject(self.items[index])
+
+    def getDagPath(self, index):
+        node = self.items[index]
+        if not node.is_dag:
+            raise TypeError('not a DAG node')
+        return MDagPath(node)
+
+    def getPlug(self, index):
+        return MPlug(self.items[index], self.plug_attr)
+
+    def getSelectionStrings(self, index=None):
+        if index is not None:
+            return [self.items[index].name]
+        return [node.name for node in self.items]
+
+
+class MFnBase(object):
+
+    def __init__(self, obj=None):
+        self.set_object(obj)
+
+    def set_object(self, obj):
+        if isinstance(obj, MDagPath):
+            obj = obj.node()
+        self.obj = MObject(obj) if obj is not None else MObject()
+
+    def setObject(self, obj):
+        self.set_object(obj)
+
+    def object(self):
+        return self.obj
+
+    @property
+    def node_ref(self):
+        return self.obj.node
+
+
+class MFnDependencyNode(MFnBase):
+
+    def name(self):
+        return self.node_ref.name
+
+    def setName(self, name):
+        return scene.rename(self.node_ref, name)
+
+    def typeName(self):
+        return self.node_ref.type
+
+    def findPlug(self, attr, want_networked=False):
+        if attr not in self.node_ref.attrs and self.node_ref.curve is None:
+            if attr not in ('worldMatrix', 'wm', 'message', 'output', 'input'):
+                self.node_ref.attrs[attr] = 0.0
+        return MPlug(self.node_ref, attr)
+
+    def hasAttribute(self, attr):
+        return attr in self.node_ref.attrs
+
+    def create(self, node_type, name=None):
+        node = scene.create_node(node_type, name)
+        self.obj = MObject(node)
+        return self.obj
+
+    def uuid(self):
+        return MUuid(self.node_ref.uuid)
+
+
+class MFnDagNode(MFnDependencyNode):
+
+    def fullPathName(self):
+        return self.node_ref.full_path()
+
+    def partialPathName(self):
+        return self.node_ref.name
+
+    def getPath(self):
+        return MDagPath(self.node_ref)
+
+    def parent(self, index=0):
+        return MObject(self.node_ref.parent)
+
+    def parentCount(self):
+        return 1 if self.node_ref.parent is not None else 0
+
+    def childCount(self):
+        return len(self.node_ref.children)
+
+    def child(self, index):
+        return MObject(self.node_ref.children[index])
+
+    def transformationMatrix(self):
+        return MMatrix(scene.local_matrix(self.node_ref, context_frame()))
+
+    @property
+    def boundingBox(self):
+        return MBoundingBox(MPoint(-0.5, -0.5, -0.5), MPoint(0.5, 0.5, 0.5))
+
+
+class MBoundingBox(object):
+
+    def __init__(self, min_point=None, max_point=None):
+        self.min = min_point or MPoint()
+        self.max = max_point or MPoint()
+
+
+class MFnTransform(MFnDagNode):
+
+    def translation(self, space=None):
+        return MVector(*[self.node_ref.attrs[f'translate{axis}'] for axis in 'XYZ'])
+
+    def setTranslation(self, vector, space=None):
+        for axis, value in zip('XYZ', vector):
+            self.node_ref.attrs[f'translate{axis}'] = value
+
+
+class MFnCamera(MFnDagNode):
+
+    @property
+    def focalLength(self):
+        return scene.value(self.node_ref, 'focalLength', context_frame())
+
+    @property
+    def horizontalFilmAperture(self):
+        return scene.value(self.node_ref, 'horizontalFilmAperture', context_frame())
+
+    @property
+    def verticalFilmAperture(self):
+        return scene.value(self.node_ref, 'verticalFilmAperture', context_frame())
+
+
+class MGlobal(object):
+
+    @staticmethod
+    def displayWarning(message):
+        recorder.record_api('MGlobal.displayWarning')
+
+    @staticmethod
+    def displayInfo(message):
+        pass
+
+    @staticmethod
+    def displayError(message):
+        pass
+
+    @staticmethod
+    def getActiveSelectionList():
+        selection = MSelectionList()
+        for node in scene.selection:
+            selection.add(MObject(node))
+        return selection
+
+    @staticmethod
+    def mayaState():
+        return 0
+
+
+def _keep_attribute(plug, *args):
+    # Put back the raw value the plug had before an edit
+    node, attr = plug.node_ref, plug.attr
+    if attr not in node.attrs:
+        return lambda: node.attrs.pop(attr, None)
+    value = node.attrs[attr]
+    return lambda: node.attrs.__setitem__(attr, value)
+
+def _keep_connection(source, destination):
+    key = (destination.node_ref, destination.attr)
+    previous = scene.connections.get(key)
+    if previous is None:
+        return lambda: scene.connections.pop(key, None)
+    return lambda: scene.connections.__setitem__(key, previous)
+
+def _keep_node(obj):
+    # A deleted node comes back with its children, parents and connections
+    nodes = []
+    pending = [obj.node]
+    while pending:
+        node = pending.pop(0)
+        nodes.append((node, node.parent))
+        pending.extend(node.children)
+    members = {node for node, _ in nodes}
+    connections = {dest: src for dest, src in scene.connections.items() if dest[0] in members or src[0] in members}
+
+    def restore():
+        for node, parent in nodes:
+            node.alive = True
+            node.parent = None
+            scene.nodes[node.name] = node
+            if parent is not None:
+                scene.reparent(node, parent)
+            scene.emit('nodeAdded', node)
+        scene.connections.update(connections)
+    return restore
+
+def _keep_name(obj, name):
+    node, old_name = obj.node, obj.node.name
+    return lambda: scene.rename(node, old_name)
+
+def _keep_parent(obj, parent):
+    node, old_parent = obj.node, obj.node.parent
+    return lambda: scene.reparent(node, old_parent)
+
+
+class MDGModifier(object):
+    # Nodes exist as soon as they are queued, edits are applied together in doIt().
+    # undoIt() deletes the new nodes and reverts node deletes, renames, plug values and connections.
+
+    def __init__(self):
+        self.operations = []
+        self.created = []
+        self.reverts = []
+
+    def _queue(self, function, *args, keep=None):
+        self.operations.append((function, args, keep))
+
+    def _new_node(self, node_type, name):
+        node = Node(name, node_type)
+        obj = MObject(node)
+        self.created.append(obj)
+        return obj
+
+    def createNode(self, node_type):
+        recorder.record_api('MDGModifier.createNode')
+        obj = self._new_node(node_type, f'{node_type}1')
+        self._queue(scene.register_node, obj.node, None)
+        return obj
+
+    def renameNode(self, obj, name):
+        recorder.record_api('MDGModifier.renameNode')
+        self._queue(lambda target, new_name: scene.rename(target.node, new_name), obj, name, keep=_keep_name)
+
+    def newPlugValue(self, plug, value):
+        recorder.record_api('MDGModifier.newPlugValue')
+        self._queue(lambda target, data: target.node_ref.attrs.__setitem__(target.attr, data), plug, value, keep=_keep_attribute)
+
+    def newPlugValueDouble(self, plug, value):
+        recorder.record_api('MDGModifier.newPlugValue')
+        self._queue(lambda target, new_value: target.setDouble(new_value), plug, value, keep=_keep_attribute)
+
+    def newPlugValueFloat(self, plug, value):
+        self.newPlugValueDouble(plug, value)
+
+    def newPlugValueBool(self, plug, value):
+        recorder.record_api('MDGModifier.newPlugValue')
+        self._queue(lambda target, new_value: target.setBool(new_value), plug, value, keep=_keep_attribute)
+
+    def newPlugValueInt(self, plug, value):
+        recorder.record_api('MDGModifier.newPlugValue')
+        self._queue(lambda target, new_value: target.setInt(new_value), plug, value, keep=_keep_attribute)
+
+    def newPlugValueMAngle(self, plug, value):
+        recorder.record_api('MDGModifier.newPlugValue')
+        self._queue(lambda target, new_value: target.setMAngle(new_value), plug, value, keep=_keep_attribute)
+
+    def newPlugValueString(self, plug, value):
+        self.newPlugValue(plug, value)
+
+    def connect(self, source, destination):
+        recorder.record_api('MDGModifier.connect')
+        self._queue(lambda src, dst: scene.connect(src.node_ref, src.attr, dst.node_ref, dst.attr), source, destination, keep=_keep_connection)
+
+    def disconnect(self, source, destination):
+        recorder.record_api('MDGModifier.disconnect')
+        self._queue(lambda src, dst: scene.connections.pop((dst.node_ref, dst.attr), None), source, destination, keep=_keep_connection)
+
+    def deleteNode(self, obj):
+        recorder.record_api('MDGModifier.deleteNode')
+        self._queue(lambda target: scene.delete_node(target.node) if target.node.alive else None, obj, keep=_keep_node)
+
+    def addAttribute(self, obj, attribute):
+        recorder.record_api('MDGModifier.addAttribute')
+        self._queue(lambda target, attr: target.node.attrs.setdefault(attr.name, attr.default), obj, attribute)
+
+    def commandToExecute(self, command):
+        recorder.record_api('MDGModifier.commandToExecute')
+        self._queue(lambda text: None, command)
+
+    def pythonCommandToExecute(self, command):
+        recorder.record_api('MDGModifier.pythonCommandToExecute')
+        self._queue(lambda text: text() if callable(text) else exec(text, {}), command)
+
+    def doIt(self):
+        recorder.record('MDGModifier.doIt')
+        operations, self.operations = self.operations, []
+        for function, args, keep in operations:
+            if keep is not None:
+                self.reverts.append(keep(*args))
+            function(*args)
+
+    def undoIt(self):
+        recorder.record('MDGModifier.undoIt')
+        reverts, self.reverts = self.reverts, []
+        for revert in reversed(reverts):
+            revert()
+        for obj in reversed(self.created):
+            if obj.node.alive and obj.node.name in scene.nodes:
+                scene.delete_node(obj.node)
+
+
+class MDagModifier(MDGModifier):
+
+    def createNode(self, node_type, parent=None):
+        recorder.record_api('MDagModifier.createNode')
+        if isinstance(parent, MObject) and parent.node is None:
+            parent = None
+        if node_type == 'transform' or parent is not None:
+            name = 'transform1' if node_type == 'transform' else f'{node_type}Shape1'
+            obj = self._new_node(node_type, name)
+            self._queue(scene.register_node, obj.node, parent.node if parent is not None else None)
+            return obj
+        # Shapes created without a parent get their own transform, like Maya
+        transform = self._new_node('transform', 'transform1')
+        shape = self._new_node(node_type, f'{node_type}Shape1')
+        self._queue(scene.register_node, transform.node, None)
+        self._queue(scene.register_node, shape.node, transform.node)
+        return transform
+
+    def reparentNode(self, obj, parent=None):
+        recorder.record_api('MDagModifier.reparentNode')
+        self._queue(lambda target, new_parent: scene.reparent(target.node, new_parent.node if new_parent is not None else None), obj, parent, keep=_keep_parent)
+
+
+class MMessage(object):
+
+    @staticmethod
+    def removeCallback(callback_id):
+        scene.remove_callback(callback_id)
+
+    @staticmethod
+    def removeCallbacks(callback_ids):
+        for callback_id in callback_ids:
+            scene.remove_callback(callback_id)
+
+
+class MDGMessage(object):
+
+    @staticmethod
+    def addNodeAddedCallback(function, node_type='dependNode', client_data=None):
+        return scene.add_callback('nodeAdded', _typed(function, node_type), client_data)
+
+    @staticmethod
+    def addNodeRemovedCallback(function, node_type='dependNode', client_data=None):
+        return scene.add_callback('nodeRemoved', _typed(function, node_type), client_data)
+
+    @staticmethod
+    def addTimeChangeCallback(function, client_data=None):
+        return scene.add_callback('timeChanged', function, client_data)
+
+
+def _typed(function, node_type):
+    if node_type in ('dependNode', None):
+        return function
+
+    def filtered(obj, client_data):
+        if obj.node is not None and obj.node.type == node_type:
+            function(obj, client_data)
+    return filtered
+
+
+class MNodeMessage(object):
+    kConnectionMade = 1
+    kConnectionBroken = 2
+    kAttributeEval = 4
+    kAttributeSet = 8
+    kAttributeKeyable = 512
+
+    @staticmethod
+    def addNameChangedCallback(node, function, client_data=None):
+        watched = node.node if isinstance(node, MObject) and node.node is not None else None
+        return scene.add_callback('nameChanged', function, client_data, watched)
+
+    @staticmethod
+    def addAttributeChangedCallback(node, function, client_data=None):
+        return scene.add_callback('attributeChanged', function, client_data, node.node)
+
+    @staticmethod
+    def addNodeDirtyPlugCallback(node, function, client_data=None):
+        return scene.add_callback('dirtyPlug', function, client_data, node.node)
+
+
+class MDagMessage(object):
+
+    @staticmethod
+    def addParentAddedCallback(function, client_data=None):
+        return scene.add_callback('parentAdded', function, client_data)
+
+
+class MSceneMessage(object):
+    kAfterNew = 3
+    kAfterOpen = 5
+
+    @staticmethod
+    def addCallback(message, function, client_data=None):
+        return scene.add_callback(f'scene{message}', function, client_data)
+
+
+class MEventMessage(object):
+
+    @staticmethod
+    def addEventCallback(event, function, client_data=None):
+        return scene.add_callback(f'event:{event}', function, client_data)
+
+
+class MPointArray(list):
+    pass
+
+
+class MFnNurbsCurveData(MFnBase):
+
+    def create(self):
+        data = MObject()
+        data.points = []
+        self.obj = data
+        return data
+
+
+class MFnNurbsCurve(MFnDagNode):
+    kOpen = 1
+    kClosed = 2
+    kPeriodic = 3
+
+    def create(self, cvs, knots, degree, form, is_2d, rational, parent=None):
+        recorder.record_api('MFnNurbsCurve.create')
+        if parent is not None and parent.node is None:
+            parent.points = [tuple(point)[:3] for point in cvs]
+            parent.knots = list(knots)
+            parent.degree = degree
+            parent.form = form
+            return parent
+        raise NotImplementedError('only curve data creation is supported')
+
+    def _data(self):
+        return self.node_ref.attrs.get('cached')
+
+    def cvPositions(self, space=None):
+        data = self._data()
+        points = data.points if data is not None else []
+        if space == MSpace.kWorld and self.node_ref.parent is not None:
+            matrix = scene.world_matrix(self.node_ref.parent)
+            points = [[sum(([x, y, z, 1.0])[k] * matrix[k][col] for k in range(4)) for col in range(3)] for x, y, z in points]
+        return MPointArray(MPoint(*point) for point in points)
+
+    def knots(self):
+        data = self._data()
+        return list(data.knots) if data is not None else []
+
+    @property
+    def degree(self):
+        data = self._data()
+        return data.degree if data is not None else 1
+
+    @property
+    def form(self):
+        data = self._data()
+        return data.form if data is not None else self.kOpen
+
+
+class MPxNode(object):
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def addAttribute(cls, attribute):
+        pass
+
+    @classmethod
+    def attributeAffects(cls, source, destination):
+        pass
+
+
+class MFnNumericData(object):
+    kInt = 'int'
+    kDouble = 'double'
+    k3Double = 'double3'
+
+
+class MFnAttribute(object):
+    # Attribute objects only carry a name and default, enough to add them to nodes
+
+    def __init__(self):
+        self.attribute = None
+        self.keyable = False
+        self.writable = True
+        self.storable = True
+
+    def create(self, name, short_name, *args):
+        self.attribute = SimpleNamespace(name=name, short_name=short_name, default=args[-1] if args else 0.0)
+        return self.attribute
+
+    def setMin(self, value):
+        pass
+
+
+class MFnNumericAttribute(MFnAttribute):
+    pass
+
+
+class MFnUnitAttribute(MFnAttribute):
+    kAngle = 'angle'
+    kTime = 'time'
+
+
+class MPxCommand(object):
+
+    def __init__(self):
+        pass
+
+    def isUndoable(self):
+        return False
+
+
+class MFnPlugin(object):
+
+    def __init__(self, obj=None, vendor='', version='', api_version='Any'):
+        self.obj = obj
+
+    def registerCommand(self, name, command_class):
+        from . import cmds
+
+        def run(*args, **kwargs):
+            recorder.record(name)
+            command = command_class()
+            command.doIt(args)
+            return None
+        setattr(cmds, name, run)
+
+    def deregisterCommand(self, name):
+        from . import cmds
+        if hasattr(cmds, name):
+            delattr(cmds, name)
+
+    def registerNode(self, name, type_id, creator, initializer, node_type=None, classification=None):
+        scene.node_classes[name] = (creator, initializer)
+
+    def deregisterNode(self, type_id):
+        pass
+
+
+class MTypeId(object):
+
+    def __init__(self, value):
+        self.value = value
@@ -0,0 +1,189 @@
+from .scene import scene, recorder
+from .open_maya import MFnBase, MObject, MTime
+
+
+class MFnAnimCurve(MFnBase):
+    kAnimCurveTA = 0
+    kAnimCurveTL = 1
+    kAnimCurveTT = 2
+    kAnimCurveTU = 3
+    kAnimCurveUnknown = 8
+
+    kTangentGlobal = 0
+    kTangentFixed = 1
+    kTangentLinear = 2
+    kTangentFlat = 3
+    kTangentSmooth = 4
+    kTangentStep = 5
+    kTangentSlow = 6
+    kTangentFast = 7
+    kTangentClamped = 8
+    kTangentPlateau = 9
+    kTangentStepNext = 10
+    kTangentAuto = 18
+
+    CURVE_TYPES = {0: 'animCurveTA', 1: 'animCurveTL', 2: 'animCurveTT', 3: 'animCurveTU'}
+
+    def create(self, plug, curve_type=None, modifier=None):
+        recorder.record_api('MFnAnimCurve.create')
+        if curve_type is None:
+            curve_type = self.kAnimCurveTA if plug.attr.startswith('rotate') else self.kAnimCurveTU
+        node = scene.create_node(self.CURVE_TYPES[curve_type], f'{plug.node_ref.name}_{plug.attr}')
+        scene.connect(node, 'output', plug.node_ref, plug.attr)
+        self.obj = MObject(node)
+        if modifier is not None:
+            # Undoing the modifier removes the curve again
+            modifier.created.append(self.obj)
+        return self.obj
+
+    @property
+    def curve(self):
+        return self.node_ref.curve
+
+    @property
+    def isWeighted(self):
+        return False
+
+    @property
+    def numKeys(self):
+        return len(self.curve.keys)
+
+    def animCurveType(self):
+        return {v: k for k, v in self.CURVE_TYPES.items()}.get(self.node_ref.type, self.kAnimCurveUnknown)
+
+    def evaluate(self, time):
+        recorder.record_api('MFnAnimCurve.evaluate')
+        return self.curve.evaluate(time.value)
+
+    def input(self, index):
+        return MTime(self.curve.keys[index][0])
+
+    def value(self, index):
+        return self.curve.keys[index][1]
+
+    def find(self, time):
+        index = self.curve.index_of(time.value)
+        return index if index >= 0 else None
+
+    def findClosest(self, time):
+        keys = self.curve.keys
+        return min(range(len(keys)), key=lambda index: abs(keys[index][0] - time.value))
+
+    def inTangentType(self, index):
+        return self.curve.in_tangents[index]
+
+    def outTangentType(self, index):
+        return self.curve.out_tangents[index]
+
+    def addKey(self, time, value, tangent_in=0, tangent_out=0, change=None):
+        recorder.record_api('MFnAnimCurve.addKey')
+        MAnimCurveChange.record(change, self.node_ref)
+        self.curve.set_key(time.value, value, tangent_in, tangent_out)
+        scene.attribute_changed(self.node_ref, 'keyTimeValue')
+        return self.curve.index_of(time.value)
+
+    def addKeys(self, times, values, tangent_in=0, tangent_out=0, keep_existing_keys=False, change=None):
+        recorder.record_api('MFnAnimCurve.addKeys')
+        if len(times) != len(values):
+            raise ValueError('times and values must have the same length')
+        MAnimCurveChange.record(change, self.node_ref)
+        if not keep_existing_keys:
+            self.curve.clear()
+        for time, value in zip(times, values):
+            self.curve.set_key(time.value, value, tangent_in, tangent_out)
+        scene.attribute_changed(self.node_ref, 'keyTimeValue')
+
+    def remove(self, index, change=None):
+        recorder.record_api('MFnAnimCurve.remove')
+        MAnimCurveChange.record(change, self.node_ref)
+        self.curve.remove(index)
+        scene.attribute_changed(self.node_ref, 'keyTimeValue')
+
+    def setValue(self, index, value, change=None):
+        recorder.record_api('MFnAnimCurve.setValue')
+        MAnimCurveChange.record(change, self.node_ref)
+        key_time = self.curve.keys[index][0]
+        self.curve.keys[index] = (key_time, value)
+        scene.attribute_changed(self.node_ref, 'keyTimeValue')
+
+    def setInTangentType(self, index, tangent_type, change=None):
+        self.curve.in_tangents[index] = tangent_type
+
+    def setOutTangentType(self, index, tangent_type, change=None):
+        self.curve.out_tangents[index] = tangent_type
+
+    def setTangentTypes(self, indices, tangent_in, tangent_out, change=None):
+        for index in indices:
+            self.curve.in_tangents[index] = tangent_in
+            self.curve.out_tangents[index] = tangent_out
+
+    def setIsWeighted(self, weighted, change=None):
+        pass
+
+
+class MAnimControl(object):
+
+    @staticmethod
+    def currentTime():
+        return MTime(scene.current_time)
+
+    @staticmethod
+    def setCurrentTime(time):
+        recorder.record('MAnimControl.setCurrentTime')
+        scene.current_time = time.value
+
+    @staticmethod
+    def minTime():
+        return MTime(scene.playback_range[0])
+
+    @staticmethod
+    def maxTime():
+        return MTime(scene.playback_range[1])
+
+
+class MAnimUtil(object):
+
+    @staticmethod
+    def isAnimated(obj, check_parent=False):
+        node = obj.node if isinstance(obj, MObject) else obj.node_ref
+        return any(dst[0] is node and src[0].curve is not None for dst, src in scene.connections.items())
+
+    @staticmethod
+    def findAnimation(plug):
+        source = scene.source_of(plug.node_ref, plug.attr)
+        if source is not None and source[0].curve is not None:
+            return [MObject(source[0])]
+        return []
+
+
+class MAnimCurveChange(object):
+    # Keeps every curve's keys from before its first edit, and after, to swap them back and forth
+
+    def __init__(self):
+        self.states = {}
+
+    @staticmethod
+    def record(change, node):
+        if change is not None and node not in change.states:
+            change.states[node] = [MAnimCurveChange.state(node.curve), None]
+
+    @staticmethod
+    def state(curve):
+        return list(curve.keys), list(curve.in_tangents), list(curve.out_tangents)
+
+    @staticmethod
+    def restore(node, state):
+        curve = node.curve
+        curve.keys, curve.in_tangents, curve.out_tangents = list(state[0]), list(state[1]), list(state[2])
+        curve.times = [key[0] for key in curve.keys]
+        scene.attribute_changed(node, 'keyTimeValue')
+
+    def undoIt(self):
+        for node, states in self.states.items():
+            states[1] = self.state(node.curve)
+            self.restore(node, states[0])
+
+    def redoIt(self):
+        for node, states in self.states.items():
+            if states[1] is not None:
+                self.restore(node, states[1])
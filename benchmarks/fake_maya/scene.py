@@ -0,0 +1,411 @@
+import bisect
+import collections
+import fnmatch
+import itertools
+import math
+import re
+import time
+
+
+ANGLE_ATTRIBUTES = ('rotateX', 'rotateY', 'rotateZ')
+
+node_ids = itertools.count(1)
+
+TRANSFORM_DEFAULTS = {
+    'translateX': 0.0, 'translateY': 0.0, 'translateZ': 0.0,
+    'rotateX': 0.0, 'rotateY': 0.0, 'rotateZ': 0.0,
+    'scaleX': 1.0, 'scaleY': 1.0, 'scaleZ': 1.0,
+    'visibility': True,
+    'overrideEnabled': False, 'overrideRGBColors': False,
+    'overrideColorR': 0.0, 'overrideColorG': 0.0, 'overrideColorB': 0.0,
+}
+
+SHAPE_DEFAULTS = {
+    'camera': {
+        'focalLength': 35.0,
+        'horizontalFilmAperture': 1.417,
+        'verticalFilmAperture': 0.945,
+        'nearClipPlane': 0.1,
+        'farClipPlane': 10000.0,
+        'displayGateMaskOpacity': 0.7,
+        'displayGateMaskColor': (0.5, 0.5, 0.5),
+        'overscan': 1.0,
+    },
+    'locator': {'localScaleX': 1.0, 'localScaleY': 1.0, 'localScaleZ': 1.0},
+    'nurbsCurve': {},
+    'mesh': {},
+}
+
+DAG_TYPES = {'transform', 'camera', 'locator', 'nurbsCurve', 'mesh', 'aimConstraint'}
+SHAPE_TYPES = {'camera', 'locator', 'nurbsCurve', 'mesh'}
+
+
+class CallRecorder(object):
+    # Counts every fake Maya call and burns a configurable cost per call
+
+    def __init__(self):
+        self.counts = collections.Counter()
+        self.api_counts = collections.Counter()
+        self.cost_per_call = 0.0
+        self.api_cost_per_call = 0.0
+
+    def record(self, name):
+        self.counts[name] += 1
+        if self.cost_per_call:
+            self.burn(self.cost_per_call)
+
+    def record_api(self, name):
+        self.api_counts[name] += 1
+        if self.api_cost_per_call:
+            self.burn(self.api_cost_per_call)
+
+    def burn(self, seconds):
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            pass
+
+    def total(self):
+        return sum(self.counts.values())
+
+    def reset(self):
+        self.counts.clear()
+        self.api_counts.clear()
+
+
+class AnimCurve(object):
+    # Keys are (time, value) pairs stored in internal units (radians for angles)
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.keys = []
+        self.times = []
+        self.in_tangents = []
+        self.out_tangents = []
+
+    def index_of(self, frame):
+        index = bisect.bisect_left(self.times, frame - 1e-6)
+        if index < len(self.times) and abs(self.times[index] - frame) < 1e-6:
+            return index
+        return -1
+
+    def set_key(self, frame, value, in_tangent=0, out_tangent=0):
+        index = self.index_of(frame)
+        if index >= 0:
+            self.keys[index] = (frame, value)
+            self.in_tangents[index] = in_tangent
+            self.out_tangents[index] = out_tangent
+            return
+        index = bisect.bisect_left(self.times, frame)
+        self.keys.insert(index, (frame, value))
+        self.times.insert(index, frame)
+        self.in_tangents.insert(index, in_tangent)
+        self.out_tangents.insert(index, out_tangent)
+
+    def remove(self, index):
+        del self.keys[index]
+        del self.times[index]
+        del self.in_tangents[index]
+        del self.out_tangents[index]
+
+    def evaluate(self, frame):
+        if not self.keys:
+            return 0.0
+        if frame <= self.keys[0][0]:
+            return self.keys[0][1]
+        if frame >= self.keys[-1][0]:
+            return self.keys[-1][1]
+        index = bisect.bisect_right(self.times, frame)
+        (t0, v0), (t1, v1) = self.keys[index - 1], self.keys[index]
+        return v0 + (v1 - v0) * (frame - t0) / (t1 - t0)
+
+
+class Node(object):
+
+    def __init__(self, name, node_type):
+        self.name = name
+        self.type = node_type
+        self.uuid = f'{next(node_ids):08X}-0000-0000-0000-000000000000'
+        self.parent = None
+        self.children = []
+        self.attrs = {}
+        self.alive = True
+        self.curve = AnimCurve() if node_type.startswith('animCurve') else None
+        if node_type == 'transform':
+            self.attrs.update(TRANSFORM_DEFAULTS)
+        elif node_type in SHAPE_DEFAULTS:
+            self.attrs.update(SHAPE_DEFAULTS[node_type])
+            self.attrs.update({'overrideEnabled': False, 'overrideRGBColors': False,
+                               'overrideColorR': 0.0, 'overrideColorG': 0.0, 'overrideColorB': 0.0,
+                               'visibility': True})
+
+    @property
+    def is_dag(self):
+        return self.type in DAG_TYPES
+
+    def full_path(self):
+        parts = []
+        node = self
+        while node is not None:
+            parts.append(node.name)
+            node = node.parent
+        return '|' + '|'.join(reversed(parts))
+
+
+def identity():
+    return [[1.0 if row == col else 0.0 for col in range(4)] for row in range(4)]
+
+
+def mat_mult(a, b):
+    return [[sum(a[row][k] * b[k][col] for k in range(4)) for col in range(4)] for row in range(4)]
+
+
+def compose(translate, rotate, scale):
+    # Row-vector convention, rotate order xyz, matching Maya's matrix layout
+    rx, ry, rz = [math.radians(value) for value in rotate]
+    sx, sy, sz = scale
+    scale_m = [[sx, 0, 0, 0], [0, sy, 0, 0], [0, 0, sz, 0], [0, 0, 0, 1]]
+    rot_x = [[1, 0, 0, 0], [0, math.cos(rx), math.sin(rx), 0], [0, -math.sin(rx), math.cos(rx), 0], [0, 0, 0, 1]]
+    rot_y = [[math.cos(ry), 0, -math.sin(ry), 0], [0, 1, 0, 0], [math.sin(ry), 0, math.cos(ry), 0], [0, 0, 0, 1]]
+    rot_z = [[math.cos(rz), math.sin(rz), 0, 0], [-math.sin(rz), math.cos(rz), 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
+    translate_m = identity()
+    translate_m[3][0:3] = list(translate)
+    matrix = mat_mult(scale_m, rot_x)
+    matrix = mat_mult(matrix, rot_y)
+    matrix = mat_mult(matrix, rot_z)
+    return mat_mult(matrix, translate_m)
+
+
+def decompose_rotation(matrix):
+    # Euler xyz rotation (degrees) of an orthonormalized matrix
+    rows = []
+    for row in matrix[:3]:
+        length = math.sqrt(sum(value * value for value in row[:3])) or 1.0
+        rows.append([value / length for value in row[:3]])
+    ry = math.asin(max(-1.0, min(1.0, -rows[0][2])))
+    if abs(math.cos(ry)) > 1e-6:
+        rx = math.atan2(rows[1][2], rows[2][2])
+        rz = math.atan2(rows[0][1], rows[0][0])
+    else:
+        rx = math.atan2(-rows[2][1], rows[1][1])
+        rz = 0.0
+    return [math.degrees(rx), math.degrees(ry), math.degrees(rz)]
+
+
+def invert(matrix):
+    # General 4x4 inverse through Gauss-Jordan elimination
+    size = 4
+    work = [list(row) + [1.0 if i == j else 0.0 for j in range(size)] for i, row in enumerate(matrix)]
+    for col in range(size):
+        pivot = max(range(col, size), key=lambda row: abs(work[row][col]))
+        work[col], work[pivot] = work[pivot], work[col]
+        divisor = work[col][col] or 1e-12
+        work[col] = [value / divisor for value in work[col]]
+        for row in range(size):
+            if row != col:
+                factor = work[row][col]
+                work[row] = [a - factor * b for a, b in zip(work[row], work[col])]
+    return [row[size:] for row in work]
+
+
+class Scene(object):
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self, new_file=False):
+        # A new file keeps loaded plugins and every callback that is not tied to a node
+        self.nodes = collections.OrderedDict()
+        self.connections = {}
+        self.current_time = 1.0
+        self.playback_range = [1.0, 120.0]
+        self.selection = []
+        self.undo_chunks = 0
+        self.open_undo_chunks = 0
+        self.refresh_suspended = False
+        self.option_vars = {}
+        if new_file:
+            for message, entries in self.callbacks.items():
+                self.callbacks[message] = [entry for entry in entries if entry[3] is None]
+        else:
+            self.ui = {}
+            self.callbacks = collections.defaultdict(list)
+            self.next_callback_id = 1
+            self.plugins = set()
+            self.node_classes = {}
+        for name in ('persp', 'top', 'front', 'side'):
+            transform = self.create_node('transform', name)
+            self.create_node('camera', f'{name}Shape', parent=transform)
+        self.create_node('time', 'time1')
+
+    # Naming
+
+    def unique_name(self, name):
+        if name not in self.nodes:
+            return name
+        base = re.sub(r'\d+$', '', name)
+        index = 1
+        while f'{base}{index}' in self.nodes:
+            index += 1
+        return f'{base}{index}'
+
+    # Lookup
+
+    def find(self, name):
+        if name is None:
+            return None
+        if isinstance(name, Node):
+            return name if name.alive else None
+        name = str(name)
+        if '.' in name:
+            name = name.split('.', 1)[0]
+        short = name.rsplit('|', 1)[-1]
+        node = self.nodes.get(short)
+        return node
+
+    def get(self, name):
+        node = self.find(name)
+        if node is None:
+            raise ValueError(f"No object matches name: {name}")
+        return node
+
+    def ls(self, pattern=None, node_type=None):
+        result = []
+        for node in self.nodes.values():
+            if pattern is not None and not fnmatch.fnmatchcase(node.name, pattern):
+                continue
+            if node_type is not None and node.type not in node_type:
+                continue
+            result.append(node)
+        return result
+
+    # Graph edits
+
+    def create_node(self, node_type, name=None, parent=None):
+        name = self.unique_name(name or f'{node_type}1')
+        node = Node(name, node_type)
+        self.nodes[name] = node
+        if parent is not None:
+            self.reparent(node, parent)
+        self.emit('nodeAdded', node)
+        return node
+
+    def register_node(self, node, parent=None):
+        node.name = self.unique_name(node.name)
+        self.nodes[node.name] = node
+        if parent is not None:
+            self.reparent(node, parent)
+        self.emit('nodeAdded', node)
+
+    def delete_node(self, node):
+        for child in list(node.children):
+            self.delete_node(child)
+        if node.parent is not None:
+            node.parent.children.remove(node)
+        for dest, src in list(self.connections.items()):
+            if dest[0] is node or src[0] is node:
+                del self.connections[dest]
+        self.emit('nodeRemoved', node)
+        node.alive = False
+        self.nodes.pop(node.name, None)
+        if node in self.selection:
+            self.selection.remove(node)
+
+    def rename(self, node, new_name):
+        old_name = node.name
+        del self.nodes[node.name]
+        node.name = self.unique_name(new_name)
+        self.nodes[node.name] = node
+        self.emit('nameChanged', node, old_name)
+        return node.name
+
+    def reparent(self, node, parent):
+        if node.parent is not None:
+            node.parent.children.remove(node)
+        node.parent = parent
+        if parent is not None:
+            parent.children.append(node)
+        self.emit('parentChanged', node)
+
+    def connect(self, src_node, src_attr, dst_node, dst_attr):
+        self.connections[(dst_node, dst_attr)] = (src_node, src_attr)
+
+    def source_of(self, node, attr):
+        return self.connections.get((node, attr))
+
+    # Callbacks
+
+    def add_callback(self, message, function, client_data=None, node=None):
+        callback_id = self.next_callback_id
+        self.next_callback_id += 1
+        self.callbacks[message].append((callback_id, function, client_data, node))
+        return callback_id
+
+    def remove_callback(self, callback_id):
+        for message, entries in self.callbacks.items():
+            self.callbacks[message] = [entry for entry in entries if entry[0] != callback_id]
+
+    def emit(self, message, node, *extra):
+        if not self.callbacks.get(message):
+            return
+        from . import open_maya as OpenMaya
+        for _, function, client_data, watched in list(self.callbacks.get(message, [])):
+            if watched is not None and watched is not node:
+                continue
+            if message == 'nameChanged':
+                function(OpenMaya.MObject(node), extra[0], client_data)
+            elif message == 'attributeChanged':
+                function(extra[0], OpenMaya.MPlug(node, extra[1]), OpenMaya.MPlug(), client_data)
+            else:
+                function(OpenMaya.MObject(node), client_data)
+
+    def emit_scene(self, message):
+        for _, function, client_data, _ in list(self.callbacks.get(f'scene{message}', [])):
+            function(client_data)
+
+    def emit_event(self, event):
+        for _, function, client_data, _ in list(self.callbacks.get(f'event:{event}', [])):
+            function(client_data)
+
+    def attribute_changed(self, node, attr):
+        if self.callbacks.get('attributeChanged'):
+            from . import open_maya as OpenMaya
+            self.emit('attributeChanged', node, OpenMaya.MNodeMessage.kAttributeSet, attr)
+
+    # Evaluation
+
+    def value(self, node, attr, frame=None):
+        frame = self.current_time if frame is None else frame
+        source = self.source_of(node, attr)
+        if source is not None and source[0].curve is not None:
+            value = source[0].curve.evaluate(frame)
+            return math.degrees(value) if attr in ANGLE_ATTRIBUTES else value
+        return node.attrs.get(attr, 0.0)
+
+    def local_matrix(self, node, frame=None):
+        if node.type != 'transform':
+            return identity()
+        translate = [self.value(node, f'translate{axis}', frame) for axis in 'XYZ']
+        rotate = [self.value(node, f'rotate{axis}', frame) for axis in 'XYZ']
+        scale = [self.value(node, f'scale{axis}', frame) for axis in 'XYZ']
+        return compose(translate, rotate, scale)
+
+    def world_matrix(self, node, frame=None):
+        matrix = self.local_matrix(node, frame)
+        parent = node.parent
+        while parent is not None:
+            matrix = mat_mult(matrix, self.local_matrix(parent, frame))
+            parent = parent.parent
+        return matrix
+
+    def set_world_matrix(self, node, matrix):
+        parent_matrix = self.world_matrix(node.parent) if node.parent is not None else identity()
+        local = mat_mult(matrix, invert(parent_matrix))
+        node.attrs['translateX'], node.attrs['translateY'], node.attrs['translateZ'] = local[3][0:3]
+        rotation = decompose_rotation(local)
+        node.attrs['rotateX'], node.attrs['rotateY'], node.attrs['rotateZ'] = rotation
+
+
+scene = Scene()
+recorder = CallRecorder()
@@ -0,0 +1,290 @@
+# Measures how many Maya calls each tool makes against an in-memory fake Maya.
+#
+#   python benchmarks/run_benchmarks.py --cameras 10 --frames 120
+#
+# Exits with an error when a tool makes more calls than recorded in baseline.json.
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.dirname(BENCHMARK_DIR), BENCHMARK_DIR]
+
+import fake_maya
+
+scene, recorder = fake_maya.install()
+
+import maya.cmds as cmds
+
+from camera_tools import aim, coverage, layout, lens, noise, profiling, renumber, rig, scene_batch, shake, shake_node, smoothing, ui, undo
+
+
+BASELINE_PATH = os.path.join(BENCHMARK_DIR, 'baseline.json')
+COVERAGE_OBJECTS = 100
+BATCH_SCENES = 4
+BATCH_WORKERS = 2
+LAYOUT_PATH = os.path.join(tempfile.gettempdir(), 'camera_tools_benchmark.camlayout')
+
+BENCHMARKS = {}
+profiled_operations = []
+
+def benchmark(function):
+    BENCHMARKS[function.__name__] = function
+    return function
+
+def new_scene(cameras, frames):
+    # Start from an empty scene with no windows open
+    if ui.camera_list_panel is not None:
+        ui.camera_list_panel.close()
+        ui.camera_list_panel = None
+    scene.ui.clear()
+    cmds.file(new=True, force=True)
+    cmds.playbackOptions(minTime=1, maxTime=frames)
+
+    if not cameras:
+        return []
+    return rig.create_cameras([{'position': (index * 10, 0, 0)} for index in range(cameras)])
+
+# Every benchmark builds its scene and returns the operation to measure
+
+@benchmark
+def create_camera(cameras, frames):
+    new_scene(0, frames)
+    return lambda: [rig.create_camera(1) for _ in range(cameras)]
+
+@benchmark
+def create_cameras(cameras, frames):
+    new_scene(0, frames)
+    return lambda: rig.create_cameras([{'scale': 1} for _ in range(cameras)])
+
+@benchmark
+def bake_noise_on_selected_objects(cameras, frames):
+    camera_names = new_scene(cameras, frames)
+    cmds.select([f'{camera_name}_Shake_CTL' for camera_name in camera_names])
+    return lambda: noise.bake_noise_on_selected_objects(1, 1, 1, 1, False, 0, 0, True, 10)
+
+@benchmark
+def enable_live_noise(cameras, frames):
+    camera_names = new_scene(cameras, frames)
+    controls = [f'{camera_name}_Shake_CTL' for camera_name in camera_names]
+    return lambda: shake.enable_live_noise(controls, 1, 1, 1, False, 0, 0, True, 10)
+
+@benchmark
+def bake_live_noise(cameras, frames):
+    camera_names = new_scene(cameras, frames)
+    controls = [f'{camera_name}_Shake_CTL' for camera_name in camera_names]
+    shake.enable_live_noise(controls, 1, 1, 1, False, 0, 0, True, 10)
+    return lambda: shake.bake_live_noise(controls)
+
+@benchmark
+def smooth_selected_rigs(cameras, frames):
+    # Baked shake and a moving main control on every rig
+    camera_names = new_scene(cameras, frames)
+    noise.bake_noise_on_objects([f'{camera_name}_Shake_CTL' for camera_name in camera_names], 1, 1, 1, 1, False, 0, 0, False, 0)
+    for camera_name in camera_names:
+        for frame in range(1, frames + 1, 10):
+            cmds.setKeyframe(f'{camera_name}_Main', attribute='translateX', time=frame, value=frame * 0.1 + frame % 20)
+    cmds.select(camera_names)
+    return lambda: smoothing.smooth_selected_rigs('gaussian', 3.0)
+
+@benchmark
+def set_camera_aim(cameras, frames):
+    cmds.select(new_scene(cameras, frames))
+    return aim.set_camera_aim
+
+@benchmark
+def set_camera_focal_length(cameras, frames):
+    cmds.select(new_scene(cameras, frames))
+    return lambda: lens.set_camera_focal_length(50)
+
+@benchmark
+def key_focal_length(cameras, frames):
+    cmds.select(new_scene(cameras, frames))
+    return lens.key_focal_length
+
+@benchmark
+def solve_dolly_zoom(cameras, frames):
+    # Every camera keeps the same subject framed as its rig moves toward it
+    camera_names = new_scene(cameras, frames)
+    subject = cmds.createNode('transform', name='subject')
+    cmds.setAttr(f'{subject}.translateZ', -100)
+    for camera_name in camera_names:
+        cmds.setKeyframe(f'{camera_name}_Main', attribute='translateZ', time=1, value=0)
+        cmds.setKeyframe(f'{camera_name}_Main', attribute='translateZ', time=frames, value=-50)
+    return lambda: lens.solve_dolly_zoom(camera_names, subject)
+
+@benchmark
+def resequence_cameras(cameras, frames):
+    # Spread out numbers compacted back to 10, 20, 30...
+    new_scene(0, frames)
+    rig.create_cameras([{'number': 10 + index * 30} for index in range(cameras)])
+    return renumber.resequence_cameras
+
+@benchmark
+def export_camera_layout(cameras, frames):
+    camera_names = new_scene(cameras, frames)
+    noise.bake_noise_on_objects([f'{camera_name}_Shake_CTL' for camera_name in camera_names], 1, 1, 1, 1, False, 0, 0, False, 0)
+    return lambda: layout.export_camera_layout(LAYOUT_PATH)
+
+@benchmark
+def import_camera_layout(cameras, frames):
+    export_camera_layout(cameras, frames)()
+    new_scene(0, frames)
+    return lambda: layout.import_camera_layout(LAYOUT_PATH)
+
+@benchmark
+def analyze_camera_coverage(cameras, frames):
+    new_scene(cameras, frames)
+    objects = [cmds.createNode('transform', name=f'asset{index}') for index in range(COVERAGE_OBJECTS)]
+    return lambda: coverage.analyze_camera_coverage(objects=objects)
+
+@benchmark
+def analyze_camera_coverage_cached(cameras, frames):
+    # The same query again, camera matrices come from the trajectory store
+    analyze = analyze_camera_coverage(cameras, frames)
+    analyze()
+    return analyze
+
+@benchmark
+def process_scenes(cameras, frames):
+    # Scene batch with stand-in workers running on the fake Maya, the calls are made in the workers
+    operations = [
+        {'op': 'add_rigs', 'cameras': [{'position': (index * 10, 0, 0)} for index in range(cameras)]},
+        {'op': 'bake_noise', 'x': 1, 'y': 1, 'z': 1, 'start': 1, 'end': frames},
+        {'op': 'recolor', 'color': (0, 1, 0)},
+    ]
+    scenes = [f'shot{index}.ma' for index in range(BATCH_SCENES)]
+
+    def run():
+        report = scene_batch.process_scenes(scenes, operations, workers=BATCH_WORKERS, setup=fake_maya.install)
+        if report['failed']:
+            raise RuntimeError('\n'.join(result['error'] for result in report['scenes'] if result['error']))
+
+    return run
+
+@benchmark
+def show_camera_ui(cameras, frames):
+    new_scene(cameras, frames)
+    return ui.show_camera_ui
+
+def run_benchmark(name, cameras, frames, repeat):
+    best_time = None
+
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            operation = BENCHMARKS[name](cameras, frames)
+            recorder.reset()
+            profiling.reset()
+            start_time = time.perf_counter()
+            operation()
+            elapsed = time.perf_counter() - start_time
+
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+
+    # Keep the profiled operations of the last run
+    profiled_operations.extend(profiling.events)
+
+    return {
+        'commands': recorder.total(),
+        'api_calls': sum(recorder.api_counts.values()),
+        'command_counts': dict(recorder.counts.most_common()),
+        'seconds': best_time,
+    }
+
+def print_results(results, cameras, frames):
+    print(f"{cameras} camera(s) x {frames} frame(s)")
+    print(f"{'benchmark':<34}{'commands':>10}{'per camera':>12}{'api calls':>11}{'ms':>10}")
+    for name, result in results.items():
+        print(f"{name:<34}{result['commands']:>10}{result['commands'] / max(cameras, 1):>12.1f}"
+              f"{result['api_calls']:>11}{result['seconds'] * 1000:>10.2f}")
+
+def check_baseline(results, baseline):
+    # Only call counts are compared, wall time depends on the machine
+    failures = []
+
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            print(f"{name}: no baseline recorded")
+            continue
+        for key in ('commands', 'api_calls'):
+            if result[key] > expected[key]:
+                failures.append(f"{name}: {key} went up from {expected[key]} to {result[key]}")
+            elif result[key] < expected[key]:
+                print(f"{name}: {key} went down from {expected[key]} to {result[key]}, update the baseline to keep it")
+
+    return failures
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Count the Maya calls made by the camera tools.")
+    parser.add_argument('--cameras', type=int, default=10, help="Number of cameras in the scene")
+    parser.add_argument('--frames', type=int, default=120, help="Length of the playback range")
+    parser.add_argument('--cost', type=float, default=0.0, help="Simulated seconds spent in every command")
+    parser.add_argument('--api-cost', type=float, default=0.0, help="Simulated seconds spent in every API call")
+    parser.add_argument('--repeat', type=int, default=1, help="Runs per benchmark, the fastest is reported")
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), help="Benchmarks to run")
+    parser.add_argument('--update-baseline', action='store_true', help="Record the current call counts as the baseline")
+    parser.add_argument('--json', help="Write the results to this file")
+    parser.add_argument('--profile', metavar='TRACE', help="Profile the last run of every benchmark and write a Chrome trace to this file")
+    args = parser.parse_args(argv)
+
+    # Load the plugins and the label glyphs up front so the first benchmark is not charged for them
+    cmds.loadPlugin(undo.__file__, quiet=True)
+    cmds.loadPlugin(shake_node.__file__, quiet=True)
+    rig.get_label_glyphs()
+
+    recorder.cost_per_call = args.cost
+    recorder.api_cost_per_call = args.api_cost
+
+    if args.profile:
+        profiling.start()
+
+    names = args.only or list(BENCHMARKS)
+    results = {name: run_benchmark(name, args.cameras, args.frames, max(args.repeat, 1)) for name in names}
+    print_results(results, args.cameras, args.frames)
+
+    if args.profile:
+        profiling.stop()
+        profiling.events[:] = profiled_operations
+        print()
+        profiling.print_summary()
+        profiling.write_chrome_trace(args.profile)
+
+    if args.json:
+        with open(args.json, 'w') as json_file:
+            json.dump(results, json_file, indent=2)
+
+    # Baselines are kept per scene size
+    size = f'{args.cameras}x{args.frames}'
+    baselines = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as json_file:
+            baselines = json.load(json_file)
+
+    if args.update_baseline:
+        recorded = baselines.setdefault(size, {})
+        for name, result in results.items():
+            recorded[name] = {'commands': result['commands'], 'api_calls': result['api_calls']}
+        with open(BASELINE_PATH, 'w') as json_file:
+            json.dump(baselines, json_file, indent=2, sort_keys=True)
+            json_file.write('\n')
+        print(f"Baseline for {size} written to '{BASELINE_PATH}'.")
+        return 0
+
+    if size not in baselines:
+        print(f"No baseline recorded for {size}.")
+        return 0
+
+    failures = check_baseline(results, baselines[size])
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
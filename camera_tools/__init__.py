@@ -0,0 +1,44 @@
+import importlib
+
+
+# Public functions and the module that defines them. Modules are only imported
+# when one of their functions is first used, so importing the package in mayapy
+# never builds any UI.
+EXPORTS = {
+    'create_camera': 'rig',
+    'create_cameras': 'rig',
+    'get_next_camera_number': 'rig',
+    'resolve_selected_cameras': 'lens',
+    'set_camera_focal_length': 'lens',
+    'set_focal_length': 'lens',
+    'key_focal_length': 'lens',
+    'solve_dolly_zoom': 'lens',
+    'get_noise_curve': 'noise',
+    'bake_noise_on_objects': 'noise',
+    'bake_noise_on_selected_objects': 'noise',
+    'enable_live_noise': 'shake',
+    'disable_live_noise': 'shake',
+    'bake_live_noise': 'shake',
+    'set_camera_aim': 'aim',
+    'smooth_animation': 'smoothing',
+    'smooth_selected_rigs': 'smoothing',
+    'resequence_cameras': 'renumber',
+    'analyze_camera_coverage': 'coverage',
+    'export_camera_layout': 'layout',
+    'process_scenes': 'scene_batch',
+    'import_camera_layout': 'layout',
+    'show_camera_ui': 'ui',
+}
+
+__all__ = sorted(EXPORTS)
+
+def __getattr__(name):
+    if name not in EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f'.{EXPORTS[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(EXPORTS))
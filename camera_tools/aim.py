@@ -0,0 +1,192 @@
+import maya.cmds as cmds
+from maya.api import OpenMaya as om
+import numpy as np
+
+from . import batch
+from . import profiling
+from . import undo
+from .lens import resolve_selected_cameras
+from .nodes import get_dag_path, get_node, queue_attributes, queue_override_color
+from .trajectory import unscaled_axes
+
+
+# Aim locators are placed along the camera's Z axis and drawn at this size
+AIM_LOCATOR_DISTANCE = -5
+AIM_LOCATOR_SCALE = 15
+
+def compute_aim_locator_matrices(camera_matrices, parent_matrix):
+    # Locator matrices for every camera at once, relative to the locator group
+    matrices = np.asarray(camera_matrices, dtype=float).reshape(-1, 4, 4)
+    locators = matrices.copy()
+
+    # Match the camera orientation without its scale, pushed along the camera's Z axis
+    locators[:, :3, :3] = unscaled_axes(matrices)
+    locators[:, 3, :3] = matrices[:, 3, :3] + matrices[:, 2, :3] * AIM_LOCATOR_DISTANCE
+
+    return locators @ np.linalg.inv(np.asarray(parent_matrix, dtype=float).reshape(4, 4))
+
+def matrices_to_euler_xyz(matrices):
+    # Rotate order xyz Euler angles in degrees for a stack of orthonormal matrices
+    rotate_y = np.arcsin(np.clip(-matrices[:, 0, 2], -1.0, 1.0))
+    rotate_x = np.arctan2(matrices[:, 1, 2], matrices[:, 2, 2])
+    rotate_z = np.arctan2(matrices[:, 0, 1], matrices[:, 0, 0])
+    return np.degrees(np.stack([rotate_x, rotate_y, rotate_z], axis=1))
+
+def queue_locator_group(modifier):
+    # Locators live under LOC_GRP, which is queued under CAM_GRP when it does not exist yet
+    locator_group = get_node('LOC_GRP')
+    if locator_group is None:
+        camera_group = get_node('CAM_GRP')
+        locator_group = modifier.createNode('transform', camera_group if camera_group is not None else om.MObject.kNullObj)
+        modifier.renameNode(locator_group, 'LOC_GRP')
+    return locator_group
+
+def queue_aim_locator(modifier, locator_group, locator_name, position, rotation, color=None, scale=AIM_LOCATOR_SCALE):
+    locator = modifier.createNode('transform', locator_group)
+    modifier.renameNode(locator, locator_name)
+    queue_attributes(modifier, locator, {
+        'translateX': position[0], 'translateY': position[1], 'translateZ': position[2],
+        'rotateX': rotation[0], 'rotateY': rotation[1], 'rotateZ': rotation[2],
+    })
+
+    locator_shape = modifier.createNode('locator', locator)
+    modifier.renameNode(locator_shape, f"{locator_name}Shape")
+    queue_attributes(modifier, locator_shape, {'localScaleX': scale, 'localScaleY': scale, 'localScaleZ': scale})
+    if color is not None:
+        queue_override_color(modifier, locator_shape, color)
+
+    return locator
+
+@profiling.profiled
+@batch.batched
+def set_camera_aim(bulk=True):
+    if not bulk:
+        set_camera_aim_per_camera()
+        return
+
+    camera_shapes = resolve_selected_cameras()
+    if not camera_shapes:
+        cmds.warning("Please select a camera or an object that has a camera as a child.")
+        return
+
+    # One entry per camera transform, keeping the first camera shape found under it
+    cameras = {}
+    for camera_shape in camera_shapes:
+        shape_path = get_dag_path(camera_shape)
+        transform_path = om.MDagPath(shape_path)
+        transform_path.pop()
+        cameras.setdefault(transform_path.fullPathName(), (transform_path, shape_path))
+    profiling.note(objects=len(cameras))
+
+    # A new LOC_GRP sits at the origin of CAM_GRP
+    parent_group = get_node('LOC_GRP')
+    if parent_group is None:
+        parent_group = get_node('CAM_GRP')
+    parent_matrix = om.MFnDagNode(parent_group).getPath().inclusiveMatrix() if parent_group is not None else om.MMatrix()
+
+    # Read every world matrix, then place all the locators with one array operation
+    camera_matrices = [list(transform_path.inclusiveMatrix()) for transform_path, _ in cameras.values()]
+    locator_matrices = compute_aim_locator_matrices(camera_matrices, list(parent_matrix))
+    locator_positions = locator_matrices[:, 3, :3].tolist()
+    locator_rotations = matrices_to_euler_xyz(locator_matrices).tolist()
+
+    modifier = om.MDagModifier()
+    locator_group = queue_locator_group(modifier)
+
+    locators = []
+    for (transform_path, shape_path), position, rotation in zip(cameras.values(), locator_positions, locator_rotations):
+        # Sample the camera's override color and apply it to the locator
+        camera_fn = om.MFnDependencyNode(shape_path.node())
+        color = None
+        if camera_fn.findPlug('overrideEnabled', False).asBool():
+            color = [camera_fn.findPlug(f'overrideColor{channel}', False).asDouble() for channel in 'RGB']
+
+        locator_name = f"{transform_path.partialPathName().split('|')[-1]}_Loc"
+        locator = queue_aim_locator(modifier, locator_group, locator_name, position, rotation, color)
+        locators.append((locator, transform_path))
+
+    undo.apply_modifier(modifier)
+
+    # Aim constraint each camera to its locator
+    for locator, transform_path in locators:
+        locator_name = om.MFnDagNode(locator).fullPathName()
+        cmds.aimConstraint(locator_name, transform_path.fullPathName(), aim=[1, 0, 0], upVector=[0, 1, 0], worldUpType="vector", maintainOffset=True)
+
+    print(f"Added aim locators to {len(locators)} camera(s).")
+
+def set_camera_aim_per_camera():
+    # Check if any objects are selected
+    selected_objects = cmds.ls(selection=True, type='transform')
+    if not selected_objects:
+        cmds.warning("No objects selected.")
+        return
+    
+    for obj in selected_objects:
+        # Check if the selected object has a child camera
+        camera_shapes = cmds.listRelatives(obj, allDescendents=True, type='camera', fullPath=True)
+        if not camera_shapes:
+            cmds.warning(f"No camera shape nodes found in {obj}.")
+            continue
+        
+        # Get the transform node of the camera
+        cam_transform = cmds.listRelatives(camera_shapes[0], parent=True, fullPath=True)[0]
+        
+        # Get camera position and rotation
+        cam_pos = cmds.xform(cam_transform, query=True, translation=True, worldSpace=True)
+        cam_rot = cmds.xform(cam_transform, query=True, rotation=True, worldSpace=True)
+
+        # Get the transform node of the camera
+        cam_transform = cmds.listRelatives(camera_shapes[0], parent=True, fullPath=False)[0]
+        
+        # Create a locator and name it after the camera (use the short name of the transform)
+        locator_name = cmds.spaceLocator(name=f"{cam_transform}_Loc")[0]
+        
+        # Move locator to camera position
+        cmds.xform(locator_name, translation=cam_pos, worldSpace=True)
+        
+        # Rotate locator to match camera rotation
+        cmds.xform(locator_name, rotation=cam_rot, worldSpace=True)
+
+        # Move locator forward along the camera's Z axis
+        forward_vector = om.MVector(0, 0, 1)
+        cam_matrix = cmds.getAttr(f"{cam_transform}.wm")
+        cam_matrix = om.MMatrix(cam_matrix)
+        forward_vector = forward_vector * cam_matrix
+        
+        # Calculate new position for the locator (+20 in the Z direction)
+        new_loc_pos = [cam_pos[0] + forward_vector.x * -5,
+                       cam_pos[1] + forward_vector.y * -5,
+                       cam_pos[2] + forward_vector.z * -5]
+
+        # Move the locator to the new position
+        cmds.xform(locator_name, translation=new_loc_pos, worldSpace=True)
+                
+        # Set the locator size
+        cmds.setAttr(f"{locator_name}.localScaleX", 15)
+        cmds.setAttr(f"{locator_name}.localScaleY", 15)
+        cmds.setAttr(f"{locator_name}.localScaleZ", 15)
+
+        # Aim constraint the camera to the locator
+        cmds.aimConstraint(locator_name, cam_transform, aim=[1, 0, 0], upVector=[0, 1, 0], worldUpType="vector", maintainOffset=True)
+        
+        # Check if the camera group exists; if not, create it
+        if not cmds.objExists('LOC_GRP'):
+            cmds.group(locator_name, name='LOC_GRP')
+            cmds.parent('LOC_GRP', 'CAM_GRP')
+        else:
+            cmds.parent(locator_name, 'LOC_GRP')
+        
+        # Sample the camera's override color and apply it to the locator
+        camera_shape = camera_shapes[0]
+        
+        # Check if the camera override is enabled and query the color
+        override_enabled = cmds.getAttr(f"{camera_shape}.overrideEnabled")
+        if override_enabled:
+            # Sample the camera's override color attributes
+            color_r = cmds.getAttr(f"{camera_shape}.overrideColorR")
+            color_g = cmds.getAttr(f"{camera_shape}.overrideColorG")
+            color_b = cmds.getAttr(f"{camera_shape}.overrideColorB")
+            
+            # Apply the same color to the locator
+            locator_shape = cmds.listRelatives(locator_name, shapes=True, fullPath=True)[0]
+            batch.set_override_color(locator_shape, [color_r, color_g, color_b])
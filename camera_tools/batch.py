@@ -0,0 +1,95 @@
+import contextlib
+import functools
+
+import maya.cmds as cmds
+from maya.api import OpenMaya as om
+
+from . import undo
+from .nodes import get_node, override_color_values, queue_attributes
+
+
+depth = 0  # Batch edits currently open, only the outermost one touches Maya's state
+pending = {}  # node hash -> [MObjectHandle, {attribute: value}], written when the outermost batch ends
+
+@contextlib.contextmanager
+def batch_edit(name):
+    # One undo chunk with the viewport and autokey paused, attribute writes queued with
+    # set_attributes are applied together as the batch closes
+    global depth
+
+    depth += 1
+    if depth > 1:
+        try:
+            yield
+        finally:
+            depth -= 1
+        return
+
+    # Only the steps that were done are undone, whichever of them fails
+    chunk_open = False
+    resume_refresh = False
+    restore_auto_key = False
+    try:
+        cmds.undoInfo(openChunk=True, chunkName=name)
+        chunk_open = True
+        if not cmds.refresh(query=True, suspend=True):
+            cmds.refresh(suspend=True)
+            resume_refresh = True
+        if cmds.autoKeyframe(query=True, state=True):
+            cmds.autoKeyframe(state=False)
+            restore_auto_key = True
+        yield
+    finally:
+        try:
+            flush_attributes()
+        finally:
+            depth -= 1
+            try:
+                if restore_auto_key:
+                    cmds.autoKeyframe(state=True)
+                if resume_refresh:
+                    cmds.refresh(suspend=False)
+            finally:
+                if chunk_open:
+                    cmds.undoInfo(closeChunk=True)
+
+def batched(function):
+    # Run a tool entry point inside a batch edit named after it
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        with batch_edit(function.__name__):
+            return function(*args, **kwargs)
+
+    return wrapper
+
+def set_attributes(node, values):
+    # Set attributes on a node by name or MObject, deferred to the end of the batch when one is open.
+    # Later writes to the same attribute replace earlier ones.
+    if not isinstance(node, om.MObject):
+        node = get_node(node)
+        if node is None:
+            return
+
+    if not depth:
+        modifier = om.MDGModifier()
+        queue_attributes(modifier, node, values)
+        undo.apply_modifier(modifier)
+        return
+
+    handle = om.MObjectHandle(node)
+    pending.setdefault(handle.hashCode(), [handle, {}])[1].update(values)
+
+def set_override_color(node, color):
+    set_attributes(node, override_color_values(color))
+
+def flush_attributes():
+    # Write every queued attribute with one modifier, nodes deleted since are skipped
+    if not pending:
+        return
+
+    modifier = om.MDGModifier()
+    for handle, values in pending.values():
+        if handle.isValid():
+            queue_attributes(modifier, handle.object(), values)
+    pending.clear()
+    undo.apply_modifier(modifier)
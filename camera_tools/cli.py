@@ -0,0 +1,135 @@
+import argparse
+import csv
+import json
+import os
+
+
+# CSV shot lists have one row per camera, rows with the same shot build one scene
+CSV_FLOAT_COLUMNS = ['tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'scale', 'focal_length',
+                     'noise_x', 'noise_y', 'noise_z', 'frequency', 'ease']
+CSV_INT_COLUMNS = ['start', 'end', 'seed', 'bake_steps']
+
+def read_csv_shots(path):
+    shots = {}
+
+    with open(path, newline='') as csv_file:
+        for row in csv.DictReader(csv_file):
+            values = {key.strip(): value.strip() for key, value in row.items() if key and value and value.strip()}
+            for column in CSV_FLOAT_COLUMNS:
+                if column in values:
+                    values[column] = float(values[column])
+            for column in CSV_INT_COLUMNS:
+                if column in values:
+                    values[column] = int(float(values[column]))
+
+            shot_name = values.get('shot', 'shot')
+            shot = shots.setdefault(shot_name, {'name': shot_name, 'cameras': []})
+            if 'output' in values:
+                shot['output'] = values['output']
+            if 'start' in values and 'end' in values:
+                shot['frame_range'] = [values['start'], values['end']]
+
+            camera = {
+                'position': [values.get('tx', 0.0), values.get('ty', 0.0), values.get('tz', 0.0)],
+                'rotation': [values.get('rx', 0.0), values.get('ry', 0.0), values.get('rz', 0.0)],
+                'scale': values.get('scale', 1.0),
+            }
+            if 'focal_length' in values:
+                camera['focal_length'] = values['focal_length']
+            if any(values.get(f'noise_{axis}') for axis in 'xyz'):
+                camera['noise'] = {
+                    'x': values.get('noise_x', 0.0),
+                    'y': values.get('noise_y', 0.0),
+                    'z': values.get('noise_z', 0.0),
+                    'seed': values.get('seed', 0),
+                    'frequency': values.get('frequency', 0.2),
+                    'bake_steps': values.get('bake_steps', 1),
+                    'ease': values.get('ease', 0.0),
+                }
+            shot['cameras'].append(camera)
+
+    return list(shots.values())
+
+def load_shot_list(path):
+    # JSON is either {"shots": [...]} or a plain list of shots, CSV is one row per camera
+    if os.path.splitext(path)[1].lower() == '.csv':
+        return read_csv_shots(path)
+
+    with open(path) as json_file:
+        data = json.load(json_file)
+
+    return data['shots'] if isinstance(data, dict) else data
+
+def build_shot(shot, output_dir=None):
+    import maya.cmds as cmds
+    from .lens import set_focal_length
+    from .noise import bake_noise_on_objects
+    from .rig import create_cameras
+
+    cmds.file(new=True, force=True)
+
+    frame_range = shot.get('frame_range')
+    if frame_range:
+        cmds.playbackOptions(minTime=frame_range[0], maxTime=frame_range[1])
+
+    cameras = shot.get('cameras') or []
+    camera_names = create_cameras(cameras)
+
+    # Cameras sharing a focal length are set together
+    focal_lengths = {}
+    for camera, camera_name in zip(cameras, camera_names):
+        if camera.get('focal_length'):
+            focal_lengths.setdefault(float(camera['focal_length']), []).append(f'{camera_name}_Cam')
+    for focal_length, camera_shapes in focal_lengths.items():
+        set_focal_length(camera_shapes, focal_length)
+
+    for camera, camera_name in zip(cameras, camera_names):
+        noise = camera.get('noise')
+        if not noise:
+            continue
+        ease_value = float(noise.get('ease', 0.0))
+        bake_noise_on_objects([f'{camera_name}_Shake_CTL'], noise.get('x', 0.0), noise.get('y', 0.0), noise.get('z', 0.0),
+                              int(noise.get('bake_steps', 1)), bool(frame_range),
+                              frame_range[0] if frame_range else 0, frame_range[1] if frame_range else 0,
+                              ease_value > 0, ease_value,
+                              seed=int(noise.get('seed', 0)), frequency=float(noise.get('frequency', 0.2)),
+                              octaves=int(noise.get('octaves', 3)), key_tolerance=float(noise.get('key_tolerance', 0.0)))
+
+    output = shot.get('output') or f"{shot.get('name', 'shot')}.ma"
+    if output_dir:
+        output = os.path.join(output_dir, output)
+    output = os.path.abspath(output)
+
+    cmds.file(rename=output)
+    cmds.file(save=True, force=True, type='mayaBinary' if output.lower().endswith('.mb') else 'mayaAscii')
+
+    print(f"Saved {len(camera_names)} camera(s) to '{output}'.")
+    return output
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='mayapy -m camera_tools', description="Build camera layouts from a JSON or CSV shot list.")
+    parser.add_argument('shot_list', help="JSON or CSV file describing the shots to build")
+    parser.add_argument('--output-dir', help="Directory the scenes are saved to, defaults to the paths in the shot list")
+    parser.add_argument('--profile', metavar='TRACE', help="Profile the tools and write a Chrome trace to this file")
+    args = parser.parse_args(argv)
+
+    shots = load_shot_list(args.shot_list)
+
+    import maya.standalone
+    maya.standalone.initialize(name='python')
+    try:
+        from . import profiling
+        if args.profile:
+            profiling.start()
+
+        for shot in shots:
+            build_shot(shot, args.output_dir)
+
+        if args.profile:
+            profiling.stop()
+            profiling.print_summary()
+            profiling.write_chrome_trace(args.profile)
+    finally:
+        maya.standalone.uninitialize()
+
+    return 0
@@ -0,0 +1,159 @@
+import csv
+
+import maya.cmds as cmds
+from maya.api import OpenMaya as om
+import numpy as np
+
+from . import profiling
+from . import registry
+from .nodes import evaluation_time, get_dag_path
+from .trajectory import get_trajectory_store, unscaled_axes
+
+
+# Frames culled at once per camera, bounds the size of the temporary arrays
+COVERAGE_FRAME_BLOCK = 1000
+
+MM_PER_INCH = 25.4
+
+LENS_ATTRIBUTES = ['focalLength', 'horizontalFilmAperture', 'verticalFilmAperture', 'nearClipPlane', 'farClipPlane']
+
+def resolve_camera_shapes(cameras=None):
+    # Camera shapes of the given rigs or cameras, every CAM_### rig by default
+    if cameras is None:
+        cameras = registry.get_registry().all_rigs()
+    if not cameras:
+        return []
+    return cmds.ls(cameras, dag=True, type='camera', long=True) or []
+
+def sample_cameras(camera_shapes, frames):
+    # World matrices and lens settings of every camera at every frame. Matrices come from
+    # the trajectory store, animated lens plugs are read through a time context so the
+    # time slider never moves and unconnected ones are read once.
+    matrices = get_trajectory_store().world_matrices(camera_shapes, frames)
+    lenses = np.empty((len(camera_shapes), len(frames), len(LENS_ATTRIBUTES)))
+
+    animated_plugs = []
+    for camera_index, camera_shape in enumerate(camera_shapes):
+        camera_fn = om.MFnDependencyNode(get_dag_path(camera_shape).node())
+        for lens_index, attribute in enumerate(LENS_ATTRIBUTES):
+            plug = camera_fn.findPlug(attribute, False)
+            if plug.isDestination:
+                animated_plugs.append((camera_index, lens_index, plug))
+            else:
+                lenses[camera_index, :, lens_index] = plug.asDouble()
+
+    if animated_plugs:
+        for frame_index, frame in enumerate(frames):
+            with evaluation_time(frame):
+                for camera_index, lens_index, plug in animated_plugs:
+                    lenses[camera_index, frame_index, lens_index] = plug.asDouble()
+
+    return matrices, lenses
+
+def read_bounding_spheres(objects):
+    # World space bounding sphere of every object at the current time
+    centers = np.empty((len(objects), 3))
+    radii = np.empty(len(objects))
+
+    for index, obj in enumerate(objects):
+        dag_path = get_dag_path(obj)
+        bounding_box = om.MFnDagNode(dag_path).boundingBox
+        low = [bounding_box.min.x, bounding_box.min.y, bounding_box.min.z]
+        high = [bounding_box.max.x, bounding_box.max.y, bounding_box.max.z]
+        corners = np.array([[x, y, z, 1.0] for x in (low[0], high[0]) for y in (low[1], high[1]) for z in (low[2], high[2])])
+        corners = (corners @ np.asarray(list(dag_path.inclusiveMatrix())).reshape(4, 4))[:, :3]
+        centers[index] = corners.mean(axis=0)
+        radii[index] = np.linalg.norm(corners - centers[index], axis=1).max()
+
+    return centers, radii
+
+def cull_spheres(matrices, lenses, centers, radii):
+    # Visibility of every sphere at every frame of one camera, as a (frames, objects) array
+    rotations = unscaled_axes(matrices).transpose(0, 2, 1).astype(np.float32)
+    positions = matrices[:, 3, :3]
+
+    # Sphere centers in camera space, the camera looks down its -Z axis
+    local = np.matmul(centers.astype(np.float32)[None], rotations)
+    local -= np.matmul(positions.astype(np.float32)[:, None, :], rotations)
+    depth = -local[:, :, 2]
+
+    lenses = lenses.astype(np.float32)
+    tan_horizontal = lenses[:, 1, None] * np.float32(MM_PER_INCH * 0.5) / lenses[:, 0, None]
+    tan_vertical = lenses[:, 2, None] * np.float32(MM_PER_INCH * 0.5) / lenses[:, 0, None]
+    radii = radii.astype(np.float32)[None]
+
+    # Inside the near and far planes, then within the four side planes by at least the radius
+    visible = (depth + radii > lenses[:, 3, None]) & (depth - radii < lenses[:, 4, None])
+    visible &= np.abs(local[:, :, 0]) - tan_horizontal * depth <= radii * np.sqrt(1 + tan_horizontal * tan_horizontal)
+    visible &= np.abs(local[:, :, 1]) - tan_vertical * depth <= radii * np.sqrt(1 + tan_vertical * tan_vertical)
+    return visible
+
+@profiling.profiled
+def analyze_camera_coverage(cameras=None, objects=None, start_frame=None, end_frame=None, step=1):
+    # Which objects every camera sees on every frame, tested against the objects' bounding spheres
+    camera_shapes = resolve_camera_shapes(cameras)
+    if not camera_shapes:
+        cmds.warning("No cameras to analyze.")
+        return None
+
+    if objects is None:
+        objects = cmds.ls(selection=True, transforms=True, long=True) or []
+    if not objects:
+        cmds.warning("Please select the objects to test against the cameras.")
+        return None
+
+    if start_frame is None:
+        start_frame = cmds.playbackOptions(query=True, min=True)
+    if end_frame is None:
+        end_frame = cmds.playbackOptions(query=True, max=True)
+    frames = np.arange(start_frame, end_frame + step * 0.5, step, dtype=float)
+    profiling.note(objects=len(camera_shapes) * len(objects), frames=len(frames))
+
+    matrices, lenses = sample_cameras(camera_shapes, frames.tolist())
+    centers, radii = read_bounding_spheres(objects)
+
+    # Visibility is kept as packed bits, one row of objects per camera and frame
+    visibility = np.zeros((len(camera_shapes), len(frames), (len(objects) + 7) // 8), dtype=np.uint8)
+    frames_visible = np.zeros((len(camera_shapes), len(objects)), dtype=np.int64)
+    visible_counts = np.zeros((len(camera_shapes), len(frames)), dtype=np.int64)
+    for camera_index in range(len(camera_shapes)):
+        for start in range(0, len(frames), COVERAGE_FRAME_BLOCK):
+            block = slice(start, start + COVERAGE_FRAME_BLOCK)
+            visible = cull_spheres(matrices[camera_index, block], lenses[camera_index, block], centers, radii)
+            visibility[camera_index, block] = np.packbits(visible, axis=1)
+            frames_visible[camera_index] += visible.sum(axis=0)
+            visible_counts[camera_index, block] = visible.sum(axis=1)
+
+    return {
+        'cameras': camera_shapes,
+        'objects': list(objects),
+        'frames': frames,
+        'visibility': visibility,
+        'visible_counts': visible_counts,
+        'coverage': frames_visible * 100.0 / len(frames),
+    }
+
+def visibility_table(result, camera_index):
+    # (frames, objects) booleans for one camera of a coverage result
+    return np.unpackbits(result['visibility'][camera_index], axis=1, count=len(result['objects'])).astype(bool)
+
+def write_visibility_csv(path, result, camera_index):
+    with open(path, 'w', newline='') as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(['frame'] + result['objects'])
+        for frame, row in zip(result['frames'].tolist(), visibility_table(result, camera_index).astype(int).tolist()):
+            writer.writerow([frame] + row)
+
+def write_coverage_csv(path, result):
+    with open(path, 'w', newline='') as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(['camera', 'object', 'coverage'])
+        for camera, coverage in zip(result['cameras'], result['coverage'].tolist()):
+            for obj, percent in zip(result['objects'], coverage):
+                writer.writerow([camera, obj, round(percent, 3)])
+
+def print_coverage_summary(result):
+    for camera, coverage, counts in zip(result['cameras'], result['coverage'], result['visible_counts']):
+        seen = int(np.count_nonzero(coverage))
+        print(f"{camera.split('|')[-1]}: sees {seen} of {len(result['objects'])} object(s), "
+              f"{counts.mean():.1f} per frame on average.")
@@ -0,0 +1,169 @@
+import maya.cmds as cmds
+from maya.api import OpenMaya as om
+from maya.api import OpenMayaAnim as oma
+import numpy as np
+
+from .nodes import get_attribute_plug
+
+# Tangent types by the names keyTangent uses for them
+TANGENT_TYPES = {
+    'spline': oma.MFnAnimCurve.kTangentSmooth,
+    'linear': oma.MFnAnimCurve.kTangentLinear,
+    'fast': oma.MFnAnimCurve.kTangentFast,
+    'slow': oma.MFnAnimCurve.kTangentSlow,
+    'flat': oma.MFnAnimCurve.kTangentFlat,
+    'step': oma.MFnAnimCurve.kTangentStep,
+    'stepnext': oma.MFnAnimCurve.kTangentStepNext,
+    'fixed': oma.MFnAnimCurve.kTangentFixed,
+    'clamped': oma.MFnAnimCurve.kTangentClamped,
+    'plateau': oma.MFnAnimCurve.kTangentPlateau,
+    'auto': oma.MFnAnimCurve.kTangentAuto,
+}
+
+def get_anim_curve(plug, create=False, curve_type=oma.MFnAnimCurve.kAnimCurveTA, modifier=None):
+    # Return the anim curve driving the plug, optionally creating a new one
+    sources = plug.connectedTo(True, False)
+    if sources and sources[0].node().hasFn(om.MFn.kAnimCurve):
+        return oma.MFnAnimCurve(sources[0].node())
+    if sources or not create:
+        return None
+
+    anim_curve = oma.MFnAnimCurve()
+    anim_curve.create(plug, curve_type, modifier)
+    return anim_curve
+
+def read_anim_curves(anim_curves, tangents=True):
+    # Keys of every curve as arrays in internal units, times in the current time unit. All keys
+    # are read with one keyframe query, and the tangent types with one keyTangent query each.
+    if not anim_curves:
+        return []
+
+    names = [om.MFnDependencyNode(anim_curve.object()).name() for anim_curve in anim_curves]
+    offsets = np.cumsum([0] + [anim_curve.numKeys for anim_curve in anim_curves])
+    keys = np.asarray(cmds.keyframe(names, query=True, timeChange=True, valueChange=True) or [], dtype=float).reshape(-1, 2)
+    if tangents:
+        in_tangents = [TANGENT_TYPES.get(name, oma.MFnAnimCurve.kTangentGlobal) for name in cmds.keyTangent(names, query=True, inTangentType=True) or []]
+        out_tangents = [TANGENT_TYPES.get(name, oma.MFnAnimCurve.kTangentGlobal) for name in cmds.keyTangent(names, query=True, outTangentType=True) or []]
+
+    # Values come back in UI units
+    scales = {
+        oma.MFnAnimCurve.kAnimCurveTA: om.MAngle(1.0, om.MAngle.uiUnit()).asRadians(),
+        oma.MFnAnimCurve.kAnimCurveTL: om.MDistance(1.0, om.MDistance.uiUnit()).asCentimeters(),
+    }
+
+    curves = []
+    for anim_curve, start, end in zip(anim_curves, offsets[:-1], offsets[1:]):
+        curve_type = anim_curve.animCurveType()
+        curve = {'type': curve_type, 'times': keys[start:end, 0], 'values': keys[start:end, 1] * scales.get(curve_type, 1.0)}
+        if tangents:
+            curve['in_tangents'] = in_tangents[start:end]
+            curve['out_tangents'] = out_tangents[start:end]
+        curves.append(curve)
+    return curves
+
+def write_anim_curve_keys(anim_curve, key_times, values, in_tangents, out_tangents, change=None):
+    # One call for all keys, then fix up any tangents that differ from the first key
+    in_tangents, out_tangents = np.asarray(in_tangents), np.asarray(out_tangents)
+    anim_curve.addKeys(key_times, om.MDoubleArray(values), int(in_tangents[0]), int(out_tangents[0]), False, change)
+    for index in np.flatnonzero((in_tangents != in_tangents[0]) | (out_tangents != out_tangents[0])).tolist():
+        anim_curve.setInTangentType(index, int(in_tangents[index]), change)
+        anim_curve.setOutTangentType(index, int(out_tangents[index]), change)
+
+def sample_rotation_channel(obj, attribute, frames):
+    # Sample a rotate channel over all frames without moving the time slider
+    plug = get_attribute_plug(obj, attribute)
+    angle_unit = om.MAngle.uiUnit()
+    time_unit = om.MTime.uiUnit()
+    anim_curve = get_anim_curve(plug)
+
+    if anim_curve is not None:
+        return [om.MAngle(anim_curve.evaluate(om.MTime(frame, time_unit))).asUnits(angle_unit) for frame in frames]
+
+    if not plug.isDestination:
+        return [plug.asMAngle().asUnits(angle_unit)] * len(frames)
+
+    # Driven by something other than a curve, fall back to a per-frame query
+    return [cmds.getAttr(f"{obj}.{attribute}", time=frame) for frame in frames]
+
+def evaluate_spline_keys(key_times, key_values, times):
+    # Evaluate keys with spline tangents, each key's slope runs from its previous to its next key
+    key_times = np.asarray(key_times, dtype=float)
+    key_values = np.asarray(key_values, dtype=float)
+    times = np.asarray(times, dtype=float)
+    if len(key_times) < 2:
+        return np.full(len(times), key_values[0] if len(key_values) else 0.0)
+
+    slopes = np.empty_like(key_values)
+    slopes[1:-1] = (key_values[2:] - key_values[:-2]) / (key_times[2:] - key_times[:-2])
+    slopes[0] = (key_values[1] - key_values[0]) / (key_times[1] - key_times[0])
+    slopes[-1] = (key_values[-1] - key_values[-2]) / (key_times[-1] - key_times[-2])
+
+    # Cubic Hermite segment between every pair of keys
+    segment = np.clip(np.searchsorted(key_times, times, side='right') - 1, 0, len(key_times) - 2)
+    start_time = key_times[segment]
+    length = key_times[segment + 1] - start_time
+    s = (times - start_time) / length
+    s2 = s * s
+    s3 = s2 * s
+    return ((2 * s3 - 3 * s2 + 1) * key_values[segment] + (s3 - 2 * s2 + s) * length * slopes[segment]
+            + (3 * s2 - 2 * s3) * key_values[segment + 1] + (s3 - s2) * length * slopes[segment + 1])
+
+def reduce_keys(times, values, tolerance):
+    # Indices of the fewest samples whose spline stays within tolerance of every sample
+    times = np.asarray(times, dtype=float)
+    values = np.asarray(values, dtype=float)
+    if len(times) <= 2:
+        return np.arange(len(times))
+
+    keep = np.zeros(len(times), dtype=bool)
+    keep[[0, -1]] = True
+    while True:
+        kept = np.flatnonzero(keep)
+        error = np.abs(evaluate_spline_keys(times[kept], values[kept], times) - values)
+        if error.max() <= tolerance:
+            return kept
+
+        # Add the worst sample of every segment that is out of tolerance
+        segment = np.clip(np.searchsorted(kept, np.arange(len(times)), side='right') - 1, 0, len(kept) - 2)
+        order = np.lexsort((-error, segment))
+        first = np.r_[True, segment[order][1:] != segment[order][:-1]]
+        worst = order[first]
+        keep[worst[error[worst] > tolerance]] = True
+
+def queue_rotation_curves(obj, attributes, modifier):
+    # Queue curves for the channels that have none, returns how many. Undoing the modifier
+    # removes them again and puts the static values back.
+    created = 0
+    for attribute in attributes:
+        plug = get_attribute_plug(obj, attribute)
+        if plug.isDestination:
+            continue
+        modifier.newPlugValueMAngle(plug, plug.asMAngle())
+        get_anim_curve(plug, create=True, modifier=modifier)
+        created += 1
+    return created
+
+def write_rotation_channel(obj, attribute, frames, values, tangent_type, change=None):
+    # Write all keys of one rotate channel in a single call, undoable with the change if one is given
+    anim_curve = get_anim_curve(get_attribute_plug(obj, attribute), create=True)
+    if anim_curve is None:
+        cmds.warning(f"Cannot key '{obj}.{attribute}', it is driven by another node.")
+        return
+
+    angle_unit = om.MAngle.uiUnit()
+    time_unit = om.MTime.uiUnit()
+    times = om.MTimeArray([om.MTime(frame, time_unit) for frame in frames])
+    radians = om.MDoubleArray([om.MAngle(value, angle_unit).asRadians() for value in values])
+    anim_curve.addKeys(times, radians, tangent_type, tangent_type, True, change)
+
+def remove_keys_in_range(obj, attribute, start_frame, end_frame, change=None):
+    # Remove the keys of one channel between two frames, returns how many were removed
+    anim_curve = get_anim_curve(get_attribute_plug(obj, attribute))
+    if anim_curve is None:
+        return 0
+
+    time_unit = om.MTime.uiUnit()
+    indices = [index for index in range(anim_curve.numKeys) if start_frame <= anim_curve.input(index).asUnits(time_unit) <= end_frame]
+    for index in reversed(indices):
+        anim_curve.remove(index, change)
+    return len(indices)
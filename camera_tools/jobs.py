@@ -0,0 +1,143 @@
+import concurrent.futures
+import itertools
+import time
+
+import maya.cmds as cmds
+
+
+# Longest a job keeps the main thread before handing it back to Maya, in seconds
+JOB_TIME_SLICE = 0.05
+
+worker = None  # Thread for the math of running jobs, it never touches the scene
+window_ids = itertools.count(1)
+
+class Job(object):
+    # A long tool operation run step by step. The steps are a generator that yields the
+    # units of work it finished, or a future from run_in_worker it needs to wait for.
+    # Cancelling closes the generator, which rolls back its own edits.
+
+    def __init__(self, name, steps, total):
+        self.name = name
+        self.steps = steps
+        self.total = max(total, 1)
+        self.done = 0
+        self.waiting = None
+        self.start_time = None
+        self.cancelled = False
+        self.finished = False
+        self.window = None
+        self.progress_bar = None
+        self.status_text = None
+
+    def advance(self, time_limit=None):
+        # Run steps until the time limit, or to the end without one. Returns True while there is work left.
+        if self.start_time is None:
+            self.start_time = time.perf_counter()
+        deadline = None if time_limit is None else time.perf_counter() + time_limit
+
+        while True:
+            error = None
+            if self.waiting is not None:
+                if deadline is not None and not self.waiting.done():
+                    return True
+                try:
+                    self.waiting.result()
+                except Exception as exception:
+                    error = exception
+                self.waiting = None
+
+            try:
+                # A failed worker call is raised inside the steps, so they roll back their edits right away
+                value = next(self.steps) if error is None else self.steps.throw(error)
+            except StopIteration:
+                self.finished = True
+                return False
+
+            if isinstance(value, concurrent.futures.Future):
+                self.waiting = value
+            else:
+                self.done += value
+
+            if deadline is not None and time.perf_counter() >= deadline:
+                return True
+
+    def cancel(self, *args):
+        if not self.finished:
+            self.cancelled = True
+
+    def remaining_time(self):
+        if not self.done or self.start_time is None:
+            return None
+        elapsed = time.perf_counter() - self.start_time
+        return elapsed / self.done * max(self.total - self.done, 0)
+
+    # Progress window
+
+    def show_progress(self):
+        self.window = f'cameraToolsJob{next(window_ids)}'
+        cmds.window(self.window, title=self.name, widthHeight=(300, 90), closeCommand=self.cancel)
+        cmds.columnLayout(adjustableColumn=True, mar=5)
+        self.progress_bar = cmds.progressBar(maxValue=100)
+        self.status_text = cmds.text(label="Starting...", align='center')
+        cmds.button(label="Cancel", command=self.cancel)
+        cmds.showWindow(self.window)
+
+    def update_progress(self):
+        if self.window is None:
+            return
+
+        percent = min(self.done * 100 // self.total, 100)
+        remaining = self.remaining_time()
+        status = f"{percent}%" if remaining is None else f"{percent}%, about {remaining:.0f} s left"
+        cmds.progressBar(self.progress_bar, edit=True, progress=percent)
+        cmds.text(self.status_text, edit=True, label=status)
+
+    def close_progress(self):
+        self.finished = True
+        if self.window is not None and cmds.window(self.window, exists=True):
+            cmds.deleteUI(self.window)
+        self.window = None
+
+def run_in_worker(function, *args):
+    # Run pure math off the main thread, the function must not call Maya
+    global worker
+    if worker is None:
+        worker = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='camera_tools_job')
+    return worker.submit(function, *args)
+
+def wait_for(future):
+    # Use as `result = yield from wait_for(future)` inside job steps
+    yield future
+    return future.result()
+
+def start_job(job, background=True):
+    # Run the job from Maya's idle queue with a progress window, or right away in batch mode
+    if not background or cmds.about(batch=True):
+        job.advance()
+        return job
+
+    job.show_progress()
+    schedule(job)
+    return job
+
+def schedule(job):
+    cmds.evalDeferred(lambda: run_slice(job), lowestPriority=True)
+
+def run_slice(job):
+    if job.cancelled:
+        job.steps.close()
+        job.close_progress()
+        print(f"{job.name} cancelled, nothing was changed.")
+        return
+
+    try:
+        running = job.advance(JOB_TIME_SLICE)
+    except Exception:
+        job.close_progress()
+        raise
+
+    if running:
+        job.update_progress()
+        schedule(job)
+    else:
+        job.close_progress()
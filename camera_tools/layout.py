@@ -0,0 +1,289 @@
+import json
+import struct
+import zlib
+
+import maya.cmds as cmds
+from maya.api import OpenMaya as om
+import numpy as np
+
+from . import batch
+from . import profiling
+from . import registry
+from . import undo
+from .aim import AIM_LOCATOR_SCALE, queue_aim_locator, queue_locator_group
+from .curves import get_anim_curve, read_anim_curves, write_anim_curve_keys
+from .nodes import get_node, queue_attributes
+from .rig import create_cameras
+
+
+# A layout file is the magic bytes followed by zlib compressed chunks, each one a
+# 4 byte tag and a length. HEAD holds the file info, then every RIGS chunk (rig
+# settings as JSON) is followed by a KEYS chunk with the keys of all its curves as arrays.
+LAYOUT_MAGIC = b'CAMLAYOUT\x00'
+LAYOUT_VERSION = 1
+CHUNK_HEADER = struct.Struct('<4sI')
+
+# Rigs written per RIGS/KEYS chunk pair, the importer builds one chunk at a time
+LAYOUT_CHUNK_SIZE = 25
+
+TRANSFORM_CHANNELS = ['translateX', 'translateY', 'translateZ', 'rotateX', 'rotateY', 'rotateZ']
+
+# Node name pattern and exported attributes for every part of a rig
+RIG_NODES = [
+    ('main', '{}_Main', TRANSFORM_CHANNELS),
+    ('shake', '{}_Shake_CTL', TRANSFORM_CHANNELS),
+    ('camera', '{}', TRANSFORM_CHANNELS + ['scaleX', 'scaleY', 'scaleZ']),
+    ('shape', '{}_Cam', ['focalLength', 'horizontalFilmAperture', 'verticalFilmAperture', 'nearClipPlane', 'farClipPlane']),
+    ('locator', '{}_Loc', TRANSFORM_CHANNELS),
+]
+
+def write_chunk(layout_file, tag, payload):
+    data = zlib.compress(payload)
+    layout_file.write(CHUNK_HEADER.pack(tag, len(data)))
+    layout_file.write(data)
+
+def read_chunks(layout_file):
+    while True:
+        header = layout_file.read(CHUNK_HEADER.size)
+        if len(header) < CHUNK_HEADER.size:
+            return
+        tag, length = CHUNK_HEADER.unpack(header)
+        yield tag, zlib.decompress(layout_file.read(length))
+
+def shuffle_bytes(values):
+    # Group the bytes of every float by position, which compresses much better
+    return np.ascontiguousarray(np.asarray(values, dtype='<f8').view(np.uint8).reshape(-1, 8).T).tobytes()
+
+def unshuffle_bytes(data, count):
+    return np.frombuffer(data, dtype=np.uint8).reshape(8, count).T.copy().view('<f8').ravel()
+
+def encode_keys(curves):
+    # Times are stored as deltas, most curves have evenly spaced keys
+    times = [np.diff(np.asarray(curve['times'], dtype=float), prepend=0.0) for curve in curves]
+    times = np.concatenate(times) if times else np.zeros(0)
+    values = np.concatenate([curve['values'] for curve in curves]) if curves else np.zeros(0)
+    in_tangents = np.concatenate([curve['in_tangents'] for curve in curves]).astype(np.uint8) if curves else np.zeros(0, np.uint8)
+    out_tangents = np.concatenate([curve['out_tangents'] for curve in curves]).astype(np.uint8) if curves else np.zeros(0, np.uint8)
+    return shuffle_bytes(times) + shuffle_bytes(values) + in_tangents.tobytes() + out_tangents.tobytes()
+
+def decode_keys(data, counts):
+    total = sum(counts)
+    times = unshuffle_bytes(data[:total * 8], total)
+    values = unshuffle_bytes(data[total * 8:total * 16], total)
+    in_tangents = np.frombuffer(data[total * 16:total * 17], dtype=np.uint8)
+    out_tangents = np.frombuffer(data[total * 17:total * 18], dtype=np.uint8)
+
+    curves = []
+    offsets = np.cumsum([0] + list(counts))
+    for start, end in zip(offsets[:-1], offsets[1:]):
+        curves.append({
+            'times': np.cumsum(times[start:end]),
+            'values': values[start:end],
+            'in_tangents': in_tangents[start:end],
+            'out_tangents': out_tangents[start:end],
+        })
+    return curves
+
+def read_override_color(node_fn):
+    if not node_fn.findPlug('overrideEnabled', False).asBool():
+        return None
+    return [node_fn.findPlug(f'overrideColor{channel}', False).asDouble() for channel in 'RGB']
+
+def read_aim_offset(camera_node):
+    # Offset of the aim constraint parented under the camera transform, if there is one
+    camera_fn = om.MFnDagNode(camera_node)
+    for index in range(camera_fn.childCount()):
+        child = camera_fn.child(index)
+        if child.hasFn(om.MFn.kAimConstraint):
+            constraint_fn = om.MFnDependencyNode(child)
+            return [constraint_fn.findPlug(f'offset{axis}', False).asMAngle().asUnits(om.MAngle.kDegrees) for axis in 'XYZ']
+    return None
+
+def read_rig(camera_name):
+    # Settings of one rig and its anim curves, the keys are read for a whole chunk of rigs at once
+    rig = {'name': camera_name, 'number': registry.parse_camera_number(camera_name), 'static': {}, 'curves': []}
+    anim_curves = []
+
+    for node_key, pattern, attributes in RIG_NODES:
+        node = get_node(pattern.format(camera_name))
+        if node is None:
+            continue
+
+        node_fn = om.MFnDependencyNode(node)
+        static = rig['static'][node_key] = {}
+        for attribute in attributes:
+            plug = node_fn.findPlug(attribute, False)
+            anim_curve = get_anim_curve(plug)
+            if anim_curve is not None:
+                rig['curves'].append([node_key, attribute, anim_curve.animCurveType(), anim_curve.numKeys])
+                anim_curves.append(anim_curve)
+            elif not plug.isDestination:
+                # Constrained or otherwise driven channels are rebuilt by their driver
+                static[attribute] = plug.asMAngle().asUnits(om.MAngle.kDegrees) if attribute.startswith('rotate') else plug.asDouble()
+
+        if node_key == 'main':
+            rig['color'] = read_override_color(node_fn)
+        elif node_key == 'camera':
+            rig['scale'] = static.get('scaleX', 1.0)
+            rig['aim_offset'] = read_aim_offset(node)
+
+    locator_shape = get_node(f'{camera_name}_LocShape')
+    if locator_shape is not None:
+        locator_fn = om.MFnDependencyNode(locator_shape)
+        rig['locator'] = {
+            'color': read_override_color(locator_fn),
+            'scale': locator_fn.findPlug('localScaleX', False).asDouble(),
+        }
+
+    return rig, anim_curves
+
+def get_time_scale(time_unit):
+    # Frames in the current time unit per frame of the given one
+    ui_unit = om.MTime.uiUnit()
+    if time_unit == ui_unit:
+        return 1.0
+    return om.MTime(1.0, time_unit).asUnits(ui_unit)
+
+@profiling.profiled
+def export_camera_layout(path, camera_names=None):
+    # Write the given CAM_### rigs, or every rig in the scene, to a layout file
+    if camera_names is None:
+        camera_names = registry.get_registry().all_rigs()
+    camera_names = list(camera_names)
+    profiling.note(objects=len(camera_names))
+
+    key_count = 0
+    with open(path, 'wb') as layout_file:
+        layout_file.write(LAYOUT_MAGIC)
+        header = {'version': LAYOUT_VERSION, 'cameras': len(camera_names), 'time_unit': om.MTime.uiUnit()}
+        write_chunk(layout_file, b'HEAD', json.dumps(header).encode('utf-8'))
+
+        for start in range(0, len(camera_names), LAYOUT_CHUNK_SIZE):
+            rigs = []
+            anim_curves = []
+            for camera_name in camera_names[start:start + LAYOUT_CHUNK_SIZE]:
+                rig, rig_curves = read_rig(camera_name)
+                rigs.append(rig)
+                anim_curves.extend(rig_curves)
+            curves = read_anim_curves(anim_curves)
+
+            key_count += sum(len(curve['times']) for curve in curves)
+            write_chunk(layout_file, b'RIGS', json.dumps(rigs).encode('utf-8'))
+            write_chunk(layout_file, b'KEYS', encode_keys(curves))
+
+    print(f"Exported {len(camera_names)} camera(s) with {key_count} key(s) to '{path}'.")
+
+def write_anim_curve(anim_curve, curve):
+    time_unit = om.MTime.uiUnit()
+    times = om.MTimeArray([om.MTime(frame, time_unit) for frame in curve['times'].tolist()])
+    if not len(times):
+        return
+    write_anim_curve_keys(anim_curve, times, curve['values'].tolist(), curve['in_tangents'], curve['out_tangents'])
+
+def build_rigs(rigs, curves):
+    # Rebuild one chunk of rigs, their settings, locators and curves
+    specs = []
+    for rig in rigs:
+        main = rig['static'].get('main', {})
+        specs.append({
+            'number': rig.get('number'),
+            'scale': rig.get('scale') or 1.0,
+            'color': rig.get('color'),
+            'position': [main.get(f'translate{axis}', 0.0) for axis in 'XYZ'],
+            'rotation': [main.get(f'rotate{axis}', 0.0) for axis in 'XYZ'],
+        })
+    camera_names = create_cameras(specs)
+
+    modifier = om.MDagModifier()
+    locator_group = None
+    locators = []
+    nodes = []
+    for rig, camera_name in zip(rigs, camera_names):
+        rig_nodes = {}
+        for node_key, pattern, _ in RIG_NODES:
+            if node_key == 'locator':
+                if rig.get('locator') is None:
+                    continue
+
+                if locator_group is None:
+                    locator_group = queue_locator_group(modifier)
+                locator = rig['static'].get('locator', {})
+                rig_nodes['locator'] = queue_aim_locator(
+                    modifier, locator_group, f'{camera_name}_Loc',
+                    [locator.get(f'translate{axis}', 0.0) for axis in 'XYZ'],
+                    [locator.get(f'rotate{axis}', 0.0) for axis in 'XYZ'],
+                    rig['locator'].get('color'), rig['locator'].get('scale', AIM_LOCATOR_SCALE))
+                locators.append((rig_nodes['locator'], camera_name, rig.get('aim_offset')))
+            else:
+                rig_nodes[node_key] = get_node(pattern.format(camera_name))
+                if rig_nodes[node_key] is not None and node_key != 'main':
+                    queue_attributes(modifier, rig_nodes[node_key], rig['static'].get(node_key, {}))
+        nodes.append(rig_nodes)
+
+    # Curves are created in the same modifier so one undo removes everything
+    anim_curves = []
+    rig_curves = iter(curves)
+    for rig, rig_nodes in zip(rigs, nodes):
+        for node_key, attribute, curve_type, _ in rig['curves']:
+            curve = next(rig_curves)
+            node = rig_nodes.get(node_key)
+            if node is None:
+                continue
+            plug = om.MFnDependencyNode(node).findPlug(attribute, False)
+            anim_curve = get_anim_curve(plug, create=True, curve_type=curve_type, modifier=modifier)
+            if anim_curve is not None:
+                anim_curves.append((anim_curve, curve))
+
+    undo.apply_modifier(modifier)
+
+    for anim_curve, curve in anim_curves:
+        write_anim_curve(anim_curve, curve)
+
+    # Constrain each camera to its locator with the exported offset
+    for locator, camera_name, aim_offset in locators:
+        if aim_offset is None:
+            continue
+        cmds.aimConstraint(om.MFnDagNode(locator).fullPathName(), camera_name, aim=[1, 0, 0], upVector=[0, 1, 0], worldUpType="vector", offset=aim_offset)
+
+    return camera_names
+
+@profiling.profiled
+@batch.batched
+def import_camera_layout(path):
+    # Rebuild the rigs of a layout file chunk by chunk, taken numbers get the next free one
+    camera_names = []
+    key_count = 0
+    time_scale = 1.0
+
+    with open(path, 'rb') as layout_file:
+        if layout_file.read(len(LAYOUT_MAGIC)) != LAYOUT_MAGIC:
+            cmds.warning(f"'{path}' is not a camera layout file.")
+            return []
+
+        rigs = None
+        for tag, payload in read_chunks(layout_file):
+            if tag == b'HEAD':
+                header = json.loads(payload.decode('utf-8'))
+                if header.get('version', 0) > LAYOUT_VERSION:
+                    cmds.warning(f"'{path}' was written by a newer version of the camera tools.")
+                    return []
+
+                # Keys keep their time in seconds when the scene runs at another frame rate
+                time_scale = get_time_scale(header.get('time_unit', om.MTime.uiUnit()))
+                if time_scale != 1.0:
+                    print(f"'{path}' was exported at another frame rate, its keys are moved to frames at the scene's rate.")
+            elif tag == b'RIGS':
+                rigs = json.loads(payload.decode('utf-8'))
+            elif tag == b'KEYS' and rigs is not None:
+                counts = [curve[3] for rig in rigs for curve in rig['curves']]
+                key_count += sum(counts)
+                curves = decode_keys(payload, counts)
+                if time_scale != 1.0:
+                    for curve in curves:
+                        curve['times'] = curve['times'] * time_scale
+                camera_names.extend(build_rigs(rigs, curves))
+                rigs = None
+
+    profiling.note(objects=len(camera_names))
+    print(f"Imported {len(camera_names)} camera(s) with {key_count} key(s) from '{path}'.")
+    return camera_names
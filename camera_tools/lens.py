@@ -0,0 +1,187 @@
+import maya.cmds as cmds
+from maya.api import OpenMaya as om
+from maya.api import OpenMayaAnim as oma
+import numpy as np
+
+from . import batch
+from . import profiling
+from . import undo
+from .coverage import resolve_camera_shapes
+from .curves import get_anim_curve, reduce_keys, remove_keys_in_range
+from .nodes import evaluation_time, get_attribute_plug, get_node
+from .trajectory import get_trajectory_store, unscaled_axes
+
+
+# Focal lengths Maya cameras accept, in mm
+MIN_FOCAL_LENGTH = 2.5
+MAX_FOCAL_LENGTH = 100000.0
+
+selected_cameras = None  # DAG paths of the camera shapes resolved from the current selection
+selection_changed_callback = None  # Clears selected_cameras when the selection changes
+
+def clear_selected_cameras(*args):
+    global selected_cameras
+    selected_cameras = None
+
+def resolve_selected_cameras():
+    # Camera shapes of the selected cameras and everything below them, from one DAG query
+    global selected_cameras, selection_changed_callback
+
+    if selection_changed_callback is None:
+        selection_changed_callback = om.MEventMessage.addEventCallback('SelectionChanged', clear_selected_cameras)
+
+    # Reuse the last answer until the selection changes. Paths are kept instead of names so renamed
+    # cameras are still found, and the scene is asked again once a camera is deleted or moved.
+    if selected_cameras is None or not all(path.isValid() for path in selected_cameras):
+        selection_list = om.MSelectionList()
+        for name in cmds.ls(selection=True, dag=True, type='camera', long=True) or []:
+            selection_list.add(name)
+        selected_cameras = [selection_list.getDagPath(index) for index in range(selection_list.length())]
+
+    return [path.fullPathName() for path in selected_cameras]
+
+@profiling.profiled
+@batch.batched
+def set_camera_focal_length(focal_length):
+    cameras = resolve_selected_cameras()
+
+    if not cameras:
+        cmds.warning("Please select a camera or an object that has a camera as a child.")
+        return
+
+    set_focal_length(cameras, focal_length)
+
+@profiling.profiled
+@batch.batched
+def set_focal_length(cameras, focal_length):
+    profiling.note(objects=len(cameras))
+
+    # Set every camera in one undoable modifier
+    modifier = om.MDGModifier()
+    for camera in cameras:
+        modifier.newPlugValueDouble(get_attribute_plug(camera, 'focalLength'), focal_length)
+    undo.apply_modifier(modifier)
+
+    print(f"Set focal length of {len(cameras)} camera(s) to {focal_length}.")
+
+@profiling.profiled
+@batch.batched
+def key_focal_length():
+    cameras = resolve_selected_cameras()
+
+    if not cameras:
+        cmds.warning("Please select a camera or an object that has a camera as a child.")
+        return
+
+    profiling.note(objects=len(cameras))
+
+    # Key every camera with a single command
+    cmds.setKeyframe([f"{camera}.focalLength" for camera in cameras])
+
+    print(f"Keyframe set for focal length of {len(cameras)} camera(s).")
+
+def subject_depths(camera_matrices, subject_positions):
+    # Distance from the camera to the subject along the view axis at every frame, the camera looks down -Z
+    view_axes = -unscaled_axes(camera_matrices)[:, 2]
+    return np.einsum('ij,ij->i', subject_positions - camera_matrices[:, 3, :3], view_axes)
+
+def dolly_zoom_focal_lengths(depths, reference_depth, reference_focal_length):
+    # The subject's size on the filmback is focal length / depth, keeping it constant makes the focal length follow the depth
+    return np.clip(depths * (reference_focal_length / reference_depth), MIN_FOCAL_LENGTH, MAX_FOCAL_LENGTH)
+
+def read_focal_length(plug, frame):
+    with evaluation_time(frame):
+        return plug.asDouble()
+
+@profiling.profiled
+@batch.batched
+def solve_selected_dolly_zoom(key_tolerance=0.0):
+    # The selected cameras keep the last selected object framed
+    selection = cmds.ls(selection=True, long=True) or []
+    if len(selection) < 2:
+        cmds.warning("Please select one or more cameras and then the subject to keep framed.")
+        return None
+
+    return solve_dolly_zoom(selection[:-1], selection[-1], key_tolerance=key_tolerance)
+
+@profiling.profiled
+@batch.batched
+def solve_dolly_zoom(cameras, subject, start_frame=None, end_frame=None, reference_frame=None, focal_length=None, key_tolerance=0.0):
+    # Key the focal length of cameras so the subject keeps the size it has at the reference frame,
+    # the start by default, while they move. Every frame is solved at once from the camera and
+    # subject trajectories and each curve gets its keys with one call. focal_length overrides the
+    # lens at the reference frame, key_tolerance (in mm) keeps only the keys the curves need.
+    # Returns {camera shape: focal length per frame}.
+    camera_shapes = resolve_camera_shapes(cameras)
+    if not camera_shapes:
+        cmds.warning("Please give one or more cameras to solve.")
+        return None
+    if get_node(subject) is None:
+        cmds.warning(f"{subject} does not exist.")
+        return None
+
+    if start_frame is None:
+        start_frame = cmds.playbackOptions(query=True, min=True)
+    if end_frame is None:
+        end_frame = cmds.playbackOptions(query=True, max=True)
+    frames = list(range(int(start_frame), int(end_frame) + 1))
+    if not frames:
+        cmds.warning("The frame range is empty.")
+        return None
+    reference_frame = frames[0] if reference_frame is None else int(reference_frame)
+    if not frames[0] <= reference_frame <= frames[-1]:
+        cmds.warning("The reference frame must be inside the frame range.")
+        return None
+    reference_index = reference_frame - frames[0]
+
+    plugs = {}
+    for camera_shape in camera_shapes:
+        plug = get_attribute_plug(camera_shape, 'focalLength')
+        if plug.isDestination and get_anim_curve(plug) is None:
+            cmds.warning(f"Cannot key '{camera_shape}.focalLength', it is driven by another node.")
+            continue
+        plugs[camera_shape] = plug
+    if not plugs:
+        return None
+
+    profiling.note(objects=len(plugs), frames=len(frames))
+
+    # The subject rides along as one more trajectory in the store
+    matrices = get_trajectory_store().world_matrices([*plugs, subject], frames)
+    subject_positions = matrices[-1, :, 3, :3]
+
+    solved = {}
+    for camera_index, (camera_shape, plug) in enumerate(plugs.items()):
+        depths = subject_depths(matrices[camera_index], subject_positions)
+        if depths[reference_index] <= 0:
+            cmds.warning(f"{subject} is behind {camera_shape} at frame {reference_frame}, it was not solved.")
+            continue
+        behind = int((depths <= 0).sum())
+        if behind:
+            cmds.warning(f"{subject} is behind {camera_shape} on {behind} frame(s), the lens is held at {MIN_FOCAL_LENGTH} mm there.")
+
+        reference_focal_length = read_focal_length(plug, reference_frame) if focal_length is None else focal_length
+        solved[camera_shape] = dolly_zoom_focal_lengths(depths, depths[reference_index], reference_focal_length)
+    if not solved:
+        return None
+
+    # Keys in the range are replaced, new curves and every key edit are undone as one step
+    modifier = om.MDGModifier()
+    change = oma.MAnimCurveChange()
+    anim_curves = {camera_shape: get_anim_curve(plugs[camera_shape], create=True, curve_type=oma.MFnAnimCurve.kAnimCurveTU, modifier=modifier)
+                   for camera_shape in solved}
+    modifier.doIt()
+
+    time_unit = om.MTime.uiUnit()
+    key_count = 0
+    for camera_shape, focal_lengths in solved.items():
+        kept = reduce_keys(frames, focal_lengths, key_tolerance) if key_tolerance > 0 else np.arange(len(frames))
+        remove_keys_in_range(camera_shape, 'focalLength', frames[0], frames[-1], change)
+        times = om.MTimeArray([om.MTime(frames[index], time_unit) for index in kept.tolist()])
+        anim_curves[camera_shape].addKeys(times, om.MDoubleArray(focal_lengths[kept].tolist()),
+                                          oma.MFnAnimCurve.kTangentSmooth, oma.MFnAnimCurve.kTangentSmooth, True, change)
+        key_count += len(kept)
+    undo.record_applied(modifier, change)
+
+    print(f"Keyed a dolly zoom on {len(solved)} camera(s) over {len(frames)} frame(s) with {key_count} key(s).")
+    return solved
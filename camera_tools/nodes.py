@@ -0,0 +1,70 @@
+import contextlib
+
+from maya.api import OpenMaya as om
+
+
+# Settings added to a shake control in live mode and the noise node inputs they drive
+LIVE_NOISE_ATTRIBUTES = (
+    ('shakeSeed', 'seed', om.MFnNumericData.kInt),
+    ('shakeFrequency', 'frequency', om.MFnNumericData.kDouble),
+    ('shakeOctaves', 'octaves', om.MFnNumericData.kInt),
+    ('shakeAmplitudeX', 'amplitudeX', om.MFnNumericData.kDouble),
+    ('shakeAmplitudeY', 'amplitudeY', om.MFnNumericData.kDouble),
+    ('shakeAmplitudeZ', 'amplitudeZ', om.MFnNumericData.kDouble),
+    ('shakeStart', 'startFrame', om.MFnNumericData.kDouble),
+    ('shakeEnd', 'endFrame', om.MFnNumericData.kDouble),
+    ('shakeEase', 'ease', om.MFnNumericData.kDouble),
+)
+
+def get_node(name):
+    # Return the MObject for an existing node, or None
+    selection_list = om.MSelectionList()
+    try:
+        selection_list.add(name)
+    except RuntimeError:
+        return None
+    return selection_list.getDependNode(0)
+
+def get_dag_path(name):
+    selection_list = om.MSelectionList()
+    selection_list.add(name)
+    return selection_list.getDagPath(0)
+
+@contextlib.contextmanager
+def evaluation_time(frame):
+    # Plugs read inside the block are evaluated at the frame instead of the current time
+    previous_context = om.MDGContext(om.MTime(frame, om.MTime.uiUnit())).makeCurrent()
+    try:
+        yield
+    finally:
+        previous_context.makeCurrent()
+
+def get_attribute_plug(obj, attribute):
+    selection_list = om.MSelectionList()
+    selection_list.add(obj)
+    node = selection_list.getDependNode(0)
+    return om.MFnDependencyNode(node).findPlug(attribute, False)
+
+def queue_attributes(modifier, node, values):
+    # Queue plug writes on a node that may not exist in the scene yet
+    node_fn = om.MFnDependencyNode(node)
+    for attribute, value in values.items():
+        plug = node_fn.findPlug(attribute, False)
+        if isinstance(value, bool):
+            modifier.newPlugValueBool(plug, value)
+        elif attribute.startswith('rotate'):
+            modifier.newPlugValueMAngle(plug, om.MAngle(value, om.MAngle.kDegrees))
+        else:
+            modifier.newPlugValueDouble(plug, value)
+
+def override_color_values(color):
+    return {
+        'overrideEnabled': True,
+        'overrideRGBColors': True,
+        'overrideColorR': color[0],
+        'overrideColorG': color[1],
+        'overrideColorB': color[2],
+    }
+
+def queue_override_color(modifier, node, color):
+    queue_attributes(modifier, node, override_color_values(color))
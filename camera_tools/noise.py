@@ -0,0 +1,256 @@
+import functools
+import random
+import zlib
+
+import maya.cmds as cmds
+from maya.api import OpenMaya as om
+from maya.api import OpenMayaAnim as oma
+import numpy as np
+
+from . import batch
+from . import jobs
+from . import profiling
+from . import undo
+from .curves import queue_rotation_curves, reduce_keys, remove_keys_in_range, sample_rotation_channel, write_rotation_channel
+
+
+# Number of generated noise curves kept in memory, three per baked object
+NOISE_CACHE_SIZE = 512
+
+# Per object offsets into the noise, in frames. Cached noise curves run this much past the baked range.
+NOISE_OFFSET_RANGE = 10000
+
+# Frames sampled or keyed per job step of a bake
+NOISE_BAKE_BLOCK = 500
+
+# Degrees of rotation per unit of noise amplitude
+NOISE_SCALE = 0.1
+
+ROTATE_CHANNELS = ('rotateX', 'rotateY', 'rotateZ')
+
+def get_bake_frames(start_frame, end_frame, bake_steps):
+    return list(range(start_frame, end_frame + 1, bake_steps))
+
+def get_ease_factor(frame, start_frame, end_frame, ease_value):
+    if frame <= start_frame + ease_value:
+        # Ease in
+        return (frame - start_frame) / ease_value
+    if frame >= end_frame - ease_value:
+        # Ease out
+        return (end_frame - frame) / ease_value
+    return 1.0
+
+def build_noise_envelope(frames, start_frame, end_frame, ease_in_out, ease_value):
+    # One intensity multiplier per baked frame
+    if not ease_in_out or ease_value <= 0:
+        return [1.0] * len(frames)
+    return [get_ease_factor(frame, start_frame, end_frame, ease_value) for frame in frames]
+
+def noise_lattice_value(seed, index):
+    # Deterministic pseudo random values in [-1, 1] for an array of integer lattice points
+    value = (np.asarray(index, dtype=np.int64) * 374761393 + ((seed * 668265263) & 0xffffffff)) & 0xffffffff
+    value = ((value ^ (value >> 13)) * 1274126177) & 0xffffffff
+    value ^= value >> 16
+    return value / 0xffffffff * 2.0 - 1.0
+
+def value_noise(seed, x):
+    # Smoothly interpolated value noise, band-limited to about one cycle per lattice cell
+    cell = np.floor(x)
+    t = x - cell
+    fade = t * t * t * (t * (t * 6 - 15) + 10)
+    start = noise_lattice_value(seed, cell)
+    end = noise_lattice_value(seed, cell + 1)
+    return start + (end - start) * fade
+
+def fbm_noise(seed, x, octaves, lacunarity=2.0, gain=0.5):
+    # Fractal sum of value noise octaves, normalized back to [-1, 1], for a number or an array of x
+    x = np.asarray(x, dtype=float)
+    total = np.zeros_like(x)
+    amplitude = 1.0
+    amplitude_sum = 0.0
+    for octave in range(max(1, octaves)):
+        total += amplitude * value_noise(seed + octave * 7919, x)
+        amplitude_sum += amplitude
+        amplitude *= gain
+        x = x * lacunarity
+    return total / amplitude_sum
+
+@functools.lru_cache(maxsize=NOISE_CACHE_SIZE)
+def get_noise_curve(seed, frequency, octaves, start_frame, end_frame, step):
+    # One noise sample per frame, cached so presets are only generated once
+    curve = fbm_noise(seed, np.arange(start_frame, end_frame + 1, step) * frequency, octaves)
+    curve.flags.writeable = False
+    return curve
+
+def get_noise_frame_offset(obj):
+    # Offset into the noise taken from the object's short name, so every object shakes on its own
+    # and baking the same object again gives the same shake
+    return zlib.crc32(obj.split('|')[-1].encode()) % NOISE_OFFSET_RANGE
+
+def build_rotation_noise(intensity, envelope, noise_curve):
+    # Whole noise signal for one channel, built up front
+    return (intensity * np.asarray(envelope) * noise_curve).tolist()
+
+@profiling.profiled
+@batch.batched
+def bake_noise_on_selected_objects(rotation_noise_x, rotation_noise_y, rotation_noise_z, bake_steps, use_custom_range, start_frame, end_frame, ease_in_out, ease_value, per_frame=False, seed=0, frequency=0.2, octaves=3, key_tolerance=0.0, background=False):
+    selection = cmds.ls(selection=True)
+
+    if not selection:
+        cmds.warning("Please select one or more objects.")
+        return
+
+    return bake_noise_on_objects(selection, rotation_noise_x, rotation_noise_y, rotation_noise_z, bake_steps, use_custom_range, start_frame, end_frame, ease_in_out, ease_value, per_frame=per_frame, seed=seed, frequency=frequency, octaves=octaves, key_tolerance=key_tolerance, background=background)
+
+@profiling.profiled
+@batch.batched
+def bake_noise_on_objects(selection, rotation_noise_x, rotation_noise_y, rotation_noise_z, bake_steps, use_custom_range, start_frame, end_frame, ease_in_out, ease_value, per_frame=False, seed=0, frequency=0.2, octaves=3, key_tolerance=0.0, background=False, frame_offsets=None, modifier=None):
+    # frame_offsets gives the offset into the noise of each object, by default it comes from the object's name.
+    # modifier can hold edits queued by the caller, they are done before the objects are sampled
+    # and are rolled back with a cancelled bake.
+    scaling_factor = NOISE_SCALE
+
+    if use_custom_range:
+        start_frame = int(start_frame)
+        end_frame = int(end_frame)
+    else:
+        start_frame = int(cmds.playbackOptions(query=True, min=True))
+        end_frame = int(cmds.playbackOptions(query=True, max=True))
+
+    if per_frame:
+        if modifier is not None:
+            undo.apply_modifier(modifier)
+        profiling.note(objects=len(selection), frames=len(range(start_frame, end_frame + 1, bake_steps)))
+        bake_noise_per_frame(selection, rotation_noise_x, rotation_noise_y, rotation_noise_z, scaling_factor, bake_steps, start_frame, end_frame, ease_in_out, ease_value)
+        return
+
+    frames = get_bake_frames(start_frame, end_frame, bake_steps)
+    if not frames:
+        cmds.warning("The frame range is empty.")
+        return
+
+    profiling.note(objects=len(selection), frames=len(frames))
+
+    envelope = build_noise_envelope(frames, start_frame, end_frame, ease_in_out, ease_value)
+    noise_intensities = [rotation_noise_x * scaling_factor, rotation_noise_y * scaling_factor, rotation_noise_z * scaling_factor]
+    tangent_type = oma.MFnAnimCurve.kTangentSmooth if ease_in_out else oma.MFnAnimCurve.kTangentGlobal
+
+    if frame_offsets is None:
+        frame_offsets = [get_noise_frame_offset(obj) for obj in selection]
+
+    # The noise is generated on the worker thread while the scene is sampled
+    noise_signals = jobs.run_in_worker(build_noise_signals, noise_intensities, envelope, frame_offsets, seed, frequency, octaves, start_frame, end_frame, bake_steps)
+    steps = bake_noise_steps(list(selection), frames, noise_signals, tangent_type, key_tolerance, modifier)
+    return jobs.start_job(jobs.Job("Bake Noise", steps, len(selection) * len(frames) * 2), background)
+
+def build_noise_signals(noise_intensities, envelope, frame_offsets, seed, frequency, octaves, start_frame, end_frame, bake_steps):
+    # Noise of the three rotate channels of every object. All objects share one cached curve per
+    # axis, every frame of the range and the offsets past it, and read it from their own offset.
+    samples = np.arange(0, end_frame - start_frame + 1, bake_steps)
+    noise_curves = [get_noise_curve(seed * 3 + axis, frequency, octaves, start_frame, end_frame + NOISE_OFFSET_RANGE, 1) for axis in range(3)]
+    return [[build_rotation_noise(intensity, envelope, noise_curve[samples + offset])
+             for intensity, noise_curve in zip(noise_intensities, noise_curves)]
+            for offset in frame_offsets]
+
+def reduce_channels(frames, channels, tolerance):
+    return [reduce_keys(frames, values, tolerance).tolist() for values in channels]
+
+def bake_noise_steps(selection, frames, noise_signals, tangent_type, key_tolerance, modifier=None):
+    # Job steps of a bake, every object is sampled and then keyed in blocks of frames. All edits go
+    # through one modifier and curve change, so a cancelled bake is rolled back and a finished one
+    # is a single undo step.
+    queued = modifier is not None
+    if not queued:
+        modifier = om.MDGModifier()
+    change = oma.MAnimCurveChange()
+    removed_keys = 0
+
+    try:
+        if queued:
+            modifier.doIt()
+
+        noise_values = yield from jobs.wait_for(noise_signals)
+
+        # Every object is sampled before any curve is created, which would change what the samples read
+        object_channels = []
+        for obj, noise_channels in zip(selection, noise_values):
+            base_values = [[] for _ in ROTATE_CHANNELS]
+            for start in range(0, len(frames), NOISE_BAKE_BLOCK):
+                block = frames[start:start + NOISE_BAKE_BLOCK]
+                for values, attribute in zip(base_values, ROTATE_CHANNELS):
+                    values.extend(sample_rotation_channel(obj, attribute, block))
+                yield len(block)
+
+            object_channels.append([[base + noise for base, noise in zip(base_channel, noise_channel)]
+                                    for base_channel, noise_channel in zip(base_values, noise_channels)])
+
+        # Missing curves of all objects are created together
+        if sum(queue_rotation_curves(obj, ROTATE_CHANNELS, modifier) for obj in selection):
+            modifier.doIt()
+
+        for obj, channels in zip(selection, object_channels):
+            if key_tolerance <= 0:
+                for start in range(0, len(frames), NOISE_BAKE_BLOCK):
+                    block = slice(start, start + NOISE_BAKE_BLOCK)
+                    for attribute, values in zip(ROTATE_CHANNELS, channels):
+                        write_rotation_channel(obj, attribute, frames[block], values[block], tangent_type, change)
+                    yield len(frames[block])
+                continue
+
+            # Keep only the keys the spline needs to stay within the tolerance, old keys in the range are removed first
+            kept_keys = yield from jobs.wait_for(jobs.run_in_worker(reduce_channels, frames, channels, key_tolerance))
+            for attribute, values, kept in zip(ROTATE_CHANNELS, channels, kept_keys):
+                remove_keys_in_range(obj, attribute, frames[0], frames[-1], change)
+                write_rotation_channel(obj, attribute, [frames[index] for index in kept], [values[index] for index in kept], oma.MFnAnimCurve.kTangentSmooth, change)
+                removed_keys += len(frames) - len(kept)
+            yield len(frames)
+    except BaseException:
+        change.undoIt()
+        modifier.undoIt()
+        raise
+
+    undo.record_applied(modifier, change)
+
+    if key_tolerance <= 0:
+        print(f"Baked noise on {len(selection)} object(s) over {len(frames)} frame(s).")
+    else:
+        print(f"Baked noise on {len(selection)} object(s) over {len(frames)} frame(s), "
+              f"removed {removed_keys} of {len(frames) * len(selection) * len(ROTATE_CHANNELS)} key(s) within {key_tolerance} degree(s).")
+
+def bake_noise_per_frame(selection, rotation_noise_x, rotation_noise_y, rotation_noise_z, scaling_factor, bake_steps, start_frame, end_frame, ease_in_out, ease_value):
+    # Original scrubbing bake, kept to compare results against the bulk engine
+    for frame in range(start_frame, end_frame + 1, bake_steps):
+        cmds.currentTime(frame)
+
+        for obj in selection:
+            world_rot = cmds.xform(obj, query=True, rotation=True, worldSpace=True)
+            local_rot = cmds.xform(obj, query=True, rotation=True, worldSpace=False)
+
+            # Calculate noise intensity based on ease values
+            noise_intensity_x = rotation_noise_x * scaling_factor
+            noise_intensity_y = rotation_noise_y * scaling_factor
+            noise_intensity_z = rotation_noise_z * scaling_factor
+
+            if ease_in_out:
+                factor = get_ease_factor(frame, start_frame, end_frame, ease_value)
+                noise_intensity_x *= factor
+                noise_intensity_y *= factor
+                noise_intensity_z *= factor
+
+            noise_rotation = [
+                random.uniform(-noise_intensity_x, noise_intensity_x),
+                random.uniform(-noise_intensity_y, noise_intensity_y),
+                random.uniform(-noise_intensity_z, noise_intensity_z)
+            ]
+
+            new_local_rot = [local_rot[i] + noise_rotation[i] for i in range(3)]
+
+            cmds.xform(obj, worldSpace=True, rotation=new_local_rot)
+            cmds.setKeyframe(obj, attribute='rotateX', value=new_local_rot[0])
+            cmds.setKeyframe(obj, attribute='rotateY', value=new_local_rot[1])
+            cmds.setKeyframe(obj, attribute='rotateZ', value=new_local_rot[2])
+
+            if ease_in_out:
+                cmds.keyTangent(obj, attribute='rotateX', inTangentType='spline', outTangentType='spline', inWeight=ease_value, outWeight=ease_value)
+                cmds.keyTangent(obj, attribute='rotateY', inTangentType='spline', outTangentType='spline', inWeight=ease_value, outWeight=ease_value)
+                cmds.keyTangent(obj, attribute='rotateZ', inTangentType='spline', outTangentType='spline', inWeight=ease_value, outWeight=ease_value)
@@ -0,0 +1,162 @@
+import collections
+import functools
+import json
+import os
+import sys
+import threading
+import time
+
+
+# Profiling is off unless start() is called, the wrapped tools then only pay for one check
+enabled = False
+events = []  # Finished operations, oldest first
+active = []  # Operations currently running, innermost last
+
+class Operation(object):
+
+    def __init__(self, name):
+        self.name = name
+        self.commands = collections.Counter()
+        self.objects = 0
+        self.frames = 0
+        self.start = time.perf_counter()
+        self.duration = 0.0
+        self.depth = len(active)
+
+class CountingCommands(object):
+    # Stands in for maya.cmds in the camera_tools modules while profiling is on
+
+    def __init__(self, commands):
+        self._commands = commands
+
+    def __getattr__(self, name):
+        function = getattr(self._commands, name)
+        if not callable(function):
+            return function
+
+        @functools.wraps(function)
+        def counted(*args, **kwargs):
+            if active:
+                active[-1].commands[name] += 1
+            return function(*args, **kwargs)
+
+        setattr(self, name, counted)
+        return counted
+
+counting_commands = None
+
+def swap_commands(profile):
+    # Point every loaded camera_tools module at the counting or the real maya.cmds
+    global counting_commands
+    import maya.cmds
+
+    if counting_commands is None:
+        counting_commands = CountingCommands(maya.cmds)
+
+    replacement = counting_commands if profile else maya.cmds
+    for name, module in list(sys.modules.items()):
+        if module is not None and name.startswith('camera_tools.') and hasattr(module, 'cmds'):
+            if module.cmds is maya.cmds or module.cmds is counting_commands:
+                module.cmds = replacement
+
+def start():
+    global enabled
+    enabled = True
+    swap_commands(True)
+
+def stop():
+    global enabled
+    enabled = False
+    swap_commands(False)
+
+def reset():
+    del events[:]
+
+def profiled(function):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not enabled:
+            return function(*args, **kwargs)
+
+        # Modules imported after start() still need the counting commands
+        swap_commands(True)
+
+        operation = Operation(function.__name__)
+        active.append(operation)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            operation.duration = time.perf_counter() - operation.start
+            active.pop()
+            if active:
+                # The caller is charged for everything its nested operations did
+                parent = active[-1]
+                parent.commands.update(operation.commands)
+                parent.objects = parent.objects or operation.objects
+                parent.frames = parent.frames or operation.frames
+            events.append(operation)
+
+    return wrapper
+
+def note(objects=0, frames=0):
+    # Record how much work the running operation does
+    if active:
+        active[-1].objects += objects
+        active[-1].frames += frames
+
+def chrome_trace():
+    # Trace Event Format, load the file in chrome://tracing or Perfetto
+    if not events:
+        return {'traceEvents': [], 'displayTimeUnit': 'ms'}
+
+    origin = min(operation.start for operation in events)
+    process_id = os.getpid()
+    thread_id = threading.get_ident()
+    trace_events = []
+    for operation in events:
+        trace_events.append({
+            'name': operation.name,
+            'cat': 'camera_tools',
+            'ph': 'X',
+            'ts': (operation.start - origin) * 1e6,
+            'dur': operation.duration * 1e6,
+            'pid': process_id,
+            'tid': thread_id,
+            'args': {
+                'commands': sum(operation.commands.values()),
+                'command_counts': dict(operation.commands.most_common()),
+                'objects': operation.objects,
+                'frames': operation.frames,
+            },
+        })
+
+    return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+def write_chrome_trace(path):
+    with open(path, 'w') as trace_file:
+        json.dump(chrome_trace(), trace_file, indent=1)
+
+    print(f"Wrote {len(events)} profiled operation(s) to '{path}'.")
+
+def summary_table():
+    # One row per operation name, nested operations are listed separately
+    totals = collections.OrderedDict()
+    for operation in events:
+        total = totals.setdefault(operation.name, {'calls': 0, 'seconds': 0.0, 'slowest': 0.0, 'objects': 0, 'frames': 0, 'commands': collections.Counter()})
+        total['calls'] += 1
+        total['seconds'] += operation.duration
+        total['slowest'] = max(total['slowest'], operation.duration)
+        total['objects'] += operation.objects
+        total['frames'] += operation.frames
+        total['commands'].update(operation.commands)
+
+    lines = [f"{'operation':<32}{'calls':>7}{'total ms':>11}{'max ms':>10}{'objects':>9}{'frames':>9}{'commands':>10}  top commands"]
+    for name, total in totals.items():
+        top_commands = ', '.join(f"{command} {count}" for command, count in total['commands'].most_common(3))
+        lines.append(f"{name:<32}{total['calls']:>7}{total['seconds'] * 1000:>11.2f}{total['slowest'] * 1000:>10.2f}"
+                     f"{total['objects']:>9}{total['frames']:>9}{sum(total['commands'].values()):>10}  {top_commands}")
+
+    return '\n'.join(lines)
+
+def print_summary():
+    print(summary_table())
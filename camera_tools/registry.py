@@ -0,0 +1,192 @@
+import re
+
+import maya.cmds as cmds
+from maya.api import OpenMaya as om
+
+
+# Any transform starting with CAM_<number> reserves that number, CAM_<number> itself is the rig
+CAMERA_NUMBER_PATTERN = re.compile(r'^CAM_(\d+)')
+CAMERA_RIG_PATTERN = re.compile(r'^CAM_(\d+)$')
+
+def parse_camera_number(name):
+    match = CAMERA_NUMBER_PATTERN.match(name)
+    return int(match.group(1)) if match else None
+
+def get_uuid(node):
+    return om.MFnDependencyNode(node).uuid().asString()
+
+class CameraRegistry(object):
+    # Index of the CAM_### rigs in the scene, built once and kept current by callbacks. Nodes are
+    # keyed by UUID, so transforms with the same short name under different parents each count.
+
+    def __init__(self):
+        self.numbers = {}  # transform uuid -> camera number
+        self.names = {}  # transform uuid -> short name
+        self.rigs = {}  # rig transform uuid -> camera number
+        self.camera_rigs = {}  # camera shape uuid -> rig transform uuid
+        self.max_number = None
+        self.sorted_rigs = None
+        self.callback_ids = []
+        self.listeners = []
+        self.built = False
+
+    # Index maintenance
+
+    def build(self):
+        self.numbers.clear()
+        self.names.clear()
+        self.rigs.clear()
+        self.camera_rigs.clear()
+        self.max_number = None
+        self.sorted_rigs = None
+
+        # ls lists the names and the UUIDs in the same order
+        names = cmds.ls('CAM_*', transforms=True) or []
+        uuids = cmds.ls('CAM_*', transforms=True, uuid=True) or []
+        for uuid, name in zip(uuids, names):
+            self.add_node(uuid, name.split('|')[-1])
+
+        self.built = True
+        self.notify()
+
+    def add_node(self, uuid, name):
+        number = parse_camera_number(name)
+        if number is None:
+            return
+
+        self.numbers[uuid] = number
+        self.names[uuid] = name
+        if self.max_number is None or number > self.max_number:
+            self.max_number = number
+
+        if CAMERA_RIG_PATTERN.match(name):
+            self.rigs[uuid] = number
+            self.sorted_rigs = None
+            self.notify()
+
+    def remove_node(self, uuid):
+        number = self.numbers.pop(uuid, None)
+        self.names.pop(uuid, None)
+        if number is None:
+            return
+
+        # Only the rare removal of the highest number needs a rescan of the index
+        if number == self.max_number:
+            self.max_number = max(self.numbers.values()) if self.numbers else None
+
+        if self.rigs.pop(uuid, None) is not None:
+            self.sorted_rigs = None
+            for camera_shape, rig in list(self.camera_rigs.items()):
+                if rig == uuid:
+                    del self.camera_rigs[camera_shape]
+            self.notify()
+
+    # Listeners are called whenever the set of rigs changes
+
+    def add_listener(self, listener):
+        if listener not in self.listeners:
+            self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def notify(self):
+        for listener in list(self.listeners):
+            listener()
+
+    # Queries
+
+    def next_camera_number(self):
+        if self.max_number is None:
+            return 10  # Start at 10 if no cameras exist
+
+        return (self.max_number // 10 + 1) * 10
+
+    @property
+    def rig_names(self):
+        # Rig name -> camera number, rigs sharing a short name share their number
+        return {self.names[uuid]: number for uuid, number in self.rigs.items()}
+
+    def all_rigs(self):
+        if self.sorted_rigs is None:
+            rigs = sorted({(number, self.names[uuid]) for uuid, number in self.rigs.items()})
+            self.sorted_rigs = tuple(name for _, name in rigs)
+        return self.sorted_rigs
+
+    def rig_for_camera(self, camera_shape):
+        selection_list = om.MSelectionList()
+        try:
+            selection_list.add(camera_shape)
+        except RuntimeError:
+            return None
+
+        camera = selection_list.getDependNode(0)
+        camera_uuid = get_uuid(camera)
+        rig = self.camera_rigs.get(camera_uuid)
+        if rig is None:
+            rig = get_uuid(om.MFnDagNode(camera).parent(0))
+            if rig not in self.rigs:
+                return None
+            self.camera_rigs[camera_uuid] = rig
+        return self.names[rig]
+
+    # Callbacks
+
+    def install_callbacks(self):
+        if self.callback_ids:
+            return
+
+        self.callback_ids = [
+            om.MDGMessage.addNodeAddedCallback(self.on_node_added, 'transform'),
+            om.MDGMessage.addNodeRemovedCallback(self.on_node_removed, 'transform'),
+            om.MDGMessage.addNodeRemovedCallback(self.on_camera_removed, 'camera'),
+            om.MNodeMessage.addNameChangedCallback(om.MObject.kNullObj, self.on_name_changed),
+            om.MSceneMessage.addCallback(om.MSceneMessage.kAfterNew, self.on_scene_changed),
+            om.MSceneMessage.addCallback(om.MSceneMessage.kAfterOpen, self.on_scene_changed),
+        ]
+
+    def remove_callbacks(self):
+        if self.callback_ids:
+            om.MMessage.removeCallbacks(self.callback_ids)
+        self.callback_ids = []
+
+    def on_node_added(self, node, client_data):
+        self.add_node(get_uuid(node), om.MFnDependencyNode(node).name())
+
+    def on_node_removed(self, node, client_data):
+        self.remove_node(get_uuid(node))
+
+    def on_camera_removed(self, node, client_data):
+        self.camera_rigs.pop(get_uuid(node), None)
+
+    def on_name_changed(self, node, previous_name, client_data):
+        if not node.hasFn(om.MFn.kTransform):
+            return
+
+        uuid = get_uuid(node)
+        self.remove_node(uuid)
+        self.add_node(uuid, om.MFnDependencyNode(node).name())
+
+    def on_scene_changed(self, client_data):
+        self.built = False
+        if self.listeners:
+            self.build()
+
+_registry = None
+
+def get_registry():
+    # Shared registry, built on first use and rebuilt after a new scene is opened
+    global _registry
+    if _registry is None:
+        _registry = CameraRegistry()
+        _registry.install_callbacks()
+    if not _registry.built:
+        _registry.build()
+    return _registry
+
+def reset_registry():
+    global _registry
+    if _registry is not None:
+        _registry.remove_callbacks()
+    _registry = None
@@ -0,0 +1,152 @@
+import re
+
+import maya.cmds as cmds
+from maya.api import OpenMaya as om
+
+from . import batch
+from . import profiling
+from . import registry
+from . import undo
+from .nodes import get_node
+from .rig import queue_label_character
+
+
+# Every node named after a rig, e.g. CAM_010_Main or CAM_010_Shake_CTL_rotateX, but not CAM_0105
+RIG_NODE_PATTERN = re.compile(r'^CAM_(\d+)(\D.*)?$')
+LABEL_CHARACTER_PATTERN = re.compile(r'^_Text_(\d+)(Shape\d+)?$')
+
+def camera_name(number):
+    return f'CAM_{number:03}'
+
+def plan_renumber(moves, taken=()):
+    # Order the number changes so no rename lands on a name still in use.
+    # moves is {old number: new number}, taken holds numbers used by rigs that stay put.
+    # Chains are renamed from their free end, cycles go through a spare number.
+    # Returns [(from number, to number)] steps, or None when two rigs would share a number.
+    moves = {old: new for old, new in moves.items() if old != new}
+    targets = list(moves.values())
+    if len(set(targets)) != len(targets) or set(targets) & set(taken):
+        return None
+
+    spare = max([*moves, *targets, *taken], default=0) + 1
+    steps = []
+    while moves:
+        ready = sorted(old for old, new in moves.items() if new not in moves)
+        if not ready:
+            # Every remaining target is held by another moving rig, park one on a spare number
+            old = min(moves)
+            steps.append((old, spare))
+            moves[spare] = moves.pop(old)
+            spare += 1
+            continue
+
+        for old in ready:
+            steps.append((old, moves.pop(old)))
+
+    return steps
+
+def collect_rig_nodes(numbers):
+    # MObjects of every node named after the given rigs, with the rest of their name
+    nodes = {number: [] for number in numbers}
+    for name in cmds.ls('CAM_*') or []:
+        match = RIG_NODE_PATTERN.match(name.split('|')[-1])
+        if match is None or int(match.group(1)) not in nodes or camera_name(int(match.group(1))) != f'CAM_{match.group(1)}':
+            continue
+        node = get_node(name)
+        if node is not None:
+            nodes[int(match.group(1))].append((node, match.group(2) or ''))
+    return nodes
+
+def is_character_label(label, text):
+    # True when the label holds one {rig}_Text_{n} character per letter of its text. Labels made
+    # by textCurves in older versions hold Char_* groups instead and are rebuilt whole.
+    label_fn = om.MFnDagNode(label)
+    indices = set()
+    for index in range(label_fn.childCount()):
+        name = om.MFnDependencyNode(label_fn.child(index)).name()
+        match = LABEL_CHARACTER_PATTERN.match(name[len(text):]) if name.startswith(text) else None
+        if match is None or match.group(2) is not None:
+            return False
+        indices.add(int(match.group(1)))
+    return indices == set(range(len(text)))
+
+@profiling.profiled
+@batch.batched
+def resequence_cameras(cameras=None, start=10, step=10, numbers=None):
+    # Renumber rigs in the given order, every CAM_### rig by number by default. New numbers
+    # run from start in steps of step unless numbers lists them. Returns {old name: new name}.
+    rig_numbers = registry.get_registry().rig_names
+    if cameras is None:
+        cameras = registry.get_registry().all_rigs()
+    cameras = [camera.split('|')[-1] for camera in cameras]
+    cameras = [camera for camera in cameras if camera in rig_numbers]
+    if not cameras:
+        cmds.warning("No camera rigs to renumber.")
+        return {}
+
+    if numbers is None:
+        numbers = [start + index * step for index in range(len(cameras))]
+    if len(numbers) != len(cameras):
+        cmds.warning(f"Got {len(numbers)} number(s) for {len(cameras)} camera(s).")
+        return {}
+
+    moves = {rig_numbers[camera]: number for camera, number in zip(cameras, numbers)}
+    taken = set(registry.get_registry().numbers.values()) - set(moves)
+    steps = plan_renumber(moves, taken)
+    if steps is None:
+        cmds.warning("The new numbers clash with each other or with cameras that are not renumbered.")
+        return {}
+    if not steps:
+        return {}
+
+    profiling.note(objects=len(cameras))
+
+    nodes = collect_rig_nodes(moves)
+    modifier = om.MDagModifier()
+
+    # Label characters that change are rebuilt from the glyph cache, the rest are only renamed
+    labels = []
+    for old, new in moves.items():
+        old_text, new_text = camera_name(old), camera_name(new)
+        if old_text == new_text:
+            continue
+
+        label = next((node for node, suffix in nodes[old] if suffix == '_Text_GRP'), None)
+        rebuild = label is not None and not is_character_label(label, old_text)
+        if rebuild:
+            label_fn = om.MFnDagNode(label)
+            for child in [label_fn.child(index) for index in range(label_fn.childCount())]:
+                modifier.deleteNode(child)
+            changed = list(range(len(new_text)))
+        else:
+            changed = [index for index in range(len(new_text)) if index >= len(old_text) or old_text[index] != new_text[index]]
+
+        kept = []
+        for node, suffix in nodes[old]:
+            match = LABEL_CHARACTER_PATTERN.match(suffix)
+            if match is not None and (rebuild or int(match.group(1)) in changed or int(match.group(1)) >= len(new_text)):
+                # Shapes go with their character
+                if match.group(2) is None and not rebuild:
+                    modifier.deleteNode(node)
+                continue
+            kept.append((node, suffix))
+        nodes[old] = kept
+
+        if label is not None:
+            labels.append((label, new_text, changed))
+
+    renamed = 0
+    for old, new in steps:
+        for node, suffix in nodes[old]:
+            modifier.renameNode(node, f'{camera_name(new)}{suffix}')
+            renamed += 1
+        nodes[new] = nodes.pop(old)
+
+    for label, new_text, changed in labels:
+        for index in changed:
+            queue_label_character(modifier, label, new_text, index)
+
+    undo.apply_modifier(modifier)
+
+    print(f"Renumbered {len(moves)} camera(s) with {renamed} rename(s).")
+    return {camera_name(old): camera_name(new) for old, new in moves.items() if old != new}
@@ -0,0 +1,218 @@
+import maya.cmds as cmds
+from maya.api import OpenMaya as om
+
+from . import batch
+from . import profiling
+from . import registry
+from . import undo
+from .nodes import get_dag_path, get_node, queue_attributes, queue_override_color
+
+
+# Color used for new rigs when none is given
+DEFAULT_COLOR = [1, 0, 0]  # Default color is red
+
+# Control curve points and the offsets they are frozen at
+MAIN_CTRL_POINTS = [(-0.6, 0, 1), (0.6, 0, 1), (0.6, 0, -1), (-0.6, 0, -1), (-0.6, 0, 1)]
+MAIN_CTRL_OFFSET = (0, -0.4, 0.6)
+SHAKE_CTRL_POINTS = [(0, 0, 0), (0.8, 0, 0), (0.8, 0, 0.8), (0, 0, 0.8),
+                     (0, 0, 0), (0, 0.8, 0), (0.8, 0.8, 0), (0.8, 0, 0),
+                     (0.8, 0.8, 0), (0.8, 0.8, 0.8), (0.8, 0, 0.8), (0.8, 0.8, 0.8),
+                     (0, 0.8, 0.8), (0, 0, 0.8), (0, 0.8, 0.8), (0, 0.8, 0)]
+SHAKE_CTRL_OFFSET = (-0.4, -0.4, -0.3)
+
+# Characters a label can use and where the label sits under the camera
+LABEL_CHARACTERS = 'CAM_0123456789'
+LABEL_OFFSET = (0.2, 0.35, 1)
+LABEL_ROTATION_Y = 90
+LABEL_SCALE = 0.1
+
+label_glyphs = None  # character -> {'curves': [(points, knots, degree, form)], 'advance': spacing}
+
+def get_next_camera_number():  
+    # The registry keeps the existing camera numbers indexed, no scene scan needed
+    return registry.get_registry().next_camera_number()
+
+def get_label_glyphs():
+    # Curves of every label character relative to its origin, read from one textCurves call per session
+    global label_glyphs
+    if label_glyphs is not None:
+        return label_glyphs
+
+    text_group = cmds.textCurves(ch=False, f="Arial", t=LABEL_CHARACTERS)[0]
+    char_groups = cmds.listRelatives(text_group, children=True, fullPath=True) or []
+    curve_shapes = cmds.listRelatives(text_group, allDescendents=True, type='nurbsCurve', fullPath=True) or []
+
+    glyphs = {}
+    origins = [list(get_dag_path(char_group).inclusiveMatrix())[12:15] for char_group in char_groups]
+    for character, char_group, origin in zip(LABEL_CHARACTERS, char_groups, origins):
+        curves = []
+        for curve_shape in curve_shapes:
+            if not curve_shape.startswith(char_group + '|'):
+                continue
+            curve_fn = om.MFnNurbsCurve(get_dag_path(curve_shape))
+            points = [(point.x - origin[0], point.y - origin[1], point.z - origin[2]) for point in curve_fn.cvPositions(om.MSpace.kWorld)]
+            curves.append((points, list(curve_fn.knots()), curve_fn.degree, curve_fn.form))
+        glyphs[character] = {'curves': curves}
+
+    # Spacing to the next character, the last one keeps the spacing before it
+    advances = [right[0] - left[0] for left, right in zip(origins, origins[1:])]
+    advances.append(advances[-1] if advances else 1.0)
+    for character, advance in zip(LABEL_CHARACTERS, advances):
+        glyphs[character]['advance'] = advance
+
+    cmds.delete(text_group)
+    label_glyphs = glyphs
+    return label_glyphs
+
+def queue_curve_data(modifier, transform, shape_name, points, knots, degree, form):
+    curve_data = om.MFnNurbsCurveData().create()
+    cvs = om.MPointArray([om.MPoint(*point) for point in points])
+    om.MFnNurbsCurve().create(cvs, knots, degree, form, False, False, curve_data)
+
+    shape = modifier.createNode('nurbsCurve', transform)
+    modifier.renameNode(shape, shape_name)
+    modifier.newPlugValue(om.MFnDependencyNode(shape).findPlug('cached', False), curve_data)
+    return shape
+
+def queue_curve_shape(modifier, transform, shape_name, points, offset, scale):
+    # Linear control curve with the offset and scale baked into its CVs, like a frozen curve
+    points = [((x + offset[0]) * scale, (y + offset[1]) * scale, (z + offset[2]) * scale) for x, y, z in points]
+    return queue_curve_data(modifier, transform, shape_name, points, list(range(len(points))), 1, om.MFnNurbsCurve.kOpen)
+
+def queue_label_character(modifier, label, camera_name, index):
+    # One transform per character, so a renumbered label only rebuilds the digits that changed
+    glyphs = get_label_glyphs()
+    character_name = f'{camera_name}_Text_{index}'
+    character = modifier.createNode('transform', label)
+    modifier.renameNode(character, character_name)
+    queue_attributes(modifier, character, {'translateX': sum(glyphs[letter]['advance'] for letter in camera_name[:index])})
+    for curve_index, (points, knots, degree, form) in enumerate(glyphs[camera_name[index]]['curves']):
+        queue_curve_data(modifier, character, f'{character_name}Shape{curve_index + 1}', points, knots, degree, form)
+    return character
+
+def queue_camera_label(modifier, camera_transform, camera_name, color):
+    # CAM_### label under the camera, laid out like a frozen textCurves group
+    label = modifier.createNode('transform', camera_transform)
+    modifier.renameNode(label, f'{camera_name}_Text_GRP')
+    queue_attributes(modifier, label, {
+        'translateX': LABEL_OFFSET[0], 'translateY': LABEL_OFFSET[1], 'translateZ': LABEL_OFFSET[2],
+        'rotateY': LABEL_ROTATION_Y,
+        'scaleX': LABEL_SCALE, 'scaleY': LABEL_SCALE, 'scaleZ': LABEL_SCALE,
+    })
+    queue_override_color(modifier, label, color)
+
+    for index in range(len(camera_name)):
+        queue_label_character(modifier, label, camera_name, index)
+    return label
+
+def queue_camera_rig(modifier, parent, camera_number, spec):
+    camera_name = f'CAM_{camera_number:03}'
+    camera_ctrl_name = f"{camera_name}_Main"
+    camera_shake_ctrl_name = f"{camera_name}_Shake_CTL"
+    color = spec.get('color') or DEFAULT_COLOR
+    scale = float(spec.get('scale') or 1.0)
+    position = spec.get('position') or (0, 0, 0)
+    rotation = spec.get('rotation') or (0, 0, 0)
+
+    # Main control, placed at the requested position and rotation
+    camera_main_ctrl = modifier.createNode('transform', parent)
+    modifier.renameNode(camera_main_ctrl, camera_ctrl_name)
+    queue_curve_shape(modifier, camera_main_ctrl, f"{camera_ctrl_name}Shape", MAIN_CTRL_POINTS, MAIN_CTRL_OFFSET, scale)
+    queue_override_color(modifier, camera_main_ctrl, color)
+    queue_attributes(modifier, camera_main_ctrl, {
+        'translateX': position[0], 'translateY': position[1], 'translateZ': position[2],
+        'rotateX': rotation[0], 'rotateY': rotation[1], 'rotateZ': rotation[2],
+    })
+
+    # Shake control under the main control
+    camera_shake_ctrl = modifier.createNode('transform', camera_main_ctrl)
+    modifier.renameNode(camera_shake_ctrl, camera_shake_ctrl_name)
+    queue_curve_shape(modifier, camera_shake_ctrl, f"{camera_shake_ctrl_name}Shape", SHAKE_CTRL_POINTS, SHAKE_CTRL_OFFSET, scale)
+    queue_override_color(modifier, camera_shake_ctrl, color)
+
+    # Camera under the shake control, the transform carries the rig scale
+    camera_transform = modifier.createNode('transform', camera_shake_ctrl)
+    modifier.renameNode(camera_transform, camera_name)
+    queue_attributes(modifier, camera_transform, {'scaleX': scale, 'scaleY': scale, 'scaleZ': scale})
+
+    camera_shape = modifier.createNode('camera', camera_transform)
+    modifier.renameNode(camera_shape, f'{camera_name}_Cam')
+    queue_attributes(modifier, camera_shape, {
+        'displayGateMask': True,
+        'displayResolution': True,
+        'overscan': 1.0,
+        'displayGateMaskOpacity': 1.0,
+    })
+    mask_color_plug = om.MFnDependencyNode(camera_shape).findPlug('displayGateMaskColor', False)
+    for index in range(3):
+        modifier.newPlugValueDouble(mask_color_plug.child(index), 0.0)
+    queue_override_color(modifier, camera_shape, color)
+
+    queue_camera_label(modifier, camera_transform, camera_name, color)
+
+    return camera_name
+
+@profiling.profiled
+@batch.batched
+def create_cameras(specs):
+    # Build a complete CAM_### rig for every spec, e.g. {'position': (0, 0, 0), 'rotation': (0, 0, 0), 'scale': 20, 'color': (1, 0, 0)}
+    # A spec may ask for a camera number, it gets the next free one if that number is taken
+    if not specs:
+        return []
+
+    profiling.note(objects=len(specs))
+
+    used_numbers = set(registry.get_registry().numbers.values())
+    next_number = get_next_camera_number()
+    camera_numbers = []
+    for spec in specs:
+        camera_number = spec.get('number')
+        if camera_number is None or camera_number in used_numbers:
+            while next_number in used_numbers:
+                next_number += 10
+            camera_number = next_number
+        used_numbers.add(camera_number)
+        camera_numbers.append(camera_number)
+
+    camera_names = []
+    modifier = om.MDagModifier()
+
+    # Check if the camera group exists; if not, create it
+    camera_group = get_node('CAM_GRP')
+    if camera_group is None:
+        camera_group = modifier.createNode('transform')
+        modifier.renameNode(camera_group, 'CAM_GRP')
+
+    for camera_number, spec in zip(camera_numbers, specs):
+        camera_names.append(queue_camera_rig(modifier, camera_group, camera_number, spec))
+
+    undo.apply_modifier(modifier)
+
+    return camera_names
+
+@profiling.profiled
+@batch.batched
+def create_camera(scale_value, from_persp=False, color=None):
+    spec = {'scale': float(scale_value) if scale_value else 1.0, 'color': color}
+
+    # Translate and rotate the main control to the perspective camera position and rotation if requested
+    if from_persp:
+        spec['position'] = cmds.xform("persp", query=True, worldSpace=True, translation=True)
+        spec['rotation'] = cmds.xform("persp", query=True, worldSpace=True, rotation=True)
+
+    camera_name = create_cameras([spec])[0]
+
+    print(f"Camera '{camera_name}' created!")
+    return camera_name
+
+@profiling.profiled
+@batch.batched
+def set_rig_color(cameras, color):
+    # Recolor the controls, camera and label of CAM_### rigs
+    profiling.note(objects=len(cameras))
+
+    for camera_name in cameras:
+        for node_name in (f'{camera_name}_Main', f'{camera_name}_Shake_CTL', f'{camera_name}_Cam', f'{camera_name}_Text_GRP'):
+            batch.set_override_color(node_name, color)
+
+    print(f"Recolored {len(cameras)} camera(s).")
@@ -0,0 +1,325 @@
+import argparse
+import atexit
+import collections
+import concurrent.futures
+import contextlib
+import io
+import json
+import multiprocessing
+import multiprocessing.spawn
+import os
+import sys
+import time
+import traceback
+
+
+# Most processes a pool can have on Windows
+MAX_WORKERS = 61
+
+# Set in every worker, scenes are announced on it as they start so a crash can be pinned on them
+started_scenes = None
+
+def get_rigs():
+    from .registry import get_registry
+    return list(get_registry().all_rigs())
+
+def get_shake_controls():
+    return [f'{camera_name}_Shake_CTL' for camera_name in get_rigs()]
+
+# Operations a batch can run in every scene. Each takes its step from the operation list,
+# e.g. {"op": "recolor", "color": [0, 1, 0]}, and returns a short result for the report.
+
+def add_rigs(step):
+    from .rig import create_cameras
+    return create_cameras(step.get('cameras') or [{}])
+
+def set_lens(step):
+    import maya.cmds as cmds
+    from .lens import key_focal_length, set_focal_length
+
+    cameras = [f'{camera_name}_Cam' for camera_name in get_rigs()]
+    if not cameras:
+        return 0
+
+    set_focal_length(cameras, float(step['focal_length']))
+    if step.get('key'):
+        if 'frame' in step:
+            cmds.currentTime(step['frame'])
+        cmds.select(cameras)
+        key_focal_length()
+    return len(cameras)
+
+def bake_noise(step):
+    from .noise import bake_noise_on_objects
+
+    controls = get_shake_controls()
+    if not controls:
+        return 0
+
+    ease_value = float(step.get('ease', 0.0))
+    bake_noise_on_objects(controls, step.get('x', 0.0), step.get('y', 0.0), step.get('z', 0.0),
+                          int(step.get('bake_steps', 1)), 'start' in step and 'end' in step,
+                          step.get('start', 0), step.get('end', 0), ease_value > 0, ease_value,
+                          seed=int(step.get('seed', 0)), frequency=float(step.get('frequency', 0.2)),
+                          octaves=int(step.get('octaves', 3)), key_tolerance=float(step.get('key_tolerance', 0.0)))
+    return len(controls)
+
+def strip_noise(step):
+    from .shake import remove_noise
+    return len(remove_noise(get_shake_controls()))
+
+def recolor(step):
+    from .rig import set_rig_color
+
+    cameras = get_rigs()
+    set_rig_color(cameras, step['color'])
+    return len(cameras)
+
+def resequence(step):
+    from .renumber import resequence_cameras
+    return resequence_cameras(start=int(step.get('start', 10)), step=int(step.get('step', 10)))
+
+OPERATIONS = {
+    'add_rigs': add_rigs,
+    'set_lens': set_lens,
+    'bake_noise': bake_noise,
+    'strip_noise': strip_noise,
+    'recolor': recolor,
+    'resequence': resequence,
+}
+
+def load_operations(path):
+    # JSON is either {"operations": [...]} or a plain list of steps
+    with open(path) as json_file:
+        data = json.load(json_file)
+
+    operations = data['operations'] if isinstance(data, dict) else data
+    unknown = sorted({step.get('op') for step in operations} - set(OPERATIONS), key=str)
+    if unknown:
+        raise ValueError(f"Unknown operation(s) {', '.join(map(str, unknown))}, expected one of {', '.join(OPERATIONS)}.")
+    return operations
+
+def find_mayapy():
+    # The running interpreter when it is mayapy, otherwise the one in MAYA_LOCATION
+    if os.path.basename(sys.executable).lower().startswith('mayapy'):
+        return sys.executable
+
+    location = os.environ.get('MAYA_LOCATION')
+    if location:
+        path = os.path.join(location, 'bin', 'mayapy.exe' if os.name == 'nt' else 'mayapy')
+        if os.path.exists(path):
+            return path
+    return None
+
+# Worker side, every function below runs in a pool process
+
+def start_worker(setup=None, started=None):
+    # Start Maya once per worker, setup runs first and can install a stand-in for Maya.
+    # The shake noise plugin is loaded before any scene opens, so live noise nodes are not unknown.
+    global started_scenes
+    started_scenes = started
+    if setup is not None:
+        setup()
+
+    import maya.standalone
+    maya.standalone.initialize(name='python')
+    atexit.register(maya.standalone.uninitialize)
+
+    from .shake_node import load_plugin
+    load_plugin()
+
+def process_scene(path, operations, output=None):
+    # Open one scene, run the operations and save it to output, in place by default. Failures are
+    # returned, never raised, so one broken scene does not stop the batch. What the tools print goes to the report.
+    if started_scenes is not None:
+        started_scenes.put(path)
+
+    start_time = time.perf_counter()
+    result = {'scene': path, 'output': None, 'status': 'ok', 'seconds': 0.0, 'operations': [], 'error': None, 'log': '', 'pid': os.getpid()}
+    log = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(log):
+            run_operations(path, operations, output, result)
+    except Exception:
+        result['status'] = 'failed'
+        result['error'] = traceback.format_exc()
+
+    result['log'] = log.getvalue()
+    result['seconds'] = time.perf_counter() - start_time
+    return result
+
+def run_operations(path, operations, output, result):
+    import maya.cmds as cmds
+
+    cmds.file(path, open=True, force=True)
+
+    for step in operations:
+        step_start = time.perf_counter()
+        value = OPERATIONS[step['op']](step)
+        result['operations'].append({'op': step['op'], 'seconds': time.perf_counter() - step_start, 'result': value})
+
+    output = os.path.abspath(output or path)
+    cmds.file(rename=output)
+    cmds.file(save=True, force=True, type='mayaBinary' if output.lower().endswith('.mb') else 'mayaAscii')
+    result['output'] = output
+
+# Driver side
+
+def get_output_paths(scenes, output_dir):
+    # Where every scene is saved. In the output directory scenes keep their folders below the one
+    # they all share, so sh010/layout.ma and sh020/layout.ma do not overwrite each other.
+    paths = [os.path.abspath(scene) for scene in scenes]
+    if not output_dir:
+        return paths
+
+    output_dir = os.path.abspath(output_dir)
+    try:
+        root = os.path.commonpath([os.path.dirname(path) for path in paths])
+    except ValueError:
+        # Scenes on different drives share no folder
+        return [os.path.join(output_dir, os.path.basename(path)) for path in paths]
+    return [os.path.join(output_dir, os.path.relpath(path, root)) for path in paths]
+
+def failed_result(scene, error):
+    return {'scene': scene, 'output': None, 'status': 'failed', 'seconds': 0.0, 'operations': [],
+            'error': f"{type(error).__name__}: {error}", 'log': '', 'pid': None}
+
+def run_pool(scenes, outputs, operations, workers, context, setup, add_result):
+    # Run the scenes in one pool. When a worker dies, e.g. Maya crashed, the pool is broken and every
+    # scene it had not finished is returned with the scenes that had started and the error.
+    started = context.SimpleQueue()
+    finished = set()
+    broken = None
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=start_worker, initargs=(setup, started)) as pool:
+        futures = {pool.submit(process_scene, scene, operations, outputs[scene]): scene for scene in scenes}
+        for future in concurrent.futures.as_completed(futures):
+            scene = futures[future]
+            try:
+                result = future.result()
+            except concurrent.futures.process.BrokenProcessPool as error:
+                broken = error
+                continue
+            except Exception as error:
+                result = failed_result(scene, error)
+
+            finished.add(scene)
+            add_result(result)
+
+    running = set()
+    while not started.empty():
+        running.add(started.get())
+    return [scene for scene in scenes if scene not in finished], running, broken
+
+def process_scenes(scenes, operations, output_dir=None, workers=None, mayapy=None, setup=None):
+    # Run the operations on every scene with a pool of headless mayapy processes, one per core by
+    # default. Each worker starts Maya once and then takes scenes until none are left. When a worker
+    # dies the scenes that were open are retried one at a time, so only the scene that crashes
+    # Maya fails, and the scenes that had not started go to a new pool.
+    # setup is a picklable function run in every worker before Maya starts, e.g. fake_maya.install
+    # to test without Maya, in which case the workers use the running interpreter.
+    # Returns the report, or None when the batch could not start.
+    if not scenes:
+        print("No scenes to process.")
+        return None
+
+    outputs = dict(zip(scenes, get_output_paths(scenes, output_dir)))
+    clashes = sorted(path for path, count in collections.Counter(outputs.values()).items() if count > 1)
+    if len(outputs) < len(scenes) or clashes:
+        print(f"Scenes would overwrite each other, every scene must be listed once and saved to its own file: {', '.join(clashes) or 'a scene is listed twice'}.")
+        return None
+
+    executable = mayapy or (sys.executable if setup is not None else find_mayapy())
+    if executable is None:
+        print("mayapy was not found, run the batch with mayapy, pass its path or set MAYA_LOCATION.")
+        return None
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(scenes), MAX_WORKERS))
+    if output_dir:
+        for folder in {os.path.dirname(path) for path in outputs.values()}:
+            os.makedirs(folder, exist_ok=True)
+
+    # Workers are spawned fresh, a forked process cannot start Maya
+    context = multiprocessing.get_context('spawn')
+    default_executable = multiprocessing.spawn.get_executable()
+    context.set_executable(executable)
+
+    start_time = time.perf_counter()
+    results = []
+
+    def add_result(result):
+        results.append(result)
+        print(f"[{len(results)}/{len(scenes)}] {result['scene']}: {result['status']} in {result['seconds']:.1f} s")
+
+    queued = list(scenes)
+    suspects = []  # Scenes that were open when a worker died
+    try:
+        while queued or suspects:
+            retry = bool(suspects)
+            if retry:
+                batch, pool_workers = [suspects.pop(0)], 1
+            else:
+                batch, queued, pool_workers = queued, [], min(workers, len(queued))
+
+            unfinished, running, error = run_pool(batch, outputs, operations, pool_workers, context, setup, add_result)
+            crashed = [scene for scene in unfinished if scene in running]
+            if retry or not crashed:
+                # The scene crashed Maya on its own, or Maya could not start at all
+                for scene in unfinished:
+                    add_result(failed_result(scene, error))
+                continue
+
+            suspects.extend(crashed)
+            queued.extend(scene for scene in unfinished if scene not in running)
+    finally:
+        context.set_executable(default_executable)
+
+    # Report the scenes in the order they were given
+    order = {scene: index for index, scene in enumerate(scenes)}
+    results.sort(key=lambda result: order[result['scene']])
+    failed = [result for result in results if result['status'] != 'ok']
+
+    return {
+        'scenes': results,
+        'operations': operations,
+        'workers': workers,
+        'seconds': time.perf_counter() - start_time,
+        'succeeded': len(results) - len(failed),
+        'failed': len(failed),
+    }
+
+def print_report(report):
+    print(f"{report['succeeded']} of {len(report['scenes'])} scene(s) done in {report['seconds']:.1f} s with {report['workers']} worker(s).")
+    for result in report['scenes']:
+        if result['status'] != 'ok':
+            print(f"\n{result['scene']} failed:\n{result['error']}")
+
+def write_report(report, path):
+    with open(path, 'w') as json_file:
+        json.dump(report, json_file, indent=2)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m camera_tools.scene_batch', description="Run camera tool operations on many scenes in parallel.")
+    parser.add_argument('operations', help="JSON file with the list of operations to run in every scene")
+    parser.add_argument('scenes', nargs='+', help="Scene files to process")
+    parser.add_argument('--output-dir', help="Directory the scenes are saved to, by default they are saved in place")
+    parser.add_argument('--workers', type=int, help="Number of mayapy processes, defaults to the number of cores")
+    parser.add_argument('--mayapy', help="Path of mayapy, found from the running interpreter or MAYA_LOCATION by default")
+    parser.add_argument('--report', help="Write the report to this JSON file")
+    args = parser.parse_args(argv)
+
+    try:
+        operations = load_operations(args.operations)
+    except (OSError, ValueError, KeyError) as error:
+        parser.error(str(error))
+
+    report = process_scenes(args.scenes, operations, args.output_dir, args.workers, args.mayapy)
+    if report is None:
+        return 1
+
+    print_report(report)
+    if args.report:
+        write_report(report, args.report)
+    return 1 if report['failed'] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
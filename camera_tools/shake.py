@@ -0,0 +1,222 @@
+import maya.cmds as cmds
+from maya.api import OpenMaya as om
+
+from . import batch
+from . import profiling
+from . import shake_node
+from . import undo
+from .nodes import LIVE_NOISE_ATTRIBUTES, get_node, queue_attributes
+from .noise import ROTATE_CHANNELS, bake_noise_on_objects, get_noise_frame_offset
+
+
+def get_live_noise_node(node):
+    # The shake noise node driving a control's rotation, or None
+    plug = om.MFnDependencyNode(node).findPlug('rotateX', False)
+    sources = plug.connectedTo(True, False)
+    if sources and om.MFnDependencyNode(sources[0].node()).typeName() == shake_node.NODE_NAME:
+        return sources[0].node()
+    return None
+
+def get_rotate_inputs(node):
+    # Anim curves on the rotate channels, or None when something else drives them
+    node_fn = om.MFnDependencyNode(node)
+    curves = []
+    for attribute in ROTATE_CHANNELS:
+        sources = node_fn.findPlug(attribute, False).connectedTo(True, False)
+        if not sources:
+            continue
+        if not sources[0].node().hasFn(om.MFn.kAnimCurve):
+            return None
+        curves.append(sources[0].node())
+    return curves
+
+def queue_live_noise_attribute(modifier, node, name, data_type):
+    numeric = om.MFnNumericAttribute()
+    attribute = numeric.create(name, name, data_type, 0)
+    numeric.keyable = True
+    modifier.addAttribute(node, attribute)
+
+def read_live_noise_settings(node):
+    node_fn = om.MFnDependencyNode(node)
+    settings = {}
+    for name, _, data_type in LIVE_NOISE_ATTRIBUTES:
+        plug = node_fn.findPlug(name, False)
+        settings[name] = plug.asInt() if data_type == om.MFnNumericData.kInt else plug.asDouble()
+    return settings
+
+@profiling.profiled
+@batch.batched
+def enable_live_noise(objects, rotation_noise_x, rotation_noise_y, rotation_noise_z, use_custom_range, start_frame, end_frame, ease_in_out, ease_value, seed=0, frequency=0.2, octaves=3):
+    # Drive the rotation of shake controls with a live noise node instead of keys. The settings are
+    # added to each control as keyable attributes, controls already in live mode only get the new settings.
+    # Keys on the rotate channels are replaced, their value at the current frame becomes the rest rotation.
+    if not use_custom_range:
+        start_frame = cmds.playbackOptions(query=True, min=True)
+        end_frame = cmds.playbackOptions(query=True, max=True)
+
+    settings = {
+        'shakeSeed': int(seed),
+        'shakeFrequency': float(frequency),
+        'shakeOctaves': int(octaves),
+        'shakeAmplitudeX': float(rotation_noise_x),
+        'shakeAmplitudeY': float(rotation_noise_y),
+        'shakeAmplitudeZ': float(rotation_noise_z),
+        'shakeStart': float(start_frame),
+        'shakeEnd': float(end_frame),
+        'shakeEase': float(ease_value) if ease_in_out else 0.0,
+    }
+
+    shake_node.load_plugin()
+    modifier = om.MDGModifier()
+    controls = []
+    networks = []
+    for name in objects:
+        node = get_node(name)
+        if node is None:
+            cmds.warning(f"{name} does not exist.")
+            continue
+
+        if get_live_noise_node(node) is None:
+            curves = get_rotate_inputs(node)
+            if curves is None:
+                cmds.warning(f"The rotation of {name} is driven by another node, it was left as it is.")
+                continue
+
+            node_fn = om.MFnDependencyNode(node)
+            offset = [node_fn.findPlug(attribute, False).asMAngle().asDegrees() for attribute in ROTATE_CHANNELS]
+            for curve in curves:
+                modifier.deleteNode(curve)
+            for attribute, _, data_type in LIVE_NOISE_ATTRIBUTES:
+                if not node_fn.hasAttribute(attribute):
+                    queue_live_noise_attribute(modifier, node, attribute, data_type)
+
+            noise_node = modifier.createNode(shake_node.NODE_NAME)
+            modifier.renameNode(noise_node, f"{name.split('|')[-1]}_ShakeNoise")
+            networks.append((node, noise_node, offset, get_noise_frame_offset(name)))
+        controls.append(node)
+
+    if not controls:
+        return []
+
+    profiling.note(objects=len(controls))
+
+    # The new attributes only have plugs once they exist, the connections follow in a second pass
+    # of the same modifier so both are undone together
+    modifier.doIt()
+
+    time_plug = om.MFnDependencyNode(get_node('time1')).findPlug('outTime', False)
+    for node, noise_node, offset, frame_offset in networks:
+        node_fn = om.MFnDependencyNode(node)
+        noise_fn = om.MFnDependencyNode(noise_node)
+        modifier.connect(time_plug, noise_fn.findPlug('time', False))
+        modifier.newPlugValueInt(noise_fn.findPlug('frameOffset', False), frame_offset)
+        for attribute, input_attribute, _ in LIVE_NOISE_ATTRIBUTES:
+            modifier.connect(node_fn.findPlug(attribute, False), noise_fn.findPlug(input_attribute, False))
+        for axis, attribute in enumerate(ROTATE_CHANNELS):
+            modifier.newPlugValueDouble(noise_fn.findPlug(f'offset{"XYZ"[axis]}', False), offset[axis])
+            modifier.connect(noise_fn.findPlug(f'outputRotate{"XYZ"[axis]}', False), node_fn.findPlug(attribute, False))
+
+    for node in controls:
+        node_fn = om.MFnDependencyNode(node)
+        modifier.newPlugValueInt(node_fn.findPlug('shakeSeed', False), settings['shakeSeed'])
+        modifier.newPlugValueInt(node_fn.findPlug('shakeOctaves', False), settings['shakeOctaves'])
+        queue_attributes(modifier, node, {name: value for name, value in settings.items() if name not in ('shakeSeed', 'shakeOctaves')})
+
+    undo.apply_modifier(modifier)
+
+    print(f"Live noise on {len(controls)} object(s), {len(networks)} new noise node(s).")
+    return [om.MFnDependencyNode(node).name() for node in controls]
+
+def queue_live_noise_removal(modifier, node, noise_node):
+    # Delete the noise node and put the control back at the rest rotation the node kept
+    noise_fn = om.MFnDependencyNode(noise_node)
+    offset = [noise_fn.findPlug(f'offset{axis}', False).asDouble() for axis in 'XYZ']
+    modifier.deleteNode(noise_node)
+    queue_attributes(modifier, node, dict(zip(ROTATE_CHANNELS, offset)))
+
+@profiling.profiled
+@batch.batched
+def disable_live_noise(objects):
+    # Remove the live noise node of each control, it goes back to its rest rotation.
+    # The settings stay on the control for the next time live mode is turned on.
+    modifier = om.MDGModifier()
+    controls = []
+    for name in objects:
+        node = get_node(name)
+        noise_node = get_live_noise_node(node) if node is not None else None
+        if noise_node is None:
+            continue
+
+        queue_live_noise_removal(modifier, node, noise_node)
+        controls.append(om.MFnDependencyNode(node).name())
+
+    if not controls:
+        cmds.warning("None of the objects are in live noise mode.")
+        return []
+
+    profiling.note(objects=len(controls))
+    undo.apply_modifier(modifier)
+    return controls
+
+@profiling.profiled
+@batch.batched
+def remove_noise(objects):
+    # Delete baked noise keys and live noise nodes from shake controls, which go back to zero rotation
+    modifier = om.MDGModifier()
+    controls = []
+    for name in objects:
+        node = get_node(name)
+        if node is None:
+            continue
+
+        noise_node = get_live_noise_node(node)
+        inputs = [noise_node] if noise_node is not None else get_rotate_inputs(node)
+        if inputs is None:
+            # Also the case for live noise nodes that came in as unknown because the plugin was not loaded
+            cmds.warning(f"The rotation of {name} is driven by another node, it was left as it is. Load shake_node.py first if it is a live noise node.")
+            continue
+        if not inputs:
+            continue
+
+        for input_node in inputs:
+            modifier.deleteNode(input_node)
+        queue_attributes(modifier, node, dict.fromkeys(ROTATE_CHANNELS, 0.0))
+        controls.append(om.MFnDependencyNode(node).name())
+
+    if controls:
+        profiling.note(objects=len(controls))
+        undo.apply_modifier(modifier)
+
+    print(f"Removed noise from {len(controls)} object(s).")
+    return controls
+
+@profiling.profiled
+@batch.batched
+def bake_live_noise(objects, bake_steps=1, key_tolerance=0.0, background=False):
+    # Turn live noise into keys with the regular noise bake, which computes the same values.
+    # Controls sharing their settings are baked together. The noise nodes are removed by the
+    # bake itself, so a cancelled bake leaves them live. Returns the bake jobs.
+    groups = {}
+    for name in objects:
+        node = get_node(name)
+        noise_node = get_live_noise_node(node) if node is not None else None
+        if noise_node is None:
+            cmds.warning(f"{name} is not in live noise mode.")
+            continue
+        key = tuple(sorted(read_live_noise_settings(node).items()))
+        if key not in groups:
+            groups[key] = ([], [], om.MDGModifier())
+        names, frame_offsets, modifier = groups[key]
+        names.append(om.MFnDependencyNode(node).name())
+        frame_offsets.append(om.MFnDependencyNode(noise_node).findPlug('frameOffset', False).asInt())
+        queue_live_noise_removal(modifier, node, noise_node)
+
+    jobs = []
+    for key, (names, frame_offsets, modifier) in groups.items():
+        settings = dict(key)
+        jobs.append(bake_noise_on_objects(
+            names, settings['shakeAmplitudeX'], settings['shakeAmplitudeY'], settings['shakeAmplitudeZ'],
+            bake_steps, True, settings['shakeStart'], settings['shakeEnd'], settings['shakeEase'] > 0, settings['shakeEase'],
+            seed=settings['shakeSeed'], frequency=settings['shakeFrequency'], octaves=settings['shakeOctaves'],
+            key_tolerance=key_tolerance, background=background, frame_offsets=frame_offsets, modifier=modifier))
+    return jobs
@@ -0,0 +1,126 @@
+import maya.cmds as cmds
+from maya.api import OpenMaya as om
+
+# Maya loads plugin files outside the package, so the noise math is imported by its full name
+from camera_tools.noise import NOISE_SCALE, fbm_noise, get_ease_factor
+
+
+NODE_NAME = 'cameraToolsShakeNoise'
+NODE_ID = om.MTypeId(0x0007f7a0)  # From the range Maya keeps for local nodes
+
+def maya_useNewAPI():
+    pass
+
+def create_vector(numeric, name, short_name, default):
+    # Numeric compound of X, Y and Z doubles so each axis can be connected on its own
+    axes = [numeric.create(f'{name}{axis}', f'{short_name}{axis.lower()}', om.MFnNumericData.kDouble, default) for axis in 'XYZ']
+    return numeric.create(name, short_name, *axes)
+
+def shake_rotation(frame, seed, frame_offset, frequency, octaves, amplitude, start_frame, end_frame, ease_value, offset):
+    # Rotation in degrees at any frame, the same values bake_noise_on_objects keys for these
+    # settings with frame_offset being the object's offset. Outside the frame range the control rests at its offset.
+    if frame < start_frame or frame > end_frame:
+        factor = 0.0
+    elif ease_value > 0:
+        factor = get_ease_factor(frame, start_frame, end_frame, ease_value)
+    else:
+        factor = 1.0
+
+    return [offset[axis] + amplitude[axis] * NOISE_SCALE * factor * float(fbm_noise(seed * 3 + axis, (frame + frame_offset) * frequency, octaves))
+            for axis in range(3)]
+
+class ShakeNoiseNode(om.MPxNode):
+    # Seeded, time driven noise for a shake control's rotation, evaluated live instead of baked
+
+    time = None
+    seed = None
+    frame_offset = None
+    frequency = None
+    octaves = None
+    amplitude = None
+    start_frame = None
+    end_frame = None
+    ease = None
+    offset = None
+    output_rotate = None
+    output_rotate_axes = ()
+
+    def __init__(self):
+        om.MPxNode.__init__(self)
+
+    def compute(self, plug, data):
+        if plug.isChild:
+            plug = plug.parent()
+        if plug != ShakeNoiseNode.output_rotate:
+            return None
+
+        cls = ShakeNoiseNode
+        frame = data.inputValue(cls.time).asTime().asUnits(om.MTime.uiUnit())
+        rotation = shake_rotation(
+            frame,
+            data.inputValue(cls.seed).asInt(),
+            data.inputValue(cls.frame_offset).asInt(),
+            data.inputValue(cls.frequency).asDouble(),
+            data.inputValue(cls.octaves).asInt(),
+            data.inputValue(cls.amplitude).asDouble3(),
+            data.inputValue(cls.start_frame).asDouble(),
+            data.inputValue(cls.end_frame).asDouble(),
+            data.inputValue(cls.ease).asDouble(),
+            data.inputValue(cls.offset).asDouble3(),
+        )
+
+        for attribute, value in zip(cls.output_rotate_axes, rotation):
+            data.outputValue(attribute).setMAngle(om.MAngle(value, om.MAngle.kDegrees))
+        data.setClean(plug)
+
+    @staticmethod
+    def creator():
+        return ShakeNoiseNode()
+
+    @staticmethod
+    def initialize():
+        cls = ShakeNoiseNode
+        numeric = om.MFnNumericAttribute()
+        unit = om.MFnUnitAttribute()
+
+        cls.time = unit.create('time', 'tm', om.MFnUnitAttribute.kTime, 0.0)
+
+        cls.seed = numeric.create('seed', 'sd', om.MFnNumericData.kInt, 0)
+        # Set once from the control's name, renaming the control later keeps its shake
+        cls.frame_offset = numeric.create('frameOffset', 'fo', om.MFnNumericData.kInt, 0)
+        cls.frequency = numeric.create('frequency', 'fq', om.MFnNumericData.kDouble, 0.2)
+        numeric.setMin(0.0)
+        cls.octaves = numeric.create('octaves', 'oc', om.MFnNumericData.kInt, 3)
+        numeric.setMin(1)
+        cls.amplitude = create_vector(numeric, 'amplitude', 'amp', 0.0)
+        cls.start_frame = numeric.create('startFrame', 'sf', om.MFnNumericData.kDouble, 1.0)
+        cls.end_frame = numeric.create('endFrame', 'ef', om.MFnNumericData.kDouble, 100.0)
+        cls.ease = numeric.create('ease', 'es', om.MFnNumericData.kDouble, 0.0)
+        numeric.setMin(0.0)
+        cls.offset = create_vector(numeric, 'offset', 'ofs', 0.0)
+
+        axes = []
+        for axis in 'XYZ':
+            axes.append(unit.create(f'outputRotate{axis}', f'or{axis.lower()}', om.MFnUnitAttribute.kAngle, 0.0))
+            unit.writable = False
+            unit.storable = False
+        cls.output_rotate_axes = tuple(axes)
+        cls.output_rotate = numeric.create('outputRotate', 'or', *axes)
+        numeric.writable = False
+        numeric.storable = False
+
+        inputs = (cls.time, cls.seed, cls.frame_offset, cls.frequency, cls.octaves, cls.amplitude, cls.start_frame, cls.end_frame, cls.ease, cls.offset)
+        for attribute in (*inputs, cls.output_rotate):
+            cls.addAttribute(attribute)
+        for attribute in inputs:
+            cls.attributeAffects(attribute, cls.output_rotate)
+
+def initializePlugin(plugin):
+    om.MFnPlugin(plugin).registerNode(NODE_NAME, NODE_ID, ShakeNoiseNode.creator, ShakeNoiseNode.initialize)
+
+def uninitializePlugin(plugin):
+    om.MFnPlugin(plugin).deregisterNode(NODE_ID)
+
+def load_plugin():
+    if not cmds.pluginInfo(__file__, query=True, loaded=True):
+        cmds.loadPlugin(__file__, quiet=True)
@@ -0,0 +1,203 @@
+import maya.cmds as cmds
+from maya.api import OpenMaya as om
+from maya.api import OpenMayaAnim as oma
+import numpy as np
+
+from . import batch
+from . import profiling
+from . import registry
+from . import undo
+from .curves import get_anim_curve, read_anim_curves, write_anim_curve_keys
+from .nodes import get_node
+from .renumber import RIG_NODE_PATTERN
+
+
+SMOOTHING_METHODS = ('gaussian', 'lowpass', 'savgol')
+
+SMOOTHING_CHANNELS = ('translateX', 'translateY', 'translateZ', 'rotateX', 'rotateY', 'rotateZ')
+
+# Order of the Butterworth response of the low-pass filter, applied forward and backward
+LOWPASS_ORDER = 2
+
+# Frames key spacings may differ by and still count as evenly keyed
+KEY_SPACING_TOLERANCE = 1e-4
+
+def pad_rows(values, radius):
+    # Extend every row by odd reflection so the ends keep their slope instead of pulling toward zero
+    return np.pad(values, [(0, 0), (radius, radius)], mode='reflect', reflect_type='odd')
+
+def convolve_rows(values, kernel):
+    # Convolve every row with a symmetric kernel, which leaves the motion in phase
+    radius = len(kernel) // 2
+    windows = np.lib.stride_tricks.sliding_window_view(pad_rows(values, radius), len(kernel), axis=-1)
+    return windows @ kernel
+
+def gaussian_radius(sigma):
+    return max(1, int(np.ceil(3 * sigma)))
+
+def gaussian_filter(values, sigma):
+    # sigma in samples
+    radius = gaussian_radius(sigma)
+    offsets = np.arange(-radius, radius + 1)
+    kernel = np.exp(-0.5 * (offsets / max(sigma, 1e-6)) ** 2)
+    return convolve_rows(values, kernel / kernel.sum())
+
+def savgol_coefficients(window, order):
+    # Smoothing weights of a least squares polynomial fit over the window
+    half = window // 2
+    offsets = np.arange(-half, half + 1, dtype=float)
+    return np.linalg.pinv(offsets[:, None] ** np.arange(order + 1)[None])[0]
+
+def savgol_window(window, order):
+    # window in samples, made odd and wider than the polynomial order
+    return max(int(window) // 2 * 2 + 1, order + 2 + order % 2)
+
+def savgol_filter(values, window, order):
+    return convolve_rows(values, savgol_coefficients(savgol_window(window, order), order))
+
+def lowpass_filter(values, cutoff, order=LOWPASS_ORDER):
+    # Zero phase Butterworth low-pass, cutoff in cycles per sample. The squared magnitude is applied
+    # in the frequency domain, the same response as running the filter forward and then backward.
+    radius = values.shape[-1] - 1
+    padded = pad_rows(values, radius)
+    frequencies = np.fft.rfftfreq(padded.shape[-1])
+    gain = 1.0 / (1.0 + (frequencies / cutoff) ** (2 * order))
+    filtered = np.fft.irfft(np.fft.rfft(padded, axis=-1) * gain, n=padded.shape[-1], axis=-1)
+    return filtered[:, radius:radius + values.shape[-1]]
+
+def filter_rows(values, method, width, order):
+    # width is in samples: the Gaussian sigma, the period the low-pass starts to remove, or the Savitzky-Golay window
+    if method == 'gaussian':
+        return gaussian_filter(values, width)
+    if method == 'lowpass':
+        return lowpass_filter(values, 1.0 / max(width, 2.0))
+    return savgol_filter(values, width, order)
+
+def get_filter_window(method, width, order):
+    # Samples the filter reaches across, width in samples as for filter_rows
+    if method == 'gaussian':
+        return 2 * gaussian_radius(width) + 1
+    if method == 'savgol':
+        return savgol_window(width, order)
+    return 1
+
+def get_sample_times(times):
+    # The key times when the keys are evenly spaced, otherwise an even grid over the keys to resample
+    # them on. The grid takes the smallest key spacing, but no less than a frame unless most keys are closer.
+    steps = np.diff(times)
+    if np.allclose(steps, steps[0], rtol=0.0, atol=KEY_SPACING_TOLERANCE):
+        return times
+    spacing = max(float(steps.min()), min(float(np.median(steps)), 1.0))
+    return np.linspace(times[0], times[-1], int(round((times[-1] - times[0]) / spacing)) + 1)
+
+def resolve_smoothing_targets(objects):
+    # Rigs are smoothed on their main and shake controls, other objects as they are
+    rig_names = registry.get_registry().rig_names
+    targets = []
+    for obj in objects:
+        match = RIG_NODE_PATTERN.match(obj.split('|')[-1])
+        rig_name = f'CAM_{match.group(1)}' if match else None
+        names = [f'{rig_name}_Main', f'{rig_name}_Shake_CTL'] if rig_name in rig_names else [obj]
+        targets.extend(name for name in names if name not in targets)
+    return targets
+
+def collect_curves(objects):
+    # Anim curves on the smoothed channels that have enough keys to filter
+    curves = []
+    for obj in objects:
+        node = get_node(obj)
+        if node is None:
+            continue
+        node_fn = om.MFnDependencyNode(node)
+        for attribute in SMOOTHING_CHANNELS:
+            anim_curve = get_anim_curve(node_fn.findPlug(attribute, False))
+            if anim_curve is not None and anim_curve.numKeys >= 3:
+                curves.append(anim_curve)
+    return curves
+
+@profiling.profiled
+@batch.batched
+def smooth_selected_rigs(method='gaussian', width=3.0, order=3, start_frame=None, end_frame=None, unwrap=True):
+    selection = cmds.ls(selection=True) or []
+    if not selection:
+        cmds.warning("Please select one or more camera rigs or animated objects.")
+        return None
+
+    return smooth_animation(resolve_smoothing_targets(selection), method, width, order, start_frame, end_frame, unwrap)
+
+@profiling.profiled
+@batch.batched
+def smooth_animation(objects, method='gaussian', width=3.0, order=3, start_frame=None, end_frame=None, unwrap=True):
+    # Smooth the translate and rotate keys of the objects. method is 'gaussian', 'lowpass' or 'savgol'
+    # and width is in frames: the Gaussian sigma, the shortest period the low-pass keeps, or the
+    # Savitzky-Golay window with a polynomial of the given order. Rotations are unwrapped first so
+    # flips across +-180 degrees do not get smoothed into spins. Unevenly keyed curves are filtered
+    # on an even grid and read back at their key times, and curves shorter than the filter window are
+    # left alone. Keys outside start_frame to end_frame keep their values. All keys are read with one
+    # query and written back as one undo step. Returns the number of curves smoothed.
+    if method not in SMOOTHING_METHODS:
+        cmds.warning(f"Unknown smoothing method '{method}', expected one of {', '.join(SMOOTHING_METHODS)}.")
+        return 0
+
+    curves = collect_curves(objects)
+    if not curves:
+        cmds.warning("No animated translate or rotate channels to smooth.")
+        return 0
+
+    keys = read_anim_curves(curves)
+    profiling.note(objects=len(curves), frames=sum(len(curve['times']) for curve in keys))
+
+    # Curves with the same number and spacing of samples are filtered together as rows of one array,
+    # sample_times only holds the grids of resampled curves
+    sample_times = {}
+    groups = {}
+    skipped = 0
+    for index, curve in enumerate(keys):
+        times = curve['times']
+        samples = get_sample_times(times)
+        if samples is not times:
+            sample_times[index] = samples
+        spacing = float(samples[1] - samples[0])
+        if len(samples) < get_filter_window(method, width / spacing, order):
+            skipped += 1
+            continue
+        groups.setdefault((len(samples), round(spacing, 6), curve['type'] == oma.MFnAnimCurve.kAnimCurveTA), []).append(index)
+
+    change = oma.MAnimCurveChange()
+    time_unit = om.MTime.uiUnit()
+    smoothed_keys = 0
+    for (_, spacing, angles), indices in groups.items():
+        curve_times = []
+        curve_values = []
+        rows = []
+        for index in indices:
+            times, values = keys[index]['times'], keys[index]['values']
+            if angles and unwrap:
+                values = np.unwrap(values)
+            curve_times.append(times)
+            curve_values.append(values)
+            rows.append(np.interp(sample_times[index], times, values) if index in sample_times else values)
+
+        filtered = filter_rows(np.stack(rows), method, width / spacing, order)
+
+        # Baked channels usually share their key times, the time array is only rebuilt when they change
+        key_times = None
+        for row, index in enumerate(indices):
+            times, values = curve_times[row], curve_values[row]
+            smoothed = np.interp(times, sample_times[index], filtered[row]) if index in sample_times else filtered[row]
+            if start_frame is not None or end_frame is not None:
+                in_range = (times >= (-np.inf if start_frame is None else start_frame)) & (times <= (np.inf if end_frame is None else end_frame))
+                smoothed = np.where(in_range, smoothed, values)
+
+            if key_times is None or not np.array_equal(times, curve_times[row - 1]):
+                key_times = om.MTimeArray([om.MTime(time, time_unit) for time in times.tolist()])
+            write_anim_curve_keys(curves[index], key_times, smoothed.tolist(), keys[index]['in_tangents'], keys[index]['out_tangents'], change)
+            smoothed_keys += len(times)
+
+    undo.record_applied(change)
+
+    if skipped:
+        cmds.warning(f"Left {skipped} curve(s) with fewer keys than the {method} filter window unchanged, use a smaller width to smooth them.")
+    smoothed_curves = len(curves) - skipped
+    print(f"Smoothed {smoothed_curves} curve(s) with {smoothed_keys} key(s) using the {method} filter.")
+    return smoothed_curves
@@ -0,0 +1,350 @@
+import itertools
+import math
+import os
+
+from maya.api import OpenMaya as om
+from maya.api import OpenMayaAnim as oma
+import numpy as np
+
+from . import profiling
+from .curves import get_anim_curve, read_anim_curves
+from .nodes import LIVE_NOISE_ATTRIBUTES, evaluation_time, get_dag_path, get_node
+
+
+# Set to a directory to keep the trajectory arrays in memory-mapped files instead of RAM
+TRAJECTORY_DIRECTORY = os.environ.get('CAMERA_TOOLS_TRAJECTORY_DIR')
+
+# Frames added past the requested range whenever the store grows, so scrubbing
+# a little further does not reallocate the arrays every frame
+TRAJECTORY_FRAME_PADDING = 100
+
+TRANSFORM_CHANNELS = ['translateX', 'translateY', 'translateZ', 'rotateX', 'rotateY', 'rotateZ', 'scaleX', 'scaleY', 'scaleZ']
+
+# Attributes that move a transform when they are set
+MATRIX_ATTRIBUTES = ('translate', 'rotate', 'scale', 'shear', 'inheritsTransform', 'offsetParentMatrix')
+
+# Live noise settings on a shake control, they move it through its noise node
+NOISE_ATTRIBUTES = tuple(name for name, _, _ in LIVE_NOISE_ATTRIBUTES)
+
+def changed_range(old_times, old_values, new_times, new_values):
+    # Frames an anim curve edit can change, spline tangents reach two keys to each side
+    all_times = np.union1d(old_times, new_times)
+    in_old = np.isin(all_times, old_times)
+    in_new = np.isin(all_times, new_times)
+    changed = in_old != in_new
+
+    both = np.flatnonzero(in_old & in_new)
+    old_at = old_values[np.searchsorted(old_times, all_times[both])]
+    new_at = new_values[np.searchsorted(new_times, all_times[both])]
+    changed[both[old_at != new_at]] = True
+
+    if not changed.any():
+        # Only tangents or other settings changed, assume the whole curve did
+        return -math.inf, math.inf
+
+    first, last = np.flatnonzero(changed)[[0, -1]]
+    start = all_times[first - 2] if first >= 2 else -math.inf
+    end = all_times[last + 2] if last + 2 < len(all_times) else math.inf
+    return start, end
+
+class TrajectoryStore(object):
+    # World matrices of cameras on whole frames, evaluated once and kept until a
+    # transform or anim curve that moves the camera changes
+
+    def __init__(self, directory=None):
+        self.directory = directory
+        self.file_ids = itertools.count()
+        self.files = []
+        self.start_frame = 0
+        self.matrices = np.zeros((0, 0, 16))
+        self.valid = np.zeros((0, 0), dtype=bool)
+        self.slots = {}  # camera transform path -> row in the arrays
+        self.free_slots = []
+        self.matrix_plugs = {}  # camera transform path -> worldMatrix plug
+        self.handles = {}  # camera transform path -> MObjectHandle
+        self.node_watchers = {}  # node hash -> handle, callback ids and the cameras it moves
+        self.curves = {}  # anim curve hash -> handle, callback id, cameras and the keys last seen
+        self.pending_curves = set()
+        self.callback_ids = []
+
+    # Storage
+
+    def new_array(self, name, shape, dtype):
+        if self.directory is None:
+            return np.zeros(shape, dtype=dtype)
+
+        path = os.path.join(self.directory, f'camera_trajectories_{name}_{next(self.file_ids)}.npy')
+        self.files.append(path)
+        return np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=shape)
+
+    def remove_old_files(self, keep):
+        for path in [path for path in self.files if path not in keep]:
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self.files.remove(path)
+
+    def reserve(self, first_frame, last_frame):
+        # Grow the arrays to hold every camera and frame, keeping what is already evaluated
+        slot_count, frame_count = self.valid.shape
+        end_frame = self.start_frame + frame_count - 1
+        if len(self.slots) <= slot_count and frame_count and self.start_frame <= first_frame and last_frame <= end_frame:
+            return
+
+        if frame_count:
+            start_frame = min(self.start_frame, first_frame - TRAJECTORY_FRAME_PADDING) if first_frame < self.start_frame else self.start_frame
+            end_frame = max(end_frame, last_frame + TRAJECTORY_FRAME_PADDING) if last_frame > end_frame else end_frame
+        else:
+            start_frame, end_frame = first_frame, last_frame
+        new_slot_count = max(len(self.slots), slot_count * 2 if len(self.slots) > slot_count else slot_count, 1)
+
+        matrices = self.new_array('matrices', (new_slot_count, end_frame - start_frame + 1, 16), np.float64)
+        valid = self.new_array('valid', (new_slot_count, end_frame - start_frame + 1), bool)
+        offset = self.start_frame - start_frame
+        matrices[:slot_count, offset:offset + frame_count] = self.matrices
+        valid[:slot_count, offset:offset + frame_count] = self.valid
+
+        self.matrices, self.valid, self.start_frame = matrices, valid, start_frame
+        if self.directory is not None:
+            self.remove_old_files([matrices.filename, valid.filename])
+
+    # Cameras
+
+    def add_camera(self, camera):
+        dag_path = get_dag_path(camera)
+        if not dag_path.hasFn(om.MFn.kTransform):
+            dag_path.pop()
+        key = dag_path.fullPathName()
+
+        handle = self.handles.get(key)
+        if handle is not None and handle.isValid():
+            return key
+        if handle is not None:
+            self.remove_camera(key)
+
+        self.slots[key] = self.free_slots.pop() if self.free_slots else len(self.slots)
+        self.handles[key] = om.MObjectHandle(dag_path.node())
+        self.matrix_plugs[key] = om.MFnDependencyNode(dag_path.node()).findPlug('worldMatrix', False).elementByLogicalIndex(0)
+
+        # Every transform above the camera moves it, and so does its aim locator
+        paths = [om.MDagPath(dag_path)]
+        locator = get_node(f"{key.split('|')[-1]}_Loc")
+        if locator is not None:
+            paths.append(om.MDagPath.getAPathTo(locator))
+        for path in paths:
+            while path.length() > 0:
+                self.watch_node(path.node(), key)
+                path.pop()
+
+        return key
+
+    def remove_camera(self, camera):
+        slot = self.slots.pop(camera, None)
+        if slot is None:
+            return
+
+        if slot < len(self.valid):
+            self.valid[slot] = False
+        self.free_slots.append(slot)
+        self.matrix_plugs.pop(camera, None)
+        self.handles.pop(camera, None)
+
+        for watchers, remove in ((self.node_watchers, self.unwatch_node), (self.curves, self.unwatch_curve)):
+            for node_hash, watcher in list(watchers.items()):
+                watcher['cameras'].discard(camera)
+                if not watcher['cameras']:
+                    remove(node_hash)
+
+    def invalidate(self, camera, start=-math.inf, end=math.inf):
+        slot = self.slots.get(camera)
+        if slot is None or slot >= len(self.valid):
+            return
+
+        frame_count = self.valid.shape[1]
+        first = 0 if start == -math.inf else max(int(math.ceil(start)) - self.start_frame, 0)
+        last = frame_count if end == math.inf else min(int(math.floor(end)) - self.start_frame + 1, frame_count)
+        if first < last:
+            self.valid[slot, first:last] = False
+
+    def clear(self):
+        for camera in list(self.slots):
+            self.remove_camera(camera)
+        self.slots.clear()
+        self.free_slots = []
+        self.pending_curves.clear()
+
+    # Dirty tracking
+
+    def watch_node(self, node, camera):
+        handle = om.MObjectHandle(node)
+        node_hash = handle.hashCode()
+        watcher = self.node_watchers.get(node_hash)
+        if watcher is None:
+            watcher = self.node_watchers[node_hash] = {'handle': handle, 'cameras': set(), 'callback_ids': [
+                om.MNodeMessage.addAttributeChangedCallback(node, self.on_node_changed, node_hash),
+                om.MNodeMessage.addNameChangedCallback(node, self.on_node_renamed, node_hash),
+            ]}
+        watcher['cameras'].add(camera)
+
+        node_fn = om.MFnDependencyNode(node)
+        channels = TRANSFORM_CHANNELS + list(NOISE_ATTRIBUTES) if node_fn.hasAttribute(NOISE_ATTRIBUTES[0]) else TRANSFORM_CHANNELS
+        for attribute in channels:
+            anim_curve = get_anim_curve(node_fn.findPlug(attribute, False))
+            if anim_curve is not None:
+                self.watch_curve(anim_curve, camera)
+
+    def unwatch_node(self, node_hash):
+        watcher = self.node_watchers.pop(node_hash, None)
+        if watcher is not None:
+            om.MMessage.removeCallbacks(watcher['callback_ids'])
+
+    def watch_curve(self, anim_curve, camera):
+        handle = om.MObjectHandle(anim_curve.object())
+        curve_hash = handle.hashCode()
+        entry = self.curves.get(curve_hash)
+        if entry is None:
+            # The keys are read with the other pending curves
+            entry = self.curves[curve_hash] = {
+                'handle': handle,
+                'cameras': set(),
+                'times': None,
+                'values': None,
+                'callback_ids': [om.MNodeMessage.addAttributeChangedCallback(anim_curve.object(), self.on_curve_changed, curve_hash)],
+            }
+            self.pending_curves.add(curve_hash)
+        entry['cameras'].add(camera)
+
+    def unwatch_curve(self, curve_hash):
+        entry = self.curves.pop(curve_hash, None)
+        self.pending_curves.discard(curve_hash)
+        if entry is not None:
+            om.MMessage.removeCallbacks(entry['callback_ids'])
+
+    def on_node_changed(self, message, plug, other_plug, node_hash):
+        watcher = self.node_watchers.get(node_hash)
+        if watcher is None:
+            return
+
+        if message & (om.MNodeMessage.kConnectionMade | om.MNodeMessage.kConnectionBroken):
+            # A channel gained or lost its driver, the cameras are watched again on the next query
+            for camera in list(watcher['cameras']):
+                self.remove_camera(camera)
+        elif message & om.MNodeMessage.kAttributeSet and plug.partialName(useLongNames=True).startswith(MATRIX_ATTRIBUTES + NOISE_ATTRIBUTES):
+            for camera in watcher['cameras']:
+                self.invalidate(camera)
+
+    def on_node_renamed(self, node, previous_name, node_hash):
+        watcher = self.node_watchers.get(node_hash)
+        if watcher is not None:
+            for camera in list(watcher['cameras']):
+                self.remove_camera(camera)
+
+    def on_curve_changed(self, message, plug, other_plug, curve_hash):
+        # Only remembered here, the edit is measured on the next query
+        self.pending_curves.add(curve_hash)
+
+    def resolve_pending_curves(self):
+        # Keys of every new or edited curve are read together
+        entries = []
+        for curve_hash in list(self.pending_curves):
+            entry = self.curves.get(curve_hash)
+            if entry is None:
+                continue
+
+            if not entry['handle'].isValid():
+                for camera in list(entry['cameras']):
+                    self.invalidate(camera)
+                self.unwatch_curve(curve_hash)
+                continue
+            entries.append(entry)
+
+        anim_curves = [oma.MFnAnimCurve(entry['handle'].object()) for entry in entries]
+        for entry, keys in zip(entries, read_anim_curves(anim_curves, tangents=False)):
+            times, values = keys['times'], keys['values']
+            if entry['times'] is not None:
+                start, end = changed_range(entry['times'], entry['values'], times, values)
+                for camera in entry['cameras']:
+                    self.invalidate(camera, start, end)
+            entry['times'], entry['values'] = times, values
+
+        self.pending_curves.clear()
+
+    def install_callbacks(self):
+        if self.callback_ids:
+            return
+
+        self.callback_ids = [
+            om.MSceneMessage.addCallback(om.MSceneMessage.kAfterNew, self.on_scene_changed),
+            om.MSceneMessage.addCallback(om.MSceneMessage.kAfterOpen, self.on_scene_changed),
+        ]
+
+    def remove_callbacks(self):
+        self.clear()
+        if self.callback_ids:
+            om.MMessage.removeCallbacks(self.callback_ids)
+        self.callback_ids = []
+
+    def on_scene_changed(self, client_data):
+        self.clear()
+
+    # Queries
+
+    def world_matrices(self, cameras, frames):
+        # (cameras, frames, 4, 4) world matrices, only frames that are not stored yet get evaluated
+        frames = np.asarray(frames, dtype=float)
+        whole_frames = np.round(frames)
+        keys = [self.add_camera(camera) for camera in cameras]
+        self.resolve_pending_curves()
+        if not len(frames) or not keys:
+            return np.zeros((len(keys), len(frames), 4, 4))
+        if not np.allclose(frames, whole_frames):
+            # Subframes are not stored
+            return evaluate_world_matrices([self.matrix_plugs[key] for key in keys], frames.tolist())
+
+        whole_frames = whole_frames.astype(int)
+        self.reserve(int(whole_frames.min()), int(whole_frames.max()))
+        rows = np.array([self.slots[key] for key in keys])[:, None]
+        columns = (whole_frames - self.start_frame)[None, :]
+
+        missing = ~self.valid[rows, columns]
+        missing_frames = np.flatnonzero(missing.any(axis=0))
+        if len(missing_frames):
+            profiling.note(frames=len(missing_frames))
+            for frame_index in missing_frames.tolist():
+                camera_indices = np.flatnonzero(missing[:, frame_index]).tolist()
+                with evaluation_time(float(whole_frames[frame_index])):
+                    for camera_index in camera_indices:
+                        self.matrices[rows[camera_index, 0], columns[0, frame_index]] = list(om.MFnMatrixData(self.matrix_plugs[keys[camera_index]].asMObject()).matrix())
+                self.valid[rows[camera_indices, 0], columns[0, frame_index]] = True
+
+        return self.matrices[rows, columns].reshape(len(keys), len(frames), 4, 4)
+
+def unscaled_axes(matrices):
+    # X, Y and Z axis rows of world matrices as unit vectors, the rig scale does not change the view
+    axes = matrices[..., :3, :3]
+    return axes / np.linalg.norm(axes, axis=-1, keepdims=True)
+
+def evaluate_world_matrices(matrix_plugs, frames):
+    matrices = np.empty((len(matrix_plugs), len(frames), 16))
+    for frame_index, frame in enumerate(frames):
+        with evaluation_time(frame):
+            for camera_index, matrix_plug in enumerate(matrix_plugs):
+                matrices[camera_index, frame_index] = list(om.MFnMatrixData(matrix_plug.asMObject()).matrix())
+    return matrices.reshape(len(matrix_plugs), len(frames), 4, 4)
+
+_store = None
+
+def get_trajectory_store():
+    # Shared store, emptied whenever a new scene is opened
+    global _store
+    if _store is None:
+        _store = TrajectoryStore(TRAJECTORY_DIRECTORY)
+        _store.install_callbacks()
+    return _store
+
+def reset_trajectory_store():
+    global _store
+    if _store is not None:
+        _store.remove_callbacks()
+    _store = None
@@ -0,0 +1,452 @@
+import maya.cmds as cmds
+import maya.utils
+from maya.api import OpenMaya as om
+
+from . import profiling
+from . import registry
+from .aim import set_camera_aim
+from .lens import key_focal_length, set_camera_focal_length, solve_selected_dolly_zoom
+from .nodes import get_node
+from .noise import bake_noise_on_selected_objects
+from .rig import DEFAULT_COLOR, create_camera
+from .shake import bake_live_noise, enable_live_noise
+from .smoothing import smooth_selected_rigs
+
+
+# Global variable to store the last selected RGB color
+selected_color = list(DEFAULT_COLOR)
+button_id = None  # Global variable for button ID to use in color editor
+camera_list_panel = None  # Camera list shown in the Camera Tools window
+
+# Number of camera rows created in the Camera Tools window
+CAMERA_LIST_PAGE_SIZE = 12
+
+def show_color_editor(*args):
+    global button_id  # Use the global button ID
+    # Open the color editor in mini mode
+    cmds.colorEditor(mini=False, rgb=cmds.button(button_id, query=True, backgroundColor=True))
+
+    # Check if the user clicked "OK" in the color editor
+    if cmds.colorEditor(query=True, rgb=True):
+        rgb = cmds.colorEditor(query=True, rgb=True)
+        # Change the button color based on the selected color
+        cmds.button(button_id, edit=True, backgroundColor=rgb)
+        # Update the selected color
+        global selected_color
+        selected_color = rgb
+
+def select_main_object(main_name):
+    if cmds.objExists(main_name):
+        cmds.select(main_name)
+
+def toggle_visibility(main_name, button):
+    if cmds.objExists(main_name):
+        current_visibility = cmds.getAttr(main_name + ".visibility")
+        new_visibility = not current_visibility
+        cmds.setAttr(main_name + ".visibility", new_visibility)
+
+        # Update button icon based on new visibility state
+        icon = 'eye.png' if new_visibility else 'eyeHide.png'  # Ensure you have eyeHide.png for the hidden state
+        cmds.iconTextButton(button, edit=True, image=icon)
+
+def create_smoothing_window():
+    if cmds.window("smoothingWindow", exists=True):
+        cmds.deleteUI("smoothingWindow")
+
+    cmds.window("smoothingWindow", title="Smooth Motion", widthHeight=(300, 150))
+    cmds.columnLayout(columnAlign='center', adjustableColumn=True, mar=5)
+
+    cmds.text(label="Smooth the selected rigs or objects", align='center')
+
+    # Menu labels and the filter each one runs
+    methods = {'Gaussian': 'gaussian', 'Low-pass': 'lowpass', 'Savitzky-Golay': 'savgol'}
+    method_menu = cmds.optionMenu(label="Filter:")
+    for label in methods:
+        cmds.menuItem(label=label)
+
+    cmds.rowLayout(numberOfColumns=4, columnAlign=(1, 'center'))
+    cmds.text(label='   Width (frames):', align='center')
+    width_field = cmds.floatField(value=3.0, minValue=0.1, step=0.5, pre=1, width=50)
+    cmds.text(label='Order:', align='center')
+    order_field = cmds.intField(value=3, minValue=1, maxValue=6, width=30)
+    cmds.setParent('..')  # Go back to the parent layout
+
+    unwrap_checkbox = cmds.checkBox(label="Unwrap Rotations", value=True, align='center')
+
+    def on_smooth(*args):
+        method = methods[cmds.optionMenu(method_menu, query=True, value=True)]
+        smooth_selected_rigs(method,
+                             cmds.floatField(width_field, query=True, value=True),
+                             cmds.intField(order_field, query=True, value=True),
+                             unwrap=cmds.checkBox(unwrap_checkbox, query=True, value=True))
+
+    cmds.button(label="Smooth", command=on_smooth)
+
+    cmds.showWindow("smoothingWindow")
+
+def show_custom_lens_window():
+    if cmds.window("customLensWindow", exists=True):
+        cmds.deleteUI("customLensWindow")
+
+    window = cmds.window("customLensWindow", title="Custom Lens", widthHeight=(100, 100))
+    cmds.columnLayout(adjustableColumn=True)
+
+    cmds.text(label="Enter Custom Focal Length:")
+    focal_length_field = cmds.floatField(value=35, minValue=1, pre=1)  # Default value
+
+    def apply_custom_focal_length(*args):
+        focal_length = cmds.floatField(focal_length_field, query=True, value=True)
+        set_camera_focal_length(focal_length)
+        cmds.deleteUI(window)  # Close the window after applying
+
+    cmds.button(label="Apply", command=apply_custom_focal_length)
+    cmds.showWindow(window)
+
+def lens_pack():
+    if cmds.window("focalLengthWindow", exists=True):
+        cmds.deleteUI("focalLengthWindow")
+
+    window = cmds.window("focalLengthWindow", title="Lens Pack", widthHeight=(300, 150))  # Increased height
+
+    # Create a main layout
+    cmds.columnLayout(adjustableColumn=False)
+
+    # Focal length buttons
+    cmds.rowLayout(numberOfColumns=7, adjustableColumn=3, columnWidth=[(1, 50), (2, 50), (3, 50), (4, 50), (5, 50), (6, 50), (7, 50)], mar=10)
+
+    focal_lengths = [18, 24, 35, 50, 85, 100, 135]
+    for length in focal_lengths:
+        cmds.button(label=str(length) + 'mm', command=lambda _, l=length: set_camera_focal_length(l), width=50)
+
+    cmds.setParent('..')  # Go back to the main layout
+
+    # Add a new row for the additional features
+    cmds.rowLayout(numberOfColumns=4, adjustableColumn=2)
+    
+    cmds.text(label='                     ')
+    cmds.button(label="Key Focal Length", command=lambda _: key_focal_length())
+    cmds.button(label="Custom Lens", command=lambda _: show_custom_lens_window())
+    # Select the camera, then the subject, the lens is keyed over the playback range
+    cmds.button(label="Dolly Zoom", command=lambda _: solve_selected_dolly_zoom())
+
+    cmds.setParent('..')  # Go back to the main layout
+    cmds.showWindow(window)
+
+def create_noise_window():
+    if cmds.window("noiseWindow", exists=True):
+        cmds.deleteUI("noiseWindow")
+
+    cmds.window("noiseWindow", title="Shoulder Noise", widthHeight=(400, 300))
+
+    cmds.columnLayout(columnAlign='center', adjustableColumn=True, mar=5)
+
+    cmds.text(label="Bake Shoulder Noise", align='center')
+
+    # Single row layout for all axes
+    cmds.rowLayout(numberOfColumns=6, columnAlign=(1, 'center'))
+
+    cmds.text(label=' X:  ')
+    rotation_noise_x_field = cmds.floatField(value=0.5, step=0.1, pre=0)
+
+    cmds.text(label='Y:  ')
+    rotation_noise_y_field = cmds.floatField(value=0.5, step=0.1, pre=0)
+
+    cmds.text(label='Z:  ')
+    rotation_noise_z_field = cmds.floatField(value=0.5, step=0.1, pre=0)
+
+    cmds.setParent('..')  # Go back to the parent layout
+
+    cmds.text(label="Baking Steps:", align='center')
+    bake_steps_field = cmds.intField(value=1, minValue=1)
+
+    # Row layout for the noise seed and frequency
+    cmds.rowLayout(numberOfColumns=4, columnAlign=(1, 'center'))
+
+    cmds.text(label='   Seed:', align='center')
+    seed_field = cmds.intField(value=0, width=50)
+
+    cmds.text(label='Frequency:', align='center')
+    frequency_field = cmds.floatField(value=0.2, minValue=0.001, step=0.05, pre=3, width=50)
+
+    cmds.setParent('..')  # Go back to the parent layout
+
+    # Checkbox for setting custom frame range
+    set_range_checkbox = cmds.checkBox(label="Set Frame Range", value=False, align='center')
+    
+    # Checkbox for Ease In/Out
+    ease_in_out_checkbox = cmds.checkBox(label="Ease In/Out", value=False, align='center', enable=False)
+
+    # Row layout for start and end frame fields
+    cmds.rowLayout(numberOfColumns=6, columnAlign=(4, 'center'))
+
+    cmds.text(label='   Start:', align='center')
+    start_frame_field = cmds.intField(value=1, width=30, enable=False)
+
+    cmds.text(label='End:', align='center')
+    end_frame_field = cmds.intField(value=100, width=30, enable=False)
+    
+    cmds.text(label='Ease:', align='center')
+    ease_frame_field = cmds.intField(value=20, width=30, enable=False)
+
+    cmds.setParent('..')  # Go back to the parent layout
+
+    # Row layout for the key reduction tolerance
+    cmds.rowLayout(numberOfColumns=3, columnAlign=(1, 'center'))
+
+    reduce_keys_checkbox = cmds.checkBox(label="Reduce Keys", value=False, align='center')
+    cmds.text(label='  Tolerance:', align='center')
+    key_tolerance_field = cmds.floatField(value=0.05, minValue=0.0001, step=0.01, pre=4, width=60, enable=False)
+
+    cmds.setParent('..')  # Go back to the parent layout
+
+    # Function to toggle frame fields and ease in/out checkbox
+    def toggle_frame_fields(*args):
+        is_checked = cmds.checkBox(set_range_checkbox, query=True, value=True)
+        cmds.intField(start_frame_field, edit=True, enable=is_checked)
+        cmds.intField(end_frame_field, edit=True, enable=is_checked) 
+        cmds.checkBox(ease_in_out_checkbox, edit=True, enable=is_checked)
+    
+    def toggle_ease_field(*args):
+        is_checked = cmds.checkBox(ease_in_out_checkbox, query=True, value=True)
+        cmds.intField(ease_frame_field, edit=True, enable=is_checked)
+
+    def toggle_tolerance_field(*args):
+        is_checked = cmds.checkBox(reduce_keys_checkbox, query=True, value=True)
+        cmds.floatField(key_tolerance_field, edit=True, enable=is_checked)
+
+    # Connect checkbox state to enable/disable the frame fields and ease in/out checkbox
+    cmds.checkBox(set_range_checkbox, edit=True, changeCommand=toggle_frame_fields)
+    cmds.checkBox(ease_in_out_checkbox, edit=True, changeCommand=toggle_ease_field)
+    cmds.checkBox(reduce_keys_checkbox, edit=True, changeCommand=toggle_tolerance_field)
+
+    def on_apply_noise(*args):
+        rotation_noise_x = cmds.floatField(rotation_noise_x_field, query=True, value=True)
+        rotation_noise_y = cmds.floatField(rotation_noise_y_field, query=True, value=True)
+        rotation_noise_z = cmds.floatField(rotation_noise_z_field, query=True, value=True)
+        bake_steps = cmds.intField(bake_steps_field, query=True, value=True)
+        use_custom_range = cmds.checkBox(set_range_checkbox, query=True, value=True)
+        start_frame = cmds.intField(start_frame_field, query=True, value=True)
+        end_frame = cmds.intField(end_frame_field, query=True, value=True)
+        ease_in_out = cmds.checkBox(ease_in_out_checkbox, query=True, value=True)
+        ease_value = cmds.intField(ease_frame_field, query=True, value=True)  # Get the ease value
+        seed = cmds.intField(seed_field, query=True, value=True)
+        frequency = cmds.floatField(frequency_field, query=True, value=True)
+        key_tolerance = 0.0
+        if cmds.checkBox(reduce_keys_checkbox, query=True, value=True):
+            key_tolerance = cmds.floatField(key_tolerance_field, query=True, value=True)  # Angular tolerance in degrees
+        
+        # Long bakes run in the background with a progress window, the viewport stays usable
+        bake_noise_on_selected_objects(rotation_noise_x, rotation_noise_y, rotation_noise_z, bake_steps, use_custom_range, start_frame, end_frame, ease_in_out, ease_value, seed=seed, frequency=frequency, key_tolerance=key_tolerance, background=True)
+
+    def on_live_noise(*args):
+        selection = cmds.ls(selection=True)
+        if not selection:
+            cmds.warning("Please select one or more objects.")
+            return
+
+        enable_live_noise(selection,
+                          cmds.floatField(rotation_noise_x_field, query=True, value=True),
+                          cmds.floatField(rotation_noise_y_field, query=True, value=True),
+                          cmds.floatField(rotation_noise_z_field, query=True, value=True),
+                          cmds.checkBox(set_range_checkbox, query=True, value=True),
+                          cmds.intField(start_frame_field, query=True, value=True),
+                          cmds.intField(end_frame_field, query=True, value=True),
+                          cmds.checkBox(ease_in_out_checkbox, query=True, value=True),
+                          cmds.intField(ease_frame_field, query=True, value=True),
+                          seed=cmds.intField(seed_field, query=True, value=True),
+                          frequency=cmds.floatField(frequency_field, query=True, value=True))
+
+    def on_bake_live_noise(*args):
+        key_tolerance = 0.0
+        if cmds.checkBox(reduce_keys_checkbox, query=True, value=True):
+            key_tolerance = cmds.floatField(key_tolerance_field, query=True, value=True)
+        bake_live_noise(cmds.ls(selection=True), cmds.intField(bake_steps_field, query=True, value=True), key_tolerance, background=True)
+
+    cmds.button(label="Apply Noise", command=on_apply_noise)
+
+    # Live noise is evaluated by a node on the shake control, tweak it in the channel box and bake it once it is final
+    cmds.rowLayout(numberOfColumns=2, columnAlign=(1, 'center'))
+    cmds.button(label="Live Noise", command=on_live_noise, width=190)
+    cmds.button(label="Bake Live Noise", command=on_bake_live_noise, width=190)
+    cmds.setParent('..')  # Go back to the parent layout
+
+    cmds.showWindow("noiseWindow")
+
+class CameraListPanel(object):
+    # Fixed pool of camera rows; rows are rebound in place instead of rebuilding the window
+
+    def __init__(self, page_size=CAMERA_LIST_PAGE_SIZE):
+        self.page_size = page_size
+        self.page = 0
+        self.rows = []  # (row layout, label, eye button) per row
+        self.bound = [None] * page_size  # rig shown in each row
+        self.visibility = [None] * page_size  # eye state shown in each row
+        self.visibility_callbacks = []
+        self.refresh_pending = False
+        self.registry = registry.get_registry()
+
+        cmds.columnLayout(adjustableColumn=True)
+
+        # Page navigation
+        cmds.rowLayout(numberOfColumns=4, mar=3)
+        cmds.text(label='                  ')
+        cmds.button(label='<', width=20, command=lambda _: self.show_page(self.page - 1))
+        self.page_label = cmds.text(label='', width=70, align='center')
+        cmds.button(label='>', width=20, command=lambda _: self.show_page(self.page + 1))
+        cmds.setParent('..')  # Go back to the column layout
+
+        for index in range(page_size):
+            # Create a row layout for each camera with Select and Toggle Visibility buttons
+            row = cmds.rowLayout(numberOfColumns=5, mar=3, manage=False)
+            cmds.text(label='                  ')
+            label = cmds.text(label='')
+            cmds.text(label='   ')
+            cmds.button(label='Select', command=lambda _, index=index: self.select_row(index))
+
+            # Create an icon button for toggling visibility
+            button = cmds.iconTextButton(style='iconOnly', image='eye.png')
+            cmds.iconTextButton(button, edit=True, command=lambda *args, index=index: self.toggle_row(index))
+
+            cmds.setParent('..')  # Go back to the column layout
+            self.rows.append((row, label, button))
+
+        self.registry.add_listener(self.schedule_refresh)
+        self.show_page(0)
+
+    def page_count(self):
+        return max(1, (len(self.registry.all_rigs()) + self.page_size - 1) // self.page_size)
+
+    def show_page(self, page):
+        self.page = min(max(page, 0), self.page_count() - 1)
+        self.refresh()
+
+    def refresh(self):
+        # Rebind only the rows whose rig or visibility changed
+        self.refresh_pending = False
+        if not cmds.text(self.page_label, exists=True):
+            self.close()
+            return
+
+        self.page = min(self.page, self.page_count() - 1)
+        cmds.text(self.page_label, edit=True, label=f'{self.page + 1} / {self.page_count()}')
+
+        rigs = self.registry.all_rigs()
+        profiling.note(objects=len(rigs))
+        first = self.page * self.page_size
+        for index, (row, label, button) in enumerate(self.rows):
+            rig = rigs[first + index] if first + index < len(rigs) else None
+            if rig != self.bound[index]:
+                if rig is None:
+                    cmds.rowLayout(row, edit=True, manage=False)
+                else:
+                    cmds.text(label, edit=True, label=rig)
+                    if self.bound[index] is None:
+                        cmds.rowLayout(row, edit=True, manage=True)
+                self.bound[index] = rig
+                self.visibility[index] = None
+            if rig is not None:
+                self.update_row_visibility(index)
+
+        self.watch_visibility()
+
+    def schedule_refresh(self):
+        # Coalesce bursts of registry changes into one refresh once Maya is idle
+        if not self.refresh_pending:
+            self.refresh_pending = True
+            maya.utils.executeDeferred(self.refresh)
+
+    def update_row_visibility(self, index):
+        node = get_node(self.bound[index] + '_Main')
+        visible = node is not None and om.MFnDependencyNode(node).findPlug('visibility', False).asBool()
+        if visible != self.visibility[index]:
+            cmds.iconTextButton(self.rows[index][2], edit=True, image='eye.png' if visible else 'eyeHide.png')
+            self.visibility[index] = visible
+
+    def watch_visibility(self):
+        # Follow visibility edits made anywhere in Maya for the rows on screen
+        self.remove_visibility_callbacks()
+        for index, rig in enumerate(self.bound):
+            node = get_node(rig + '_Main') if rig is not None else None
+            if node is not None:
+                self.visibility_callbacks.append(om.MNodeMessage.addAttributeChangedCallback(node, self.on_attribute_changed, index))
+
+    def on_attribute_changed(self, message, plug, other_plug, index):
+        if message & om.MNodeMessage.kAttributeSet and plug.partialName(useLongNames=True) == 'visibility':
+            maya.utils.executeDeferred(lambda: self.bound[index] is not None and self.update_row_visibility(index))
+
+    def select_row(self, index):
+        if self.bound[index] is not None:
+            select_main_object(self.bound[index] + '_Main')
+
+    def toggle_row(self, index):
+        if self.bound[index] is not None:
+            toggle_visibility(self.bound[index] + '_Main', self.rows[index][2])
+
+    def remove_visibility_callbacks(self):
+        if self.visibility_callbacks:
+            om.MMessage.removeCallbacks(self.visibility_callbacks)
+        self.visibility_callbacks = []
+
+    def close(self):
+        self.remove_visibility_callbacks()
+        self.registry.remove_listener(self.schedule_refresh)
+
+@profiling.profiled
+def show_camera_ui():
+    global button_id  # Make the button ID global
+    global camera_list_panel
+
+    # Check if the window already exists
+    if cmds.window("cameraUI", exists=True):
+        cmds.deleteUI("cameraUI")
+    if camera_list_panel is not None:
+        camera_list_panel.close()
+
+    # Create a new window
+    window = cmds.window("cameraUI", title="Camera Tools", widthHeight=(200, 300))
+
+    # Create a row layout for the left and right columns
+    cmds.rowLayout(numberOfColumns=2, adjustableColumn=2)
+
+    # Left column
+    cmds.columnLayout(adjustableColumn=True)
+
+    cmds.rowLayout(numberOfColumns=8, mar=5, cal=[1, 'left'])
+    cmds.text(l="      ")  # Spacer
+    button_id = cmds.button(label="    ", command=show_color_editor, backgroundColor=[1, 0, 0])
+    cmds.text(l="  ")  # Spacer
+    cmds.button(width=100, label="Create Camera", command=lambda x: create_camera(cmds.textField(scale_text_field, query=True, text=True), cmds.checkBox("createFromPerspCheckBox", query=True, value=True), selected_color))
+    cmds.text(label="  Scale:")
+    cmds.text(l=" ")  # Spacer
+    scale_text_field = cmds.textField("scaleTextField", w=30, tx='20')
+
+    cmds.setParent('..')  # End of row layout
+
+    cmds.rowLayout(numberOfColumns=5, mar=5, cal=[1, 'left'])
+    cmds.text(l="      ")  # Spacer
+    cmds.checkBox("createFromPerspCheckBox", label="Create from Persp")
+    cmds.text(l="       ")  # Spacer
+    cmds.button(label="Lens Pack", command=lambda x: lens_pack(), width=80, height=30)
+    cmds.setParent('..')  # End of row layout
+    
+    cmds.rowLayout(numberOfColumns=4, cal=[1, 'left'])
+    cmds.text(l="       ")  # Spacer
+    cmds.button(label="Shoulder Noise", command=lambda x: create_noise_window(), width=80, height=30)
+    cmds.text(l="                 ")  # Spacer
+    cmds.button(label="Add Aim", command=lambda x: set_camera_aim(), width=80, height=30)
+    cmds.setParent('..')  # Go back to the row layout
+
+    cmds.rowLayout(numberOfColumns=2, cal=[1, 'left'])
+    cmds.text(l="       ")  # Spacer
+    cmds.button(label="Smooth Motion", command=lambda x: create_smoothing_window(), width=80, height=30)
+    cmds.setParent('..')  # Go back to the row layout
+    
+
+    cmds.setParent('..')  # Go back to the row layout
+
+    # Right column, a page of camera rigs kept up to date by the registry
+    camera_list_panel = CameraListPanel()
+
+    cmds.setParent('..')  # Go back to the row layout
+    cmds.scriptJob(uiDeleted=[window, camera_list_panel.close])
+    cmds.showWindow(window)
@@ -0,0 +1,76 @@
+import sys
+import types
+
+import maya.cmds as cmds
+from maya.api import OpenMaya as om
+
+
+COMMAND_NAME = 'cameraToolsApplyModifier'
+
+# Maya loads plugin files as a separate module, so the queue of modifiers
+# waiting to be handed to the undo command lives in a shared module
+_shared = sys.modules.setdefault('camera_tools_undo_shared', types.ModuleType('camera_tools_undo_shared'))
+if not hasattr(_shared, 'pending'):
+    _shared.pending = []
+
+def maya_useNewAPI():
+    pass
+
+class ApplyModifierCommand(om.MPxCommand):
+    # Holds an already applied modifier so Maya can undo and redo it as one step
+
+    def __init__(self):
+        om.MPxCommand.__init__(self)
+        self.modifier = None
+
+    def doIt(self, args):
+        self.modifier = _shared.pending.pop()
+
+    def redoIt(self):
+        self.modifier.doIt()
+
+    def undoIt(self):
+        self.modifier.undoIt()
+
+    def isUndoable(self):
+        return True
+
+def initializePlugin(plugin):
+    om.MFnPlugin(plugin).registerCommand(COMMAND_NAME, ApplyModifierCommand)
+
+def uninitializePlugin(plugin):
+    om.MFnPlugin(plugin).deregisterCommand(COMMAND_NAME)
+
+class AppliedEdits(object):
+    # Modifiers and anim curve changes that already ran, redone and undone as one
+
+    def __init__(self, edits):
+        self.edits = edits
+
+    def doIt(self):
+        for edit in self.edits:
+            if isinstance(edit, om.MDGModifier):
+                edit.doIt()
+            else:
+                edit.redoIt()
+
+    def undoIt(self):
+        for edit in reversed(self.edits):
+            edit.undoIt()
+
+def record(step):
+    if not cmds.pluginInfo(__file__, query=True, loaded=True):
+        cmds.loadPlugin(__file__, quiet=True)
+
+    _shared.pending.append(step)
+    getattr(cmds, COMMAND_NAME)()
+
+def apply_modifier(modifier):
+    # Run the modifier and record it on Maya's undo queue as a single step
+    modifier.doIt()
+    record(modifier)
+
+def record_applied(*edits):
+    # Record modifiers and MAnimCurveChanges that were already applied, e.g. over several
+    # idle events, on Maya's undo queue as a single step
+    record(AppliedEdits(edits))
@@ -0,0 +1,18 @@
+# Runs the tests on the stand-in Maya from benchmarks/fake_maya
+import os
+import sys
+
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.dirname(TESTS_DIR), os.path.join(os.path.dirname(TESTS_DIR), 'benchmarks')]
+
+import fake_maya
+
+scene, recorder = fake_maya.install()
+
+@pytest.fixture
+def new_scene():
+    import maya.cmds as cmds
+    cmds.file(new=True, force=True)
+    return scene
@@ -0,0 +1,35 @@
+import numpy as np
+
+from camera_tools.coverage import cull_spheres
+
+
+# 35mm lens on a 1.417 x 0.945 inch back, clipping from 0.1 to 1000
+LENS = [35.0, 1.417, 0.945, 0.1, 1000.0]
+
+CENTERS = np.array([
+    [0.0, 0.0, -10.0],  # straight ahead
+    [0.0, 0.0, 10.0],  # behind the camera
+    [20.0, 0.0, -10.0],  # far off to the side
+    [5.5, 0.0, -10.0],  # past the side plane by less than its radius
+    [0.0, 0.0, -1002.0],  # beyond the far plane
+    [0.0, 0.0, -1000.5],  # across the far plane
+])
+RADII = np.ones(len(CENTERS))
+
+def test_cull_spheres_tests_every_frustum_plane():
+    visible = cull_spheres(np.eye(4)[None], np.array([LENS]), CENTERS, RADII)
+    assert visible.shape == (1, len(CENTERS))
+    assert visible[0].tolist() == [True, False, False, True, False, True]
+
+def test_cull_spheres_follows_the_camera_on_every_frame():
+    # Second frame the camera is scaled, moved back along Z and turned around to look down +Z
+    turned = np.diag([-2.0, 2.0, -2.0, 1.0])
+    turned[3, :3] = [0.0, 0.0, -20.0]
+    visible = cull_spheres(np.stack([np.eye(4), turned]), np.array([LENS, LENS]), CENTERS[:2], RADII[:2])
+    assert visible.tolist() == [[True, False], [True, True]]
+
+def test_cull_spheres_uses_the_focal_length_of_every_frame():
+    centers = np.array([[3.0, 0.0, -10.0]])
+    lenses = np.array([LENS, [200.0] + LENS[1:]])
+    visible = cull_spheres(np.stack([np.eye(4)] * 2), lenses, centers, np.array([0.5]))
+    assert visible[:, 0].tolist() == [True, False]
@@ -0,0 +1,35 @@
+import numpy as np
+
+from camera_tools.curves import evaluate_spline_keys, reduce_keys
+
+
+def noisy_signal(count=200, seed=1):
+    times = np.arange(1, count + 1, dtype=float)
+    values = np.sin(times * 0.15) * 3 + np.random.default_rng(seed).normal(0, 0.2, count)
+    return times, values
+
+def test_reduce_keys_stays_within_tolerance():
+    times, values = noisy_signal()
+    for tolerance in (0.01, 0.1, 0.5):
+        kept = reduce_keys(times, values, tolerance)
+        error = np.abs(evaluate_spline_keys(times[kept], values[kept], times) - values)
+        assert error.max() <= tolerance
+        assert len(kept) < len(times)
+
+def test_reduce_keys_keeps_the_end_keys():
+    times, values = noisy_signal()
+    kept = reduce_keys(times, values, 10.0)
+    assert kept[0] == 0 and kept[-1] == len(times) - 1
+    assert list(kept) == sorted(set(kept))
+
+def test_reduce_keys_drops_keys_on_a_straight_line():
+    times = np.arange(1, 51, dtype=float)
+    assert list(reduce_keys(times, times * 0.5 + 2, 1e-9)) == [0, 49]
+
+def test_reduce_keys_keeps_every_key_without_tolerance():
+    times, values = noisy_signal(30)
+    assert len(reduce_keys(times, values, 0.0)) == 30
+
+def test_reduce_keys_keeps_short_curves():
+    assert list(reduce_keys([1.0, 2.0], [0.0, 5.0], 1.0)) == [0, 1]
+    assert list(reduce_keys([1.0], [3.0], 1.0)) == [0]
@@ -0,0 +1,54 @@
+import maya.cmds as cmds
+from maya.api import OpenMaya as om
+import numpy as np
+import pytest
+
+from camera_tools import layout, rig
+
+
+def test_encode_keys_round_trips_curves():
+    curves = [
+        {'times': np.array([1.0, 2.0, 3.0, 10.0]), 'values': np.array([0.5, -1.25, 3.0, 1e6]),
+         'in_tangents': np.array([0, 1, 2, 3]), 'out_tangents': np.array([3, 2, 1, 0])},
+        {'times': np.array([-5.0]), 'values': np.array([2.0]), 'in_tangents': np.array([1]), 'out_tangents': np.array([1])},
+        {'times': np.zeros(0), 'values': np.zeros(0), 'in_tangents': np.zeros(0, int), 'out_tangents': np.zeros(0, int)},
+    ]
+    decoded = layout.decode_keys(layout.encode_keys(curves), [len(curve['times']) for curve in curves])
+    assert len(decoded) == len(curves)
+    for curve, result in zip(curves, decoded):
+        for key in ('times', 'values', 'in_tangents', 'out_tangents'):
+            np.testing.assert_array_equal(result[key], curve[key])
+
+@pytest.fixture
+def film_rate():
+    om.MTime.setUIUnit(om.MTime.kFilm)
+    yield
+    om.MTime.setUIUnit(om.MTime.kFilm)
+
+def test_import_moves_keys_to_the_scene_frame_rate(new_scene, film_rate, tmp_path):
+    camera_name = rig.create_cameras([{'number': 10}])[0]
+    cmds.setKeyframe(f'{camera_name}_Main', attribute='translateX', time=1, value=0)
+    cmds.setKeyframe(f'{camera_name}_Main', attribute='translateX', time=24, value=5)
+    path = str(tmp_path / 'layout.camlayout')
+    layout.export_camera_layout(path, [camera_name])
+
+    # The same keys at 24 fps land one second apart at 25 fps
+    cmds.file(new=True, force=True)
+    om.MTime.setUIUnit(om.MTime.kPALFrame)
+    assert layout.import_camera_layout(path) == [camera_name]
+    times = cmds.keyframe(f'{camera_name}_Main.translateX', query=True, timeChange=True)
+    values = cmds.keyframe(f'{camera_name}_Main.translateX', query=True, valueChange=True)
+    assert times == pytest.approx([25.0 / 24.0, 25.0])
+    assert values == pytest.approx([0.0, 5.0])
+
+def test_import_keeps_keys_at_the_same_frame_rate(new_scene, film_rate, tmp_path):
+    camera_name = rig.create_cameras([{'number': 10}])[0]
+    cmds.setKeyframe(f'{camera_name}_Main', attribute='rotateY', time=3, value=45)
+    cmds.setKeyframe(f'{camera_name}_Main', attribute='rotateY', time=17, value=-90)
+    path = str(tmp_path / 'layout.camlayout')
+    layout.export_camera_layout(path, [camera_name])
+
+    cmds.file(new=True, force=True)
+    layout.import_camera_layout(path)
+    assert cmds.keyframe(f'{camera_name}_Main.rotateY', query=True, timeChange=True) == pytest.approx([3.0, 17.0])
+    assert cmds.keyframe(f'{camera_name}_Main.rotateY', query=True, valueChange=True) == pytest.approx([45.0, -90.0])
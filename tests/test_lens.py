@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from camera_tools.lens import MAX_FOCAL_LENGTH, MIN_FOCAL_LENGTH, dolly_zoom_focal_lengths, subject_depths
+
+
+def test_dolly_zoom_focal_length_follows_the_subject_depth():
+    depths = np.array([100.0, 50.0, 25.0, 200.0])
+    focal_lengths = dolly_zoom_focal_lengths(depths, 100.0, 35.0)
+    assert focal_lengths == pytest.approx([35.0, 17.5, 8.75, 70.0])
+    # The subject keeps its size on the filmback
+    assert focal_lengths / depths == pytest.approx(np.full(4, 0.35))
+
+def test_dolly_zoom_focal_length_is_clipped_to_the_lens_range():
+    depths = np.array([-10.0, 0.0, 1.0, 1e9])
+    focal_lengths = dolly_zoom_focal_lengths(depths, 100.0, 35.0)
+    assert focal_lengths.tolist() == [MIN_FOCAL_LENGTH, MIN_FOCAL_LENGTH, MIN_FOCAL_LENGTH, MAX_FOCAL_LENGTH]
+
+def test_subject_depths_measure_along_the_view_axis():
+    # A scaled camera at Z 10 looking down -Z, then moved to X 5 and turned to look down +X
+    matrices = np.stack([np.diag([3.0, 3.0, 3.0, 1.0]), np.eye(4)])
+    matrices[0, 3, :3] = [0.0, 0.0, 10.0]
+    matrices[1, :3, :3] = [[0.0, 0.0, 1.0], [0.0, 1.0, 0.0], [-1.0, 0.0, 0.0]]
+    matrices[1, 3, :3] = [5.0, 0.0, 0.0]
+    subjects = np.array([[4.0, 2.0, -30.0], [25.0, 7.0, 3.0]])
+    assert subject_depths(matrices, subjects) == pytest.approx([40.0, 20.0])
@@ -0,0 +1,47 @@
+import maya.cmds as cmds
+import numpy as np
+import pytest
+
+from camera_tools import noise
+
+
+ROTATIONS = {'rotateX': (10.0, -35.0), 'rotateY': (0.0, 90.0), 'rotateZ': (5.0, 5.0)}
+
+def animated_transform():
+    node = cmds.createNode('transform', name='shaken')
+    for attribute, (first, last) in ROTATIONS.items():
+        cmds.setKeyframe(f'{node}.{attribute}', time=1, value=first)
+        cmds.setKeyframe(f'{node}.{attribute}', time=30, value=last)
+    return node
+
+def read_keys(node, attribute):
+    return (cmds.keyframe(f'{node}.{attribute}', query=True, timeChange=True),
+            np.array(cmds.keyframe(f'{node}.{attribute}', query=True, valueChange=True)))
+
+@pytest.mark.parametrize('bake_steps', [1, 4])
+def test_bulk_bake_matches_per_frame_bake(new_scene, bake_steps):
+    # Without noise both engines key the rotation the objects already had on every sampled frame
+    bulk, per_frame = animated_transform(), animated_transform()
+    noise.bake_noise_on_objects([bulk], 0, 0, 0, bake_steps, True, 1, 30, False, 0)
+    noise.bake_noise_on_objects([per_frame], 0, 0, 0, bake_steps, True, 1, 30, False, 0, per_frame=True)
+    for attribute in ROTATIONS:
+        bulk_times, bulk_values = read_keys(bulk, attribute)
+        per_frame_times, per_frame_values = read_keys(per_frame, attribute)
+        # The last original key stays when the steps skip it
+        assert bulk_times == per_frame_times == sorted(set(range(1, 31, bake_steps)) | {30})
+        np.testing.assert_allclose(bulk_values, per_frame_values, atol=1e-6)
+
+def test_bulk_bake_adds_the_noise_signal_to_the_rotation(new_scene):
+    node, reference = animated_transform(), animated_transform()
+    offset = noise.get_noise_frame_offset(node)
+    noise.bake_noise_on_objects([node], 1, 2, 3, 1, True, 1, 30, False, 0, seed=7)
+    noise.bake_noise_on_objects([reference], 0, 0, 0, 1, True, 1, 30, False, 0)
+
+    frames = noise.get_bake_frames(1, 30, 1)
+    envelope = noise.build_noise_envelope(frames, 1, 30, False, 0)
+    intensities = [intensity * noise.NOISE_SCALE for intensity in (1, 2, 3)]
+    signals = noise.build_noise_signals(intensities, envelope, [offset], 7, 0.2, 3, 1, 30, 1)[0]
+    for attribute, signal in zip(noise.ROTATE_CHANNELS, signals):
+        values = read_keys(node, attribute)[1] - read_keys(reference, attribute)[1]
+        assert np.abs(values).max() > 0
+        np.testing.assert_allclose(values, signal, atol=1e-6)
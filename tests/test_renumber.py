@@ -0,0 +1,57 @@
+import maya.cmds as cmds
+
+from camera_tools import renumber, rig
+from camera_tools.nodes import get_node
+
+
+def apply_steps(numbers, steps):
+    # Numbers in use after every step, failing when a step lands on a number still in use
+    numbers = set(numbers)
+    for old, new in steps:
+        assert old in numbers and new not in numbers
+        numbers.remove(old)
+        numbers.add(new)
+    return numbers
+
+def test_plan_renumber_orders_a_chain_from_its_free_end():
+    steps = renumber.plan_renumber({10: 20, 20: 30, 30: 40})
+    assert steps == [(30, 40), (20, 30), (10, 20)]
+
+def test_plan_renumber_breaks_a_cycle_through_a_spare_number():
+    steps = renumber.plan_renumber({10: 20, 20: 10})
+    assert apply_steps({10, 20}, steps) == {10, 20}
+    assert (10, 21) in steps or (20, 21) in steps
+
+def test_plan_renumber_keeps_the_spare_number_clear_of_taken_ones():
+    steps = renumber.plan_renumber({10: 20, 20: 30, 30: 10}, taken={50})
+    assert apply_steps({10, 20, 30, 50}, steps) == {10, 20, 30, 50}
+
+def test_plan_renumber_skips_rigs_that_keep_their_number():
+    assert renumber.plan_renumber({10: 10, 20: 20}) == []
+
+def test_plan_renumber_rejects_clashes():
+    assert renumber.plan_renumber({10: 30, 20: 30}) is None
+    assert renumber.plan_renumber({10: 20}, taken={20}) is None
+
+def label_children(camera_name):
+    return sorted(cmds.listRelatives(f'{camera_name}_Text_GRP', children=True) or [])
+
+def test_resequence_rebuilds_only_changed_label_characters(new_scene):
+    rig.create_cameras([{'number': 10}, {'number': 40}])
+    old_characters = {name: get_node(name) for name in label_children('CAM_010')}
+
+    assert renumber.resequence_cameras() == {'CAM_040': 'CAM_020'}
+    assert label_children('CAM_020') == [f'CAM_020_Text_{index}' for index in range(7)]
+    assert label_children('CAM_010') == sorted(old_characters)
+
+def test_resequence_rebuilds_legacy_labels(new_scene):
+    # Rigs from older versions have a textCurves label with Char_* groups
+    rig.create_cameras([{'number': 30}])
+    cmds.delete(label_children('CAM_030'))
+    text_group = cmds.textCurves(ch=False, f="Arial", t='CAM_030')[0]
+    cmds.parent(cmds.listRelatives(text_group, children=True), 'CAM_030_Text_GRP')
+    cmds.delete(text_group)
+
+    assert renumber.resequence_cameras() == {'CAM_030': 'CAM_010'}
+    assert label_children('CAM_010') == [f'CAM_010_Text_{index}' for index in range(7)]
+    assert not cmds.ls('Char_*')
@@ -0,0 +1,84 @@
+import maya.cmds as cmds
+import numpy as np
+import pytest
+
+from camera_tools import smoothing
+
+
+FRAMES = np.arange(120, dtype=float)
+
+def noisy_line(seed=3):
+    line = FRAMES * 0.5 - 4.0
+    return line, line + np.random.default_rng(seed).normal(0.0, 1.0, len(FRAMES))
+
+@pytest.mark.parametrize('method', smoothing.SMOOTHING_METHODS)
+def test_filters_keep_a_straight_line(method):
+    line, _ = noisy_line()
+    filtered = smoothing.filter_rows(line[None], method, 5.0, 3)
+    assert filtered.shape == (1, len(FRAMES))
+    np.testing.assert_allclose(filtered[0], line, atol=1e-3)
+
+@pytest.mark.parametrize('method', smoothing.SMOOTHING_METHODS)
+def test_filters_remove_noise_from_every_row(method):
+    line, noisy = noisy_line()
+    _, other = noisy_line(seed=4)
+    filtered = smoothing.filter_rows(np.stack([noisy, other]), method, 9.0, 2)
+    for row in filtered:
+        assert np.std(row - line) < 0.6 * np.std(noisy - line)
+
+def test_savgol_filter_keeps_polynomials_up_to_its_order():
+    cubic = (FRAMES / 40.0) ** 3 - FRAMES / 10.0
+    # Away from the ends, the odd reflection padding only keeps the slope there
+    np.testing.assert_allclose(smoothing.savgol_filter(cubic[None], 9, 3)[0][4:-4], cubic[4:-4], atol=1e-9)
+
+def test_lowpass_filter_keeps_slow_motion_and_removes_fast_motion():
+    slow = np.sin(FRAMES * 2 * np.pi / 60.0)
+    fast = np.sin(FRAMES * 2 * np.pi / 3.0)
+    filtered = smoothing.lowpass_filter((slow + fast)[None], 1.0 / 10.0)[0]
+    np.testing.assert_allclose(filtered[10:-10], slow[10:-10], atol=0.05)
+
+def key_animation(attribute, times, values):
+    node = cmds.createNode('transform', name='smoothed')
+    for time, value in zip(times, values):
+        cmds.setKeyframe(f'{node}.{attribute}', time=time, value=value)
+    return node
+
+def read_keys(node, attribute):
+    return (np.array(cmds.keyframe(f'{node}.{attribute}', query=True, timeChange=True)),
+            np.array(cmds.keyframe(f'{node}.{attribute}', query=True, valueChange=True)))
+
+def test_smoothing_unwraps_rotation_flips(new_scene):
+    # A steady turn through 180 degrees keyed as a flip to -180
+    turn = np.linspace(150.0, 210.0, 31)
+    node = key_animation('rotateY', np.arange(1, 32), (turn + 180.0) % 360.0 - 180.0)
+    assert smoothing.smooth_animation([node], 'gaussian', 2.0) == 1
+    np.testing.assert_allclose(read_keys(node, 'rotateY')[1], turn, atol=1e-6)
+
+def test_smoothing_without_unwrap_smooths_the_flip(new_scene):
+    turn = np.linspace(150.0, 210.0, 31)
+    node = key_animation('rotateY', np.arange(1, 32), (turn + 180.0) % 360.0 - 180.0)
+    smoothing.smooth_animation([node], 'gaussian', 2.0, unwrap=False)
+    assert np.abs(read_keys(node, 'rotateY')[1][15]) < 150.0
+
+def test_smoothing_leaves_curves_shorter_than_the_filter(new_scene):
+    values = [0.0, 4.0, -2.0, 7.0]
+    node = key_animation('translateX', [1, 2, 3, 4], values)
+    assert smoothing.smooth_animation([node], 'savgol', 9.0) == 0
+    np.testing.assert_allclose(read_keys(node, 'translateX')[1], values)
+
+def test_smoothing_keeps_unevenly_keyed_ramps(new_scene):
+    times = np.array([1.0, 2.0, 3.0, 5.0, 8.0, 13.0, 21.0, 34.0])
+    node = key_animation('translateZ', times, times * 2.0)
+    assert smoothing.smooth_animation([node], 'gaussian', 3.0) == 1
+    key_times, values = read_keys(node, 'translateZ')
+    np.testing.assert_allclose(key_times, times)
+    np.testing.assert_allclose(values, times * 2.0, atol=1e-6)
+
+def test_smoothing_keeps_keys_outside_the_frame_range(new_scene):
+    _, noisy = noisy_line()
+    node = key_animation('translateY', FRAMES + 1, noisy)
+    smoothing.smooth_animation([node], 'gaussian', 3.0, start_frame=30, end_frame=60)
+    times, values = read_keys(node, 'translateY')
+    outside = (times < 30) | (times > 60)
+    np.testing.assert_allclose(values[outside], noisy[outside])
+    assert not np.allclose(values[~outside], noisy[~outside])
@@ -0,0 +1,34 @@
+import math
+
+import numpy as np
+
+from camera_tools.trajectory import changed_range
+
+
+TIMES = np.arange(1.0, 21.0)
+VALUES = TIMES * 2.0
+
+def test_changed_range_covers_two_keys_around_a_value_edit():
+    values = VALUES.copy()
+    values[9] += 1.0
+    assert changed_range(TIMES, VALUES, TIMES, values) == (8.0, 12.0)
+
+def test_changed_range_covers_an_inserted_key():
+    times = np.insert(TIMES, 10, 10.5)
+    values = np.insert(VALUES, 10, 0.0)
+    assert changed_range(TIMES, VALUES, times, values) == (9.0, 12.0)
+
+def test_changed_range_covers_a_removed_key():
+    times = np.delete(TIMES, 14)
+    values = np.delete(VALUES, 14)
+    assert changed_range(TIMES, VALUES, times, values) == (13.0, 17.0)
+
+def test_changed_range_is_open_at_the_curve_ends():
+    values = VALUES.copy()
+    values[[0, -1]] = -1.0
+    assert changed_range(TIMES, VALUES, TIMES, values) == (-math.inf, math.inf)
+    start, end = changed_range(TIMES, VALUES, TIMES[1:], VALUES[1:])
+    assert start == -math.inf and end == 3.0
+
+def test_changed_range_spans_the_whole_curve_without_key_changes():
+    assert changed_range(TIMES, VALUES, TIMES, VALUES.copy()) == (-math.inf, math.inf)